@@ -0,0 +1,2 @@
+from . import all as _all
+from . import py2, py3, py27, py36, py37, py38, py39, py310, py311, py312
@@ -0,0 +1,35 @@
+# Licensed under the GPL: https://www.gnu.org/licenses/old-licenses/gpl-2.0.html
+# For details: https://github.com/pylint-dev/pylint/blob/main/LICENSE
+# Copyright (c) https://github.com/pylint-dev/pylint/blob/main/CONTRIBUTORS.txt
+
+"""Functional/non regression tests for pylint."""
+
+__all__ = [
+    "_get_tests_info",
+    "_tokenize_str",
+    "CheckerTestCase",
+    "FunctionalTestFile",
+    "linter",
+    "LintModuleTest",
+    "MessageTest",
+    "MinimalTestReporter",
+    "set_config",
+    "GenericTestReporter",
+    "UPDATE_FILE",
+    "UPDATE_OPTION",
+    "UnittestLinter",
+    "create_files",
+]
+
+from pylint.testutils.checker_test_case import CheckerTestCase
+from pylint.testutils.constants import UPDATE_FILE, UPDATE_OPTION
+from pylint.testutils.decorator import set_config
+from pylint.testutils.functional import FunctionalTestFile
+from pylint.testutils.get_test_info import _get_tests_info
+from pylint.testutils.global_test_linter import linter
+from pylint.testutils.lint_module_test import LintModuleTest
+from pylint.testutils.output_line import MessageTest
+from pylint.testutils.reporter_for_tests import GenericTestReporter, MinimalTestReporter
+from pylint.testutils.tokenize_str import _tokenize_str
+from pylint.testutils.unittest_linter import UnittestLinter
+from pylint.testutils.utils import create_files
@@ -0,0 +1,23 @@
+# Licensed under the GPL: https://www.gnu.org/licenses/old-licenses/gpl-2.0.html
+# For details: https://github.com/pylint-dev/pylint/blob/main/LICENSE
+# Copyright (c) https://github.com/pylint-dev/pylint/blob/main/CONTRIBUTORS.txt
+
+__all__ = [
+    "FunctionalTestFile",
+    "REASONABLY_DISPLAYABLE_VERTICALLY",
+    "get_functional_test_files_from_directory",
+    "NoFileError",
+    "parse_python_version",
+    "LintModuleOutputUpdate",
+]
+
+from pylint.testutils.functional.find_functional_tests import (
+    REASONABLY_DISPLAYABLE_VERTICALLY,
+    get_functional_test_files_from_directory,
+)
+from pylint.testutils.functional.lint_module_output_update import LintModuleOutputUpdate
+from pylint.testutils.functional.test_file import (
+    FunctionalTestFile,
+    NoFileError,
+    parse_python_version,
+)
@@ -0,0 +1,127 @@
+"""Builds vehicles from the recorded payloads in tests/ressources/vehicles without any network access"""
+from typing import Any, Dict, List, Optional
+
+import copy
+import json
+import os
+import sys
+
+from requests import Response, codes
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+ROOT: str = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from weconnect.addressable import AddressableDict, AddressableObject  # noqa: E402 # pylint: disable=wrong-import-position
+from weconnect.elements.vehicle import Vehicle  # noqa: E402 # pylint: disable=wrong-import-position
+from weconnect.weconnect import WeConnect  # noqa: E402 # pylint: disable=wrong-import-position
+
+FIXTURES: str = os.path.join(ROOT, 'tests', 'ressources', 'vehicles')
+
+
+def loadFixtures(model: str = 'ID3') -> Dict[str, Any]:
+    fixtures: Dict[str, Any] = {}
+    for name in ['vehicles', 'selectivestatus', 'parkingposition', 'trip']:
+        with open(os.path.join(FIXTURES, model, f'{name}.json'), 'r', encoding='utf8') as file:
+            fixtures[name] = json.load(file)
+    return fixtures
+
+
+class FixtureWeConnect(AddressableObject):
+    """Stands in for WeConnect and answers fetchData from the recorded payloads"""
+
+    def __init__(self, fixtures: Optional[Dict[str, Any]] = None, lazyDomains: bool = False) -> None:
+        super().__init__(localAddress='', parent=None)
+        self.fixtures: Dict[str, Any] = fixtures or loadFixtures()
+        self.fixAPI: bool = True
+        self.lazyDomains: bool = lazyDomains
+        self.spin = None
+        self.maxAgePictures = None
+        self.budget = None
+        self.cache: Dict[str, Any] = {}
+        self.vehicles: AddressableDict[str, Vehicle] = AddressableDict(localAddress='vehicles', parent=self)
+
+    def fetchData(self, url, force=False, allowEmpty=False, allowHttpError=False, allowedErrors=None) -> Optional[Dict[str, Any]]:
+        del force, allowEmpty, allowHttpError, allowedErrors
+        # Parsers modify the dicts they get (e.g. ParkingPosition), hand out copies like a fresh response would be
+        if '/selectivestatus' in url:
+            return copy.deepcopy(self.fixtures['selectivestatus'])
+        if url.endswith('/parkingposition'):
+            return copy.deepcopy(self.fixtures['parkingposition'])
+        if '/trips/' in url:
+            return copy.deepcopy(self.fixtures['trip'])
+        return copy.deepcopy(self.fixtures['vehicles'])
+
+    def addVehicle(self, index: int) -> Vehicle:
+        vehicleDict: Dict[str, Any] = copy.deepcopy(self.fixtures['vehicles']['data'][0])
+        vin: str = f'{vehicleDict["vin"][:-6]}{index:06d}'
+        vehicleDict['vin'] = vin
+        vehicle: Vehicle = Vehicle(weConnect=self, vin=vin, parent=self.vehicles, fromDict=vehicleDict, fixAPI=self.fixAPI, updatePictures=False,
+                                   lazyDomains=self.lazyDomains)
+        self.vehicles[vin] = vehicle
+        return vehicle
+
+
+def fleetVin(fixtures: Dict[str, Any], index: int) -> str:
+    vin: str = fixtures['vehicles']['data'][0]['vin']
+    return f'{vin[:-6]}{index:06d}'
+
+
+class FixtureAdapter(BaseAdapter):
+    """Transport adapter answering the requests of a WeConnect session from the recorded payloads, for a fleet of numVehicles copies of
+    the recorded vehicle. Responses are encoded once, so only the library itself is measured."""
+
+    def __init__(self, fixtures: Optional[Dict[str, Any]] = None, numVehicles: int = 1) -> None:
+        super().__init__()
+        fixtures = fixtures or loadFixtures()
+        self.fixtures: Dict[str, Any] = fixtures
+        vehicles: List[Dict[str, Any]] = []
+        for index in range(numVehicles):
+            vehicleDict: Dict[str, Any] = copy.deepcopy(fixtures['vehicles']['data'][0])
+            vehicleDict['vin'] = fleetVin(fixtures, index)
+            vehicles.append(vehicleDict)
+        self.bodies: Dict[str, bytes] = {
+            'vehicles': json.dumps({'data': vehicles}).encode('utf-8'),
+            'selectivestatus': json.dumps(fixtures['selectivestatus']).encode('utf-8'),
+            'parkingposition': json.dumps(fixtures['parkingposition']).encode('utf-8'),
+            'trip': json.dumps(fixtures['trip']).encode('utf-8'),
+        }
+        self.requests: int = 0
+
+    def body(self, url: str) -> Optional[bytes]:
+        path: str = url.split('?')[0]
+        if path.endswith('/selectivestatus'):
+            return self.bodies['selectivestatus']
+        if path.endswith('/parkingposition'):
+            return self.bodies['parkingposition']
+        if '/trips/' in path:
+            return self.bodies['trip']
+        if path.endswith('/vehicles'):
+            return self.bodies['vehicles']
+        return None
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None) -> Response:  # pylint: disable=too-many-arguments
+        del stream, timeout, verify, cert, proxies
+        self.requests += 1
+        body: Optional[bytes] = self.body(request.url)
+        response: Response = Response()
+        response.status_code = codes['ok'] if body is not None else codes['not_found']
+        response._content = body if body is not None else b'{}'  # pylint: disable=protected-access
+        response.headers = CaseInsensitiveDict({'Content-Type': 'application/json'})
+        response.encoding = 'utf-8'
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def fixtureWeConnect(adapter: FixtureAdapter, **kwargs) -> WeConnect:
+    """WeConnect instance that is logged in with a dummy token and sends all requests to adapter"""
+    weConnect: WeConnect = WeConnect(username='benchmark', password='benchmark', updateAfterLogin=False, **kwargs)
+    weConnect.session.token = {'access_token': 'benchmark', 'token_type': 'Bearer', 'expires_in': 3600}
+    weConnect.session.mount('https://', adapter)
+    return weConnect
@@ -0,0 +1,154 @@
+"""Memory used per vehicle tree, built from the recorded payloads
+
+The total is measured with tracemalloc. It is broken down by element class, including disabled elements, by walking the objects every
+element owns (its slots, __dict__, strings, timestamps, containers, ...) up to the next element. Objects shared between vehicles, e.g.
+interned strings or cached timestamps, are accounted to the first element reaching them, objects reachable from a vehicle built before
+the measurement are not accounted at all. Pixel data of images is allocated by Pillow outside of tracemalloc, it is estimated from the
+size of the images.
+
+With --output the results are appended as one line to a JSON Lines file, so runs of different versions can be compared.
+
+Usage: python benchmarks/memory_per_vehicle.py [--vehicles N] [--lazy] [--top N] [--output FILE]
+"""
+from typing import Any, Dict, List, Set, Tuple
+
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+import types
+from datetime import datetime, timezone
+from enum import Enum
+
+from fixtures import FixtureWeConnect, loadFixtures
+
+from weconnect.__version import __version__
+from weconnect.addressable import AddressableLeaf
+from weconnect.util import isImage
+
+# Shared by all instances, never owned by an element
+_SHARED_TYPES: Tuple[type, ...] = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.CodeType, Enum)
+IMAGES: str = 'images (pixel data, estimated)'
+
+
+def isBelow(element: AddressableLeaf, vehicle: AddressableLeaf) -> bool:
+    while element is not None:
+        if element is vehicle:
+            return True
+        element = element.parent
+    return False
+
+
+def ownedBytes(element: AddressableLeaf, vehicle: AddressableLeaf, seen: Set[int], elements: List[AddressableLeaf]) -> Tuple[int, int]:
+    """Bytes of element and the objects reached through it up to the next element, and the estimated pixel data of images among them.
+    Elements of vehicle that are reached are added to elements."""
+    size: int = 0
+    pixels: int = 0
+    stack: List[Any] = [element]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if isImage(obj):
+            pixels += obj.width * obj.height * len(obj.getbands())
+            continue
+        for referent in gc.get_referents(obj):
+            if isinstance(referent, _SHARED_TYPES):
+                continue
+            if isinstance(referent, AddressableLeaf):
+                if id(referent) not in seen and isBelow(referent, vehicle):
+                    elements.append(referent)
+                continue
+            stack.append(referent)
+    return size, pixels
+
+
+def breakdown(vehicle: AddressableLeaf, seen: Set[int], classes: Dict[str, Dict[str, int]]) -> None:
+    """Adds the bytes owned by the elements of vehicle to classes. Elements are found through references, so statuses not created yet
+    (see DomainDict) are not created by the walk."""
+    elements: List[AddressableLeaf] = [vehicle]
+    while elements:
+        element: AddressableLeaf = elements.pop()
+        if id(element) in seen:
+            continue
+        size, pixels = ownedBytes(element, vehicle, seen, elements)
+        entry: Dict[str, int] = classes.setdefault(type(element).__qualname__, {'count': 0, 'bytes': 0})
+        entry['count'] += 1
+        entry['bytes'] += size
+        if pixels:
+            images: Dict[str, int] = classes.setdefault(IMAGES, {'count': 0, 'bytes': 0})
+            images['count'] += 1
+            images['bytes'] += pixels
+
+
+def main() -> None:  # pylint: disable=too-many-locals
+    parser = argparse.ArgumentParser(description='Measure the memory footprint of vehicle trees')
+    parser.add_argument('--vehicles', type=int, default=300, help='Number of vehicles to build (default: 300)')
+    parser.add_argument('--lazy', action='store_true', help='Create status objects only when they are accessed')
+    parser.add_argument('--top', type=int, default=20, help='Number of element classes to list (default: 20)')
+    parser.add_argument('--output', help='JSON Lines file the results are appended to')
+    args = parser.parse_args()
+
+    fixtures = loadFixtures()
+    weConnect = FixtureWeConnect(fixtures=fixtures, lazyDomains=args.lazy)
+    # Build one vehicle first so that class level caches and interned strings are not accounted to the fleet
+    weConnect.addVehicle(0)
+
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    for index in range(1, args.vehicles + 1):
+        weConnect.addVehicle(index)
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    vehicles = [weConnect.vehicles[vin] for vin in list(weConnect.vehicles.keys())]
+    seen: Set[int] = set()
+    breakdown(vehicles[0], seen, {})
+    classes: Dict[str, Dict[str, int]] = {}
+    for vehicle in vehicles[1:]:
+        breakdown(vehicle, seen, classes)
+
+    traced: int = after - before
+    perVehicle: float = traced / args.vehicles
+    elementsPerVehicle: float = sum(entry['count'] for name, entry in classes.items() if name != IMAGES) / args.vehicles
+    attributed: int = sum(entry['bytes'] for name, entry in classes.items() if name != IMAGES)
+    print(f'Vehicles:               {args.vehicles}')
+    print(f'Elements per vehicle:   {elementsPerVehicle:.0f} (including disabled ones)')
+    print(f'Total:                  {traced / 1024 / 1024:.2f} MiB')
+    print(f'Bytes per vehicle:      {perVehicle:.0f}')
+    print(f'Bytes per element:      {perVehicle / elementsPerVehicle:.0f}')
+    print(f'Attributed to elements: {attributed / traced * 100:.1f} %')
+    print()
+    print(f'{"Element class":<40} {"Count/vehicle":>14} {"Bytes/vehicle":>14} {"Bytes/element":>14}')
+    ranked: List[Tuple[str, Dict[str, int]]] = sorted(classes.items(), key=lambda item: item[1]['bytes'], reverse=True)
+    for name, entry in ranked[:args.top]:
+        print(f'{name:<40} {entry["count"] / args.vehicles:>14.1f} {entry["bytes"] / args.vehicles:>14.0f} {entry["bytes"] / entry["count"]:>14.0f}')
+    if len(ranked) > args.top:
+        rest: List[Dict[str, int]] = [entry for _, entry in ranked[args.top:]]
+        print(f'{f"{len(rest)} other classes":<40} {sum(entry["count"] for entry in rest) / args.vehicles:>14.1f} '
+              f'{sum(entry["bytes"] for entry in rest) / args.vehicles:>14.0f}')
+
+    if args.output:
+        results: Dict[str, Any] = {
+            'version': __version__,
+            'date': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': sys.version.split()[0],
+            'vehicles': args.vehicles,
+            'lazyDomains': args.lazy,
+            'elementsPerVehicle': elementsPerVehicle,
+            'bytesPerVehicle': perVehicle,
+            'attributedShare': attributed / traced,
+            'classes': {name: {'countPerVehicle': entry['count'] / args.vehicles, 'bytesPerVehicle': entry['bytes'] / args.vehicles}
+                        for name, entry in ranked},
+        }
+        with open(args.output, 'a', encoding='utf8') as file:
+            file.write(json.dumps(results) + '\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""Time spent parsing the recorded selectivestatus payload into vehicle trees
+
+Usage: python benchmarks/parse_status.py [--vehicles N] [--rounds N]
+"""
+import argparse
+import time
+
+from fixtures import FixtureWeConnect, loadFixtures
+
+from weconnect.addressable import AddressableObject, AddressableAttribute, ChangeableAttribute, updateCycle
+from weconnect.elements.enums import UnlockPlugState
+
+
+def timeFromDict(rounds: int) -> float:
+    parent = AddressableObject(localAddress='parent', parent=None)
+    attributes = [
+        (AddressableAttribute(localAddress='bool', parent=parent, value=None, valueType=bool), {'bool': 'true'}, 'bool'),
+        (AddressableAttribute(localAddress='int', parent=parent, value=None, valueType=int), {'int': 42}, 'int'),
+        (AddressableAttribute(localAddress='float', parent=parent, value=None, valueType=float), {'float': 21.5}, 'float'),
+        (AddressableAttribute(localAddress='enum', parent=parent, value=None, valueType=UnlockPlugState), {'enum': 'permanent'}, 'enum'),
+        (AddressableAttribute(localAddress='str', parent=parent, value=None, valueType=str), {'str': 'test'}, 'str'),
+        (ChangeableAttribute(localAddress='changeable', parent=parent, value=None, valueType=int), {'changeable': 80}, 'changeable'),
+    ]
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for attribute, fromDict, key in attributes:
+            attribute.fromDict(fromDict, key)
+    return (time.perf_counter() - start) / (rounds * len(attributes))
+
+
+def timeChangeableValue(rounds: int) -> float:
+    parent = AddressableObject(localAddress='parent', parent=None)
+    attribute = ChangeableAttribute(localAddress='changeable', parent=parent, value=None, valueType=float)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        attribute.value = '21.5'
+    return (time.perf_counter() - start) / rounds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Measure parsing of status payloads')
+    parser.add_argument('--vehicles', type=int, default=100, help='Number of vehicles to build (default: 100)')
+    parser.add_argument('--rounds', type=int, default=3, help='Number of status updates per vehicle (default: 3)')
+    args = parser.parse_args()
+
+    weConnect = FixtureWeConnect(fixtures=loadFixtures())
+    start = time.perf_counter()
+    vehicles = [weConnect.addVehicle(index) for index in range(args.vehicles)]
+    construction = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(args.rounds):
+        # Like WeConnect.update() one round is one update cycle
+        with updateCycle():
+            for vehicle in vehicles:
+                vehicle.updateStatus()
+    update = time.perf_counter() - start
+
+    print(f'Vehicles:                        {args.vehicles}')
+    print(f'Construction per vehicle:        {construction / args.vehicles * 1000:.3f} ms')
+    print(f'Status update per vehicle:       {update / (args.vehicles * args.rounds) * 1000:.3f} ms')
+    print(f'fromDict per attribute:          {timeFromDict(20000) * 1e6:.3f} us')
+    print(f'ChangeableAttribute.value = str: {timeChangeableValue(20000) * 1e6:.3f} us')
+
+
+if __name__ == '__main__':
+    main()
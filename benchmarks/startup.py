@@ -0,0 +1,128 @@
+"""Startup and tree construction cost: import time of weconnect.weconnect, construction of vehicles from the recorded payloads and full
+WeConnect.update() calls against a local stub of the API
+
+The results are printed as JSON. With --output they are also appended as one line to a JSON Lines file, so runs of different versions
+can be compared, e.g. python benchmarks/startup.py --output startup.jsonl
+
+Usage: python benchmarks/startup.py [--vehicles N] [--rounds N] [--imports N] [--output FILE]
+"""
+from typing import Any, Dict, List, Tuple
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess  # nosec
+import sys
+import time
+from datetime import datetime, timezone
+
+from fixtures import ROOT, FixtureAdapter, FixtureWeConnect, fixtureWeConnect, loadFixtures
+
+from weconnect.__version import __version__
+from weconnect.addressable import updateCycle
+
+
+def summary(values: List[float]) -> Dict[str, float]:
+    return {'median': statistics.median(values), 'min': min(values), 'max': max(values)}
+
+
+def parseImportTime(output: str) -> Dict[str, Tuple[int, int]]:
+    """Self and cumulative microseconds per module from the output of python -X importtime"""
+    modules: Dict[str, Tuple[int, int]] = {}
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields: List[str] = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            # Header line
+            continue
+        modules[fields[2].strip()] = (int(fields[0]), int(fields[1]))
+    return modules
+
+
+def measureImport(runs: int, module: str = 'weconnect.weconnect', top: int = 10) -> Dict[str, Any]:
+    environment: Dict[str, str] = dict(os.environ)
+    environment['PYTHONPATH'] = os.pathsep.join([ROOT] + ([environment['PYTHONPATH']] if 'PYTHONPATH' in environment else []))
+    results: List[Tuple[float, Dict[str, Tuple[int, int]]]] = []
+    for _ in range(runs):
+        completed = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'], capture_output=True, text=True,  # nosec
+                                   env=environment, check=True)
+        modules: Dict[str, Tuple[int, int]] = parseImportTime(completed.stderr)
+        results.append((modules[module][1] / 1e6, modules))
+    results.sort(key=lambda result: result[0])
+    # Breakdown of the median run
+    _, modules = results[len(results) // 2]
+    slowest: List[Tuple[str, Tuple[int, int]]] = sorted(modules.items(), key=lambda item: item[1][0], reverse=True)[:top]
+    return {
+        'module': module,
+        'runs': runs,
+        'seconds': summary([seconds for seconds, _ in results]),
+        'modules': len(modules),
+        'weconnectModules': sum(1 for name in modules if name == 'weconnect' or name.startswith('weconnect.')),
+        'slowest': [{'module': name, 'selfSeconds': selfTime / 1e6, 'cumulativeSeconds': cumulative / 1e6}
+                    for name, (selfTime, cumulative) in slowest],
+    }
+
+
+def measureConstruction(numVehicles: int, rounds: int, fixtures: Dict[str, Any]) -> Dict[str, Any]:
+    perVehicle: List[float] = []
+    for _ in range(rounds):
+        weConnect = FixtureWeConnect(fixtures=fixtures)
+        start = time.perf_counter()
+        with updateCycle():
+            for index in range(numVehicles):
+                weConnect.addVehicle(index)
+        perVehicle.append((time.perf_counter() - start) / numVehicles)
+    return {'vehicles': numVehicles, 'rounds': rounds, 'secondsPerVehicle': summary(perVehicle),
+            'elementsPerVehicle': len(weConnect.vehicles[list(weConnect.vehicles.keys())[0]].getRecursiveChildren())}
+
+
+def measureUpdate(numVehicles: int, rounds: int, fixtures: Dict[str, Any]) -> Dict[str, Any]:
+    first: List[float] = []
+    following: List[float] = []
+    requests: int = 0
+    for _ in range(rounds):
+        adapter = FixtureAdapter(fixtures=fixtures, numVehicles=numVehicles)
+        weConnect = fixtureWeConnect(adapter)
+        # The first update builds the tree, the following ones apply unchanged responses to it
+        start = time.perf_counter()
+        weConnect.update()
+        first.append(time.perf_counter() - start)
+        requests = adapter.requests
+        start = time.perf_counter()
+        weConnect.update()
+        following.append(time.perf_counter() - start)
+        weConnect.disconnect()
+    return {'vehicles': numVehicles, 'rounds': rounds, 'requestsPerUpdate': requests, 'firstSeconds': summary(first),
+            'followingSeconds': summary(following)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Measure import time, vehicle construction and full updates')
+    parser.add_argument('--vehicles', type=int, default=20, help='Number of vehicles to build and update (default: 20)')
+    parser.add_argument('--rounds', type=int, default=5, help='Number of repetitions of the construction and update (default: 5)')
+    parser.add_argument('--imports', type=int, default=5, help='Number of interpreters measuring the import (default: 5)')
+    parser.add_argument('--output', help='JSON Lines file the results are appended to')
+    args = parser.parse_args()
+
+    fixtures: Dict[str, Any] = loadFixtures()
+    results: Dict[str, Any] = {
+        'version': __version__,
+        'date': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'import': measureImport(args.imports),
+        'construction': measureConstruction(args.vehicles, args.rounds, fixtures),
+        'update': measureUpdate(args.vehicles, args.rounds, fixtures),
+    }
+    print(json.dumps(results, indent=2))
+    if args.output:
+        with open(args.output, 'a', encoding='utf8') as file:
+            file.write(json.dumps(results) + '\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,10 @@
+import json
+from datetime import time
+
 import pytest
 
 from weconnect import addressable
+from weconnect.change_journal import ChangeJournal
 
 
 def test_AddressableLeafGetObservers():
@@ -205,3 +209,380 @@ def test_AdressableObjectLeafChildren():
     assert children[0] == addressableObject
     assert children[1] == childAddressableLeaf1
     assert children[2] == childAddressableLeaf2
+
+
+def test_AddressableAttributeCompactStorage():
+    parent = addressable.AddressableObject(localAddress='parent', parent=None)
+    attribute1 = addressable.AddressableAttribute(localAddress='child1', parent=parent, value='test1', valueType=str)
+    attribute2 = addressable.AddressableAttribute(localAddress='child2', parent=parent, value='test2', valueType=str)
+
+    # All fields live in slots, the instance dict stays empty
+    assert not attribute1.__dict__
+    assert not attribute2.__dict__
+
+    # Timestamps set within the same second share one object
+    assert attribute1.lastUpdateFromServer is not None
+    if attribute1.lastUpdateFromServer == attribute2.lastUpdateFromServer:
+        assert attribute1.lastUpdateFromServer is attribute2.lastUpdateFromServer
+    assert attribute1.lastChange is attribute1.lastUpdateFromServer
+
+    def observe(element, flags):
+        del element, flags
+
+    # Adding an observer to one element must not leak into the shared empty observer container
+    attribute1.addObserver(observe, flag=addressable.AddressableLeaf.ObserverEvent.VALUE_CHANGED)
+    assert len(attribute1.getObserverEntries(addressable.AddressableLeaf.ObserverEvent.ALL)) == 1
+    assert len(attribute2.getObserverEntries(addressable.AddressableLeaf.ObserverEvent.ALL)) == 0
+    assert len(addressable.NO_OBSERVERS) == 0
+
+
+def test_AddressableObjectLeafChildrenCache():
+    root = addressable.AddressableObject(localAddress='root', parent=None)
+    collection = addressable.AddressableDict(localAddress='collection', parent=root)
+    attribute1 = addressable.AddressableAttribute(localAddress='child1', parent=collection, value='test1', valueType=str)
+    attribute2 = addressable.AddressableAttribute(localAddress='child2', parent=collection, value='test2', valueType=str)
+    collection['child1'] = attribute1
+    collection['child2'] = attribute2
+
+    assert root.getLeafChildren() == [attribute1, attribute2]
+    assert list(root.iterLeafChildren()) == [attribute1, attribute2]
+    assert root.getLeafChildren() is not root.getLeafChildren()
+
+    # Disabling a leaf deep in the tree invalidates the lists of all ancestors
+    attribute1.enabled = False
+    assert root.getLeafChildren() == [attribute2]
+    attribute1.enabled = True
+    assert root.getLeafChildren() == [attribute1, attribute2]
+
+    # Removing from a collection removes and disables the child
+    del collection['child1']
+    assert not attribute1.enabled
+    assert root.getLeafChildren() == [attribute2]
+    assert attribute1 not in collection.children
+
+    collection.clear()
+    assert not attribute2.enabled
+    # An enabled object without children counts as leaf itself
+    assert root.getLeafChildren() == [collection]
+    assert collection.children == []
+
+
+def test_AddressableObjectSinceVersion():
+    root = addressable.AddressableObject(localAddress='root', parent=None)
+    child = addressable.AddressableObject(localAddress='child', parent=root)
+    attribute1 = addressable.AddressableAttribute(localAddress='attribute1', parent=child, value='test1', valueType=str)
+    attribute2 = addressable.AddressableAttribute(localAddress='attribute2', parent=root, value='test2', valueType=str)
+
+    assert root.asDict() == {'child': {'attribute1': 'test1'}, 'attribute2': 'test2'}
+    version = root.version
+    assert version >= attribute1.version
+    assert root.asDict(sinceVersion=version) == {}
+
+    # Setting the same value again is no change
+    attribute2.setValueWithCarTime('test2', fromServer=True)
+    assert root.asDict(sinceVersion=version) == {}
+
+    attribute1.setValueWithCarTime('changed', fromServer=True)
+    assert attribute1.version > version
+    assert child.version == attribute1.version
+    assert root.version == attribute1.version
+    assert root.asDict(sinceVersion=version) == {'child': {'attribute1': 'changed'}}
+    assert json.loads(root.toJSON(sinceVersion=version)) == {'child': {'attribute1': 'changed'}}
+
+    # Disabled elements are reported as None
+    version = root.version
+    attribute2.enabled = False
+    assert root.asDict(sinceVersion=version) == {'attribute2': None}
+    assert root.asDict() == {'child': {'attribute1': 'changed'}}
+
+
+def test_AddressableObjectSinceVersionRemoved():
+    root = addressable.AddressableObject(localAddress='root', parent=None)
+    lights = addressable.AddressableDict(localAddress='lights', parent=root)
+    for key in ['a', 'b']:
+        lights[key] = addressable.AddressableAttribute(localAddress=key, parent=lights, value=key, valueType=str)
+    items = addressable.AddressableList(localAddress='items', parent=root)
+
+    def create(localAddress, item):
+        return addressable.AddressableAttribute(localAddress=localAddress, parent=items, value=item, valueType=str)
+    items.reconcile(['x', 'y'], create=create)
+
+    # Removed children are reported as None
+    version = root.version
+    del lights['a']
+    assert root.asDict(sinceVersion=version) == {'lights': {'a': None}}
+    items.reconcile(['y'], create=create, update=lambda element, item: element.setValueWithCarTime(item, fromServer=True))
+    assert root.asDict(sinceVersion=version)['items'] == {'0': 'y', '1': None}
+    assert root.asDict() == {'lights': {'b': 'b'}, 'items': {'0': 'y'}}
+
+    # Unless they were added again
+    version = root.version
+    lights['a'] = addressable.AddressableAttribute(localAddress='a', parent=lights, value='new', valueType=str)
+    assert root.asDict(sinceVersion=version) == {'lights': {'a': 'new'}}
+
+    # Attributes changed to None are reported as None
+    version = root.version
+    lights['b'].setValueWithCarTime(None, fromServer=True)
+    assert root.asDict(sinceVersion=version) == {'lights': {'b': None}}
+    assert root.asDict() == {'lights': {'a': 'new'}, 'items': {'0': 'y'}}
+
+
+def test_AddressableObjectChangeJournal():
+    root = addressable.AddressableObject(localAddress='', parent=None)
+    root.changeJournal = ChangeJournal(maxEntries=3)
+    child = addressable.AddressableObject(localAddress='child', parent=root)
+    attribute = addressable.AddressableAttribute(localAddress='attribute', parent=child, value=None, valueType=str)
+
+    cursor = root.changeJournal.cursor()
+    attribute.setValueWithCarTime('test1', fromServer=True)
+    entries = root.changeJournal.read(cursor)
+    assert [entry.address for entry in entries] == ['/child', '/child/attribute', '/child/attribute']
+    assert entries[0].flags == addressable.AddressableLeaf.ObserverEvent.ENABLED
+    assert entries[2].oldValue is None
+    assert entries[2].newValue == 'test1'
+    assert entries[2].flags & addressable.AddressableLeaf.ObserverEvent.VALUE_CHANGED
+    assert entries[2].sequence == attribute.version
+    assert root.changeJournal.read(cursor) == []
+
+    # Consumers read independently and in batches
+    otherCursor = root.changeJournal.cursor(fromOldest=True)
+    attribute.setValueWithCarTime('test2', fromServer=True)
+    assert len(root.changeJournal.read(otherCursor, maxEntries=2)) == 2
+    entries = root.changeJournal.read(cursor)
+    assert len(entries) == 1
+    assert (entries[0].oldValue, entries[0].newValue) == ('test1', 'test2')
+
+    # A slow consumer is told how many entries were dropped before it could read them
+    attribute.setValueWithCarTime('test3', fromServer=True)
+    attribute.enabled = False
+    entries = root.changeJournal.read(otherCursor)
+    assert otherCursor.missed == 1
+    assert [entry.newValue for entry in entries] == ['test2', 'test3', None]
+    assert entries[-1].oldValue == 'test3'
+    assert len(root.changeJournal) == 3
+
+
+def test_AddressableObjectJsonPatch():
+    root = addressable.AddressableObject(localAddress='', parent=None)
+    root.changeJournal = ChangeJournal()
+    collection = addressable.AddressableDict(localAddress='collection', parent=root)
+    element1 = addressable.AddressableObject(localAddress='element1', parent=collection)
+    attribute1 = addressable.AddressableAttribute(localAddress='attribute', parent=element1, value='test1', valueType=str)
+    collection['element1'] = element1
+    attribute2 = addressable.AddressableAttribute(localAddress='attri~bute', parent=root, value='test2', valueType=str)
+
+    assert root.jsonPatch(sinceVersion=0) == [
+        {'op': 'add', 'path': '/collection', 'value': {}},
+        {'op': 'add', 'path': '/collection/element1', 'value': {}},
+        {'op': 'add', 'path': '/collection/element1/attribute', 'value': 'test1'},
+        {'op': 'add', 'path': '/attri~0bute', 'value': 'test2'},
+    ]
+
+    version = root.version
+    attribute1.setValueWithCarTime('changed', fromServer=True)
+    attribute2.enabled = False
+    element2 = addressable.AddressableObject(localAddress='element2', parent=collection)
+    addressable.AddressableAttribute(localAddress='attribute', parent=element2, value='test3', valueType=str)
+    collection['element2'] = element2
+    # Changed back and forth, nothing to patch
+    attribute1.setValueWithCarTime('test1', fromServer=True)
+    assert root.jsonPatch(sinceVersion=version) == [
+        {'op': 'remove', 'path': '/attri~0bute'},
+        {'op': 'add', 'path': '/collection/element2', 'value': {}},
+        {'op': 'add', 'path': '/collection/element2/attribute', 'value': 'test3'},
+    ]
+    assert collection.jsonPatch(sinceVersion=version) == [
+        {'op': 'add', 'path': '/element2', 'value': {}},
+        {'op': 'add', 'path': '/element2/attribute', 'value': 'test3'},
+    ]
+
+    # Removing an object removes it with all its children
+    version = root.version
+    del collection['element1']
+    assert root.jsonPatch(sinceVersion=version) == [{'op': 'remove', 'path': '/collection/element1'}]
+    assert root.jsonPatch(sinceVersion=version, untilVersion=version) == []
+
+    # Without a journal reaching back far enough the whole document is replaced
+    root.changeJournal = ChangeJournal(startSequence=root.version)
+    assert root.jsonPatch(sinceVersion=version) == [{'op': 'replace', 'path': '', 'value': root.asDict()}]
+    with pytest.raises(ValueError):
+        root.jsonPatch(sinceVersion=version, untilVersion=version)
+
+
+def test_AddressableLeafRename():
+    root = addressable.AddressableObject(localAddress='', parent=None)
+    root.changeJournal = ChangeJournal()
+    collection = addressable.AddressableList(localAddress='collection', parent=root)
+    element = addressable.AddressableObject(localAddress=None, parent=collection)
+    addressable.AddressableAttribute(localAddress='id', parent=element, value='1', valueType=str)
+    version = root.version
+    element.localAddress = '1'
+
+    # The parent finds the element under its new address and the journal records it as moved
+    assert root.getByAddressString('/collection/1') is element
+    assert collection.children == [element]
+    assert root.jsonPatch(sinceVersion=version) == [
+        {'op': 'remove', 'path': '/collection/None'},
+        {'op': 'add', 'path': '/collection/1', 'value': {}},
+        {'op': 'add', 'path': '/collection/1/id', 'value': '1'},
+    ]
+    assert root.jsonPatch(sinceVersion=0) == [
+        {'op': 'add', 'path': '/collection', 'value': {}},
+        {'op': 'add', 'path': '/collection/1', 'value': {}},
+        {'op': 'add', 'path': '/collection/1/id', 'value': '1'},
+    ]
+
+
+def test_AddressableAttributeFromDict():
+    parent = addressable.AddressableObject(localAddress='parent', parent=None)
+    intAttribute = addressable.AddressableAttribute(localAddress='int', parent=parent, value=None, valueType=int)
+    boolAttribute = addressable.AddressableAttribute(localAddress='bool', parent=parent, value=None, valueType=bool)
+    timeAttribute = addressable.AddressableAttribute(localAddress='time', parent=parent, value=None, valueType=time)
+
+    intAttribute.fromDict({'int': '42'}, 'int')
+    assert intAttribute.value == 42
+    boolAttribute.fromDict({'bool': 'true'}, 'bool')
+    assert boolAttribute.value is True
+    timeAttribute.fromDict({'time': '07:30'}, 'time')
+    assert timeAttribute.value == time(hour=7, minute=30)
+
+    # Empty strings and missing keys disable the attribute
+    intAttribute.fromDict({'int': ''}, 'int')
+    assert not intAttribute.enabled
+    boolAttribute.fromDict({}, 'bool')
+    assert not boolAttribute.enabled
+
+    # Converters are resolved once per type and shared
+    assert addressable.fromDictConverter(int) is addressable.fromDictConverter(int)
+    intAttribute.valueType = float
+    intAttribute.fromDict({'int': '21.5'}, 'int')
+    assert intAttribute.value == 21.5
+
+    tupleAttribute = addressable.AddressableAttribute(localAddress='tuple', parent=parent, value=None, valueType=(int, float))
+    with pytest.raises(ValueError):
+        tupleAttribute.fromDict({'tuple': '1'}, 'tuple')
+
+
+def test_ChangeableAttributeCoercion():
+    parent = addressable.AddressableObject(localAddress='parent', parent=None)
+    changeable = addressable.ChangeableAttribute(localAddress='changeable', parent=parent, value=None, valueType=(int, float))
+
+    changeable.value = '5'
+    assert changeable.value == 5.0
+    assert isinstance(changeable.value, float)
+    changeable.value = 3
+    assert changeable.value == 3.0
+
+    with pytest.raises(ValueError, match=r'N \(Decimal number\) or F\.F \(Floating Point Number\)'):
+        changeable.value = 'test'
+
+    boolChangeable = addressable.ChangeableAttribute(localAddress='bool', parent=parent, value=None, valueType=bool)
+    boolChangeable.value = 'no'
+    assert boolChangeable.value is False
+
+
+def test_updateCycle(monkeypatch):
+    now = [1700000000.0]
+    monkeypatch.setattr(addressable.timemodule, 'time', lambda: now[0])
+    parent = addressable.AddressableObject(localAddress='parent', parent=None)
+    first = addressable.AddressableAttribute(localAddress='first', parent=parent, value=None, valueType=int)
+    second = addressable.AddressableAttribute(localAddress='second', parent=parent, value=None, valueType=int)
+    assert addressable.updateCycleTimestamp() is None
+
+    with addressable.updateCycle() as cycleTimestamp:
+        assert addressable.updateCycleTimestamp() is cycleTimestamp
+        first.fromDict({'first': 1}, 'first')
+        with addressable.updateCycle() as nestedTimestamp:
+            assert nestedTimestamp is cycleTimestamp
+            # The clock moves on during the cycle
+            now[0] += 2
+            second.fromDict({'second': 2}, 'second')
+    assert addressable.updateCycleTimestamp() is None
+    assert addressable.utcNowSeconds() != cycleTimestamp
+
+    assert first.lastUpdateFromServer is cycleTimestamp
+    assert first.lastChange is cycleTimestamp
+    assert second.lastUpdateFromServer is cycleTimestamp
+    assert second.lastChange is cycleTimestamp
+
+
+class ReconcileItem(addressable.AddressableObject):
+    def __init__(self, localAddress, parent, fromDict):
+        super().__init__(localAddress=localAddress, parent=parent)
+        self.id = addressable.AddressableAttribute(localAddress='id', parent=self, value=None, valueType=str)
+        self.value = addressable.AddressableAttribute(localAddress='value', parent=self, value=None, valueType=int)
+        self.update(fromDict)
+
+    def update(self, fromDict):
+        self.id.fromDict(fromDict, 'id')
+        self.value.fromDict(fromDict, 'value')
+
+
+def test_AddressableDictReconcile():
+    root = addressable.AddressableObject(localAddress='', parent=None)
+    items = addressable.AddressableDict(localAddress='items', parent=root)
+
+    def create(key, item):
+        return ReconcileItem(localAddress=key, parent=items, fromDict=item)
+
+    items.reconcile([{'id': 'a', 'value': 1}, {'id': 'b', 'value': 2}, {'value': 3}], key=lambda item: item.get('id'), create=create)
+    assert list(items.keys()) == ['a', 'b']
+    first = items['a']
+    second = items['b']
+
+    items.reconcile([{'id': 'a', 'value': 10}, {'id': 'c', 'value': 30}], key=lambda item: item.get('id'), create=create)
+    assert list(items.keys()) == ['a', 'c']
+    assert items['a'] is first
+    assert first.value.value == 10
+    assert not second.enabled
+    assert root.getByAddressString('/items/c/value').value == 30
+
+
+def test_AddressableListReconcile():
+    root = addressable.AddressableObject(localAddress='', parent=None)
+    items = addressable.AddressableList(localAddress='items', parent=root)
+
+    def create(localAddress, item):
+        return ReconcileItem(localAddress=localAddress, parent=items, fromDict=item)
+
+    # Matched by position
+    items.reconcile([{'id': 'a', 'value': 1}, {'id': 'b', 'value': 2}], create=create)
+    first = items[0]
+    items.reconcile([{'id': 'x', 'value': 5}], create=create)
+    assert len(items) == 1
+    assert items[0] is first
+    assert first.id.value == 'x'
+
+    # Matched by key, elements move to the index of their item
+    items.reconcile([{'id': 'a', 'value': 1}, {'id': 'b', 'value': 2}, {'id': 'c', 'value': 3}], create=create)
+    second = items[1]
+    third = items[2]
+    items.reconcile([{'id': 'c', 'value': 3}, {'id': 'd', 'value': 4}, {'id': 'b', 'value': 20}], create=create,
+                    key=lambda item: item['id'], elementKey=lambda element: element.id.value)
+    assert [element.id.value for element in items] == ['c', 'd', 'b']
+    assert items[0] is third and items[2] is second
+    assert [element.localAddress for element in items] == ['0', '1', '2']
+    assert not first.enabled
+    assert root.getByAddressString('/items/2/value').value == 20
+    assert root.getByAddressString('/items/0/id').value == 'c'
+
+    # Duplicate keys are matched in their order, the ones left over are removed
+    items.reconcile([{'id': 'c', 'value': 1}, {'id': 'c', 'value': 2}], create=create,
+                    key=lambda item: item['id'], elementKey=lambda element: element.id.value)
+    duplicate = items[1]
+    items.reconcile([{'id': 'c', 'value': 3}], create=create, key=lambda item: item['id'], elementKey=lambda element: element.id.value)
+    assert len(items) == 1
+    assert not duplicate.enabled
+    assert items[0] is not duplicate and items[0].value.value == 3
+    assert list(items.asDict().keys()) == ['0']
+
+
+def test_AddressableAttributeImageStr():
+    Image = pytest.importorskip('PIL.Image')
+    image = Image.new('RGB', (4, 4))
+    attribute = addressable.AddressableAttribute(localAddress='image', parent=None, value=image, valueType=Image.Image)
+    # Without ascii_magic the image is shown like any other value
+    if addressable.SUPPORT_ASCII_IMAGES:
+        assert str(attribute) == addressable.imgToASCIIArt(image)
+    else:
+        assert str(attribute) == str(image)
@@ -0,0 +1,121 @@
+import threading
+import time
+
+import pytest
+import requests
+
+from benchmarks.fixtures import FixtureAdapter, fixtureWeConnect
+from weconnect.cancellation import CancellationToken, cancellable, currentCancellationToken, onCancel, raiseIfCancelled
+from weconnect.errors import UpdateCancelledError
+from weconnect.weconnect import WeConnect
+
+
+def test_CancellationToken():
+    token = CancellationToken()
+    assert not token.cancelled
+    assert not token.wait(timeout=0.01)
+    token.raiseIfCancelled()
+
+    threading.Timer(0.01, token.cancel, kwargs={'reason': 'shutdown'}).start()
+    assert token.wait(timeout=5)
+    assert token.cancelled
+    with pytest.raises(UpdateCancelledError, match='shutdown'):
+        token.raiseIfCancelled()
+
+
+def test_CancellationCallbacks():
+    token = CancellationToken()
+    calls = []
+
+    def fail():
+        raise RuntimeError('broken callback')
+
+    token.addCallback(fail)
+    token.addCallback(lambda: calls.append('registered'))
+    with onCancel(token, lambda: calls.append('context')):
+        pass
+    with onCancel(None, lambda: calls.append('without token')):
+        pass
+    # A failing callback does not stop the others, callbacks run once
+    token.cancel()
+    token.cancel()
+    assert calls == ['registered']
+    token.addCallback(lambda: calls.append('late'))
+    assert calls == ['registered', 'late']
+
+
+def test_Cancellable():
+    outer = CancellationToken()
+    inner = CancellationToken()
+    assert currentCancellationToken() is None
+    with cancellable(outer):
+        # Calls without a token keep the token of the caller
+        with cancellable(None):
+            assert currentCancellationToken() is outer
+        with cancellable(inner):
+            assert currentCancellationToken() is inner
+            outer.cancel()
+            raiseIfCancelled()
+        with pytest.raises(UpdateCancelledError):
+            raiseIfCancelled()
+    assert currentCancellationToken() is None
+    raiseIfCancelled()
+
+
+def test_UpdateCancelled(monkeypatch):
+    weConnect = WeConnect(username='user', password='password', updateAfterLogin=False, loginOnInit=False)
+    token = CancellationToken()
+    urls = []
+
+    def get(url, **kwargs):
+        del kwargs
+        urls.append(url)
+        # Cancelled while the request is running
+        token.cancel()
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'{"data": [{"vin": "VIN1"}]}'  # pylint: disable=protected-access
+        return response
+    monkeypatch.setattr(weConnect.session, 'get', get)
+
+    with pytest.raises(UpdateCancelledError):
+        weConnect.update(cancellationToken=token)
+    # The response of the running request is dropped and no further request is made
+    assert len(urls) == 1
+    assert len(weConnect.vehicles) == 0
+
+    # With a cancelled token no request is made at all
+    with pytest.raises(UpdateCancelledError):
+        weConnect.update(cancellationToken=token)
+    assert len(urls) == 1
+
+
+class HangingAdapter(FixtureAdapter):
+    """Server that does not answer the status requests until the adapter is closed, the request fails with a ConnectionError then"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.closed: threading.Event = threading.Event()
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None,  # pylint: disable=too-many-arguments,too-many-positional-arguments
+             proxies=None):
+        if request.url.split('?')[0].endswith('/selectivestatus'):
+            self.closed.wait(timeout=10)
+            raise requests.exceptions.ConnectionError('Connection aborted')
+        return super().send(request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+
+    def close(self) -> None:
+        self.closed.set()
+
+
+def test_CancelAbortsRunningRequest():
+    adapter = HangingAdapter()
+    weConnect = fixtureWeConnect(adapter)
+    token = CancellationToken()
+
+    threading.Timer(0.1, token.cancel, kwargs={'reason': 'shutdown'}).start()
+    start = time.monotonic()
+    with pytest.raises(UpdateCancelledError, match='shutdown'):
+        weConnect.update(updatePictures=False, cancellationToken=token)
+    assert adapter.closed.is_set()
+    assert time.monotonic() - start < 5
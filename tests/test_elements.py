@@ -1,16 +1,206 @@
-# import os
-# import json
+import os
+import json
+import copy
+from datetime import datetime, timedelta, timezone
+from functools import partial
+
+from weconnect.addressable import AddressableDict, AddressableLeaf, AddressableObject
+from weconnect.domain import Domain
+from weconnect.elements.battery_status import BatteryStatus
+from weconnect.elements.charging_status import ChargingStatus
+from weconnect.elements.maintenance_status import MaintenanceStatus
+from weconnect.elements.vehicle import JOB_KEY_CLASS_MAP, DomainDict, Vehicle, statusClass
+from weconnect.schema_drift import schemaDrift
 
 # import pytest
 
 # from weconnect import elements
 
-# SCRIPTLOC = os.path.dirname(__file__)
+SCRIPTLOC = os.path.dirname(__file__)
+
+
+class StubWeConnect(AddressableObject):
+    """Answers every request with an empty response and records the requested urls"""
+
+    def __init__(self):
+        super().__init__(localAddress='', parent=None)
+        self.fixAPI = True
+        self.spin = None
+        self.budget = None
+        self.urls = []
+
+    def fetchData(self, url, force=False, allowEmpty=False, allowHttpError=False, allowedErrors=None):
+        del force, allowEmpty, allowHttpError, allowedErrors
+        self.urls.append(url)
+        return {}
 
 
 def test_dummy():
     assert True
 
+
+def test_GenericStatusUpdateIfChanged():
+    parent = AddressableDict(localAddress='domain', parent=None)
+    statusDict = {'value': {'carCapturedTimestamp': '2024-11-03T10:20:44Z', 'currentSOC_pct': 63, 'cruisingRangeElectric_km': 241}}
+    status = BatteryStatus(vehicle=None, parent=parent, statusId='batteryStatus', fromDict=copy.deepcopy(statusDict))
+    assert status.currentSOC_pct.value == 63
+
+    updated = []
+    status.currentSOC_pct.addObserver(lambda element, flags: updated.append(flags), AddressableLeaf.ObserverEvent.UPDATED_FROM_SERVER)
+
+    # Identical payload is not parsed again, but observers still learn about the update
+    assert not status.updateIfChanged(copy.deepcopy(statusDict))
+    assert updated == [AddressableLeaf.ObserverEvent.UPDATED_FROM_SERVER]
+
+    statusDict['value']['currentSOC_pct'] = 70
+    assert status.updateIfChanged(copy.deepcopy(statusDict))
+    assert status.currentSOC_pct.value == 70
+
+    # Local changes since the last update force a full update
+    status.currentSOC_pct.setValueWithCarTime(50)
+    assert status.updateIfChanged(copy.deepcopy(statusDict))
+    assert status.currentSOC_pct.value == 70
+
+
+def test_FieldSchema(caplog):
+    schemaDrift.clear()
+    parent = AddressableDict(localAddress='domain', parent=None)
+    assert MaintenanceStatus.fieldSchema.knownKeys == frozenset(['carCapturedTimestamp', 'inspectionDue_days', 'inspectionDue_km', 'mileage_km',
+                                                                 'oilServiceDue_days', 'oilServiceDue_km'])
+
+    status = MaintenanceStatus(vehicle=None, parent=parent, statusId='maintenanceStatus',
+                               fromDict={'value': {'mileage_km': 0x7FFFFFFF, 'inspectionDue_km': '1000', 'somethingNew': 1}})
+    assert status.mileage_km.enabled and status.mileage_km.value is None
+    assert status.inspectionDue_km.value == 1000
+    assert not status.oilServiceDue_km.enabled
+    assert [record.getMessage() for record in caplog.records if 'Unknown attribute' in record.getMessage()] \
+        == ['domain/maintenanceStatus: Unknown attribute somethingNew with value 1']
+
+    # Hooks are skipped without fixAPI
+    status = MaintenanceStatus(vehicle=None, parent=parent, statusId='rawMaintenanceStatus', fromDict={'value': {'mileage_km': 0x7FFFFFFF}},
+                               fixAPI=False)
+    assert status.mileage_km.value == 0x7FFFFFFF
+
+    # Hooks see the fields declared before them
+    status = ChargingStatus(vehicle=None, parent=parent, statusId='chargingStatus',
+                            fromDict={'value': {'chargingState': 'readyForCharging', 'chargePower_kW': 3.5, 'chargeRate_kmph': 20}})
+    assert status.chargePower_kW.value == 0.0
+    assert status.chargeRate_kmph.value == 0.0
+
+    status.update({})
+    assert not status.chargingState.enabled
+    assert not status.chargePower_kW.enabled
+
+
+def test_FieldSchemaAnnotations():
+    # The attributes created from FIELDS are annotated on class level for static analysis
+    for classes in JOB_KEY_CLASS_MAP.values():
+        for name in classes.values():
+            statusCls = statusClass(name)
+            for field in statusCls.FIELDS:
+                assert (field.address or field.key) in statusCls.__annotations__, f'{statusCls.__name__}.{field.key} is not annotated'
+
+
+def test_GenericStatusFutureTimestamp():
+    parent = AddressableDict(localAddress='domain', parent=None)
+    future = datetime.now(tz=timezone.utc).replace(microsecond=0) + timedelta(hours=5, minutes=10)
+    statusDict = {'value': {'carCapturedTimestamp': future.isoformat(), 'currentSOC_pct': 63}}
+    status = BatteryStatus(vehicle=None, parent=parent, statusId='batteryStatus', fromDict=copy.deepcopy(statusDict))
+    # Corrected in steps of 30 minutes until it is not in the future anymore
+    assert status.carCapturedTimestamp.value == future - timedelta(hours=5, minutes=30)
+
+    # The correction depends on the current time, so an identical payload is not skipped
+    assert status.updateIfChanged(copy.deepcopy(statusDict))
+    statusDict['value']['carCapturedTimestamp'] = '2024-11-03T10:20:44Z'
+    assert status.updateIfChanged(copy.deepcopy(statusDict))
+    assert not status.updateIfChanged(copy.deepcopy(statusDict))
+
+
+def test_SchemaDrift(caplog):
+    schemaDrift.clear()
+    parent = AddressableDict(localAddress='domain', parent=None)
+    statusDict = {'value': {'currentSOC_pct': 63, 'newValue': 1}, 'newElement': {}}
+    BatteryStatus(vehicle=None, parent=parent, statusId='batteryStatus', fromDict=statusDict)
+    BatteryStatus(vehicle=None, parent=parent, statusId='otherBatteryStatus', fromDict=statusDict)
+
+    # Logged only once per class and key
+    assert [record.getMessage() for record in caplog.records if 'Unknown attribute' in record.getMessage()] \
+        == ['domain/batteryStatus: Unknown attribute newValue with value 1', 'domain/batteryStatus: Unknown attribute newElement with value {}']
+    entries = {entry.key: entry for entry in schemaDrift.entries(className='BatteryStatus')}
+    assert set(entries) == {'newValue', 'newElement'}
+    assert entries['newValue'].count == 2
+    assert entries['newValue'].address == 'domain/batteryStatus'
+    assert schemaDrift.entries(className='PlugStatus') == []
+
+
+def test_DomainDictLazy():
+    root = AddressableDict(localAddress='domains', parent=None)
+    domain = DomainDict(localAddress='charging', parent=root)
+    root['charging'] = domain
+    domain.setPending('batteryStatus', partial(BatteryStatus, vehicle=None, parent=domain, statusId='batteryStatus'),
+                      {'value': {'currentSOC_pct': 63}})
+    domain.setPending('chargingStatus', partial(ChargingStatus, vehicle=None, parent=domain, statusId='chargingStatus'),
+                      {'value': {'chargePower_kW': 11}})
+
+    # Membership and length do not create the statuses
+    assert 'batteryStatus' in domain
+    assert len(domain) == 2
+    assert not domain.isMaterialized('batteryStatus')
+    assert domain.materializedValues() == []
+
+    assert domain['batteryStatus'].currentSOC_pct.value == 63
+    assert domain.isMaterialized('batteryStatus')
+    assert not domain.isMaterialized('chargingStatus')
+
+    assert root.getByAddressString('domains/charging/chargingStatus/chargePower_kW').value == 11
+    assert domain.pending == {}
+
+    domain.setPending('otherStatus', partial(BatteryStatus, vehicle=None, parent=domain, statusId='otherStatus'), {'value': {'currentSOC_pct': 10}})
+    assert root.asDict()['charging']['otherStatus']['currentSOC_pct'] == 10
+    assert domain.pending == {}
+
+
+def test_VehicleJobsPlan():
+    with open(f'{SCRIPTLOC}/ressources/vehicles/ID3/vehicles.json', encoding='utf8') as file:
+        vehicleDict = json.load(file)['data'][0]
+    weConnect = StubWeConnect()
+    vehicles = AddressableDict(localAddress='vehicles', parent=weConnect)
+    vehicle = Vehicle(weConnect=weConnect, vin=vehicleDict['vin'], parent=vehicles, fromDict=vehicleDict, updatePictures=False,
+                      selective=[Domain.ALL_CAPABLE])
+
+    # Domains with a capability status (e.g. missing service) and domains without capability are not requested
+    plan = vehicle.jobsPlan
+    assert 'charging' in plan
+    assert 'auxiliaryheating' not in plan
+    assert 'departureTimers' not in plan
+    assert 'lvBattery' not in plan
+    assert plan[-1] == 'userCapabilities'
+    assert weConnect.urls[0].endswith('/selectivestatus?jobs=' + ','.join(plan))
+
+    # Cached as long as capabilities and selection stay the same
+    assert vehicle.planJobs(selective=[Domain.ALL_CAPABLE]) is plan
+
+    chargingCapability = next(capability for capability in vehicleDict['capabilities'] if capability['id'] == 'charging')
+    chargingCapability['status'] = [1007]
+    vehicle.update(fromDict=vehicleDict, updatePictures=False, selective=[Domain.ALL_CAPABLE])
+    assert 'charging' not in vehicle.jobsPlan
+
+    assert vehicle.planJobs(selective=[Domain.CHARGING, Domain.ACCESS]) == ('charging', 'access')
+
+
+def test_VehicleNoStatusData():
+    class NoDataWeConnect(StubWeConnect):
+        def fetchData(self, url, force=False, allowEmpty=False, allowHttpError=False, allowedErrors=None):
+            del force, allowEmpty, allowHttpError, allowedErrors
+            self.urls.append(url)
+
+    weConnect = NoDataWeConnect()
+    vehicles = AddressableDict(localAddress='vehicles', parent=weConnect)
+    # Nothing is known about the statuses when no data was retrieved
+    vehicle = Vehicle(weConnect=weConnect, vin='VIN1', parent=vehicles, fromDict={'vin': 'VIN1'}, updatePictures=False)
+    assert vehicle.loaded
+    assert len(vehicle.domains) == 0
+
 # @pytest.mark.parametrize('className, testcase', [(elements.ClimatizationTimer, 'complete')])
 # def test_Elements(request, className, testcase):
 #     with open(f'{request.config.rootdir}/tests/ressources/elements/{className.__name__}/{testcase}.json') as file:
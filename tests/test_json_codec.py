@@ -0,0 +1,43 @@
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from weconnect import json_codec
+from weconnect.domain import Domain
+
+CODECS = [json_codec.JsonCodec()]
+if json_codec.SUPPORT_ORJSON:
+    CODECS.append(json_codec.OrjsonCodec())
+
+
+@pytest.mark.parametrize('codec', CODECS, ids=[codec.name for codec in CODECS])
+def test_Codec(codec):
+    value = {'timestamp': datetime(2024, 11, 3, 10, 20, 44, tzinfo=timezone.utc), 'domain': Domain.CHARGING, 'list': [1, 2.5, None, True],
+             'nested': {'empty': {}, 'text': 'ID.3'}}
+    expected = {'timestamp': '2024-11-03T10:20:44+00:00', 'domain': 'charging', 'list': [1, 2.5, None, True],
+                'nested': {'empty': {}, 'text': 'ID.3'}}
+
+    assert codec.loads(codec.dumps(value)) == expected
+    assert codec.loads(codec.dumps(value).encode('utf-8')) == expected
+    # Same layout as json.dumps(indent=4)
+    assert codec.dumps(value, indent=True) == json.dumps(expected, indent=4)
+
+    with pytest.raises(TypeError):
+        codec.dumps({'object': object()})
+    assert codec.loads(codec.dumps({'object': object()}, unknownAsNull=True)) == {'object': None}
+    # Keys that are no strings are handled like the json module does
+    assert codec.dumps({1: 'a'}) == json.dumps({1: 'a'})
+
+    with pytest.raises(json.JSONDecodeError):
+        codec.loads(b'{"incomplete": ')
+
+
+def test_SetCodec():
+    codec = json_codec.getCodec()
+    try:
+        json_codec.setCodec(json_codec.JsonCodec())
+        assert json_codec.getCodec().name == 'json'
+        assert json_codec.loads(json_codec.dumps({'domain': Domain.ACCESS})) == {'domain': 'access'}
+    finally:
+        json_codec.setCodec(codec)
@@ -0,0 +1,69 @@
+import threading
+
+import pytest
+
+from weconnect.read_write_lock import ReadWriteLock
+
+
+def runInThread(target):
+    result = {}
+
+    def run():
+        result['value'] = target()
+    thread = threading.Thread(target=run)
+    thread.start()
+    thread.join(timeout=5)
+    return result.get('value')
+
+
+def test_ReadersShareTheLock():
+    lock = ReadWriteLock()
+    with lock.read():
+        assert runInThread(lambda: lock.acquireRead(timeout=1) and lock.releaseRead() is None)
+
+
+def test_WriterIsExclusive():
+    lock = ReadWriteLock()
+    writing = threading.Event()
+    release = threading.Event()
+    order = []
+
+    def writer():
+        with lock.write():
+            writing.set()
+            release.wait(timeout=5)
+            order.append('writer')
+
+    def reader():
+        with lock.read():
+            order.append('reader')
+
+    writerThread = threading.Thread(target=writer)
+    writerThread.start()
+    writing.wait(timeout=5)
+    readerThread = threading.Thread(target=reader)
+    readerThread.start()
+    readerThread.join(timeout=0.1)
+    # The reader waits for the writer
+    assert order == []
+    release.set()
+    writerThread.join(timeout=5)
+    readerThread.join(timeout=5)
+    assert order == ['writer', 'reader']
+
+
+def test_Reentrancy():
+    lock = ReadWriteLock()
+    with lock:
+        with lock.write():
+            # The writer can read, e.g. in observers
+            with lock.read():
+                pass
+        # Other threads cannot get the lock before the outermost write is released
+        assert runInThread(lambda: lock.acquireRead(timeout=0.05)) is False
+    assert runInThread(lambda: lock.acquireWrite(timeout=1) and lock.releaseWrite() is None)
+
+    with lock.read():
+        with lock.read():
+            with pytest.raises(RuntimeError):
+                lock.acquireWrite()
@@ -0,0 +1,37 @@
+import pytest
+
+from weconnect.addressable import AddressableObject, AddressableAttribute, AddressableDict
+from weconnect.snapshot import takeSnapshot
+
+
+def test_Snapshot():
+    root = AddressableObject(localAddress='', parent=None)
+    vehicles = AddressableDict(localAddress='vehicles', parent=root)
+    for vin in ['VIN1', 'VIN2']:
+        vehicle = AddressableObject(localAddress=vin, parent=vehicles)
+        vehicle.soc = AddressableAttribute(localAddress='soc', parent=vehicle, value=50, valueType=int)
+        vehicle.nickname = AddressableAttribute(localAddress='nickname', parent=vehicle, value=vin.lower(), valueType=str)
+        vehicles[vin] = vehicle
+
+    snapshot = takeSnapshot(root)
+    assert snapshot.getByAddressString('vehicles/VIN1').soc.value == 50
+    assert snapshot.getByAddressString('vehicles/VIN2/nickname').value == 'vin2'
+    assert snapshot.getByAddressString('vehicles/VIN3') is None
+    assert snapshot.asDict() == {'vehicles': {'VIN1': {'soc': 50, 'nickname': 'vin1'}, 'VIN2': {'soc': 50, 'nickname': 'vin2'}}}
+    with pytest.raises(AttributeError):
+        snapshot.vehicles = None
+
+    vehicles['VIN1'].soc.setValueWithCarTime(60, fromServer=True)
+    vehicles['VIN2'].nickname.enabled = False
+
+    # Older snapshots do not change
+    assert snapshot.getByAddressString('vehicles/VIN1').soc.value == 50
+    assert 'nickname' in snapshot.getByAddressString('vehicles/VIN2')
+
+    newSnapshot = takeSnapshot(root, snapshot)
+    assert newSnapshot.getByAddressString('vehicles/VIN1').soc.value == 60
+    assert 'nickname' not in newSnapshot.getByAddressString('vehicles/VIN2')
+    # Unchanged parts are shared
+    assert newSnapshot.getByAddressString('vehicles/VIN1').nickname is snapshot.getByAddressString('vehicles/VIN1').nickname
+    assert newSnapshot.getByAddressString('vehicles/VIN2') is not snapshot.getByAddressString('vehicles/VIN2')
+    assert takeSnapshot(root, newSnapshot) is newSnapshot
@@ -0,0 +1,87 @@
+import json
+import os
+from datetime import datetime, timezone
+
+import pytest
+
+from weconnect.addressable import AddressableAttribute, AddressableLeaf
+from weconnect.domain import Domain
+from weconnect.elements.vehicle import SUPPORT_IMAGES
+from weconnect.state import StateError
+from weconnect.weconnect import WeConnect
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'ressources', 'vehicles', 'ID3')
+VIN = 'WVWZZZE1ZMP000001'
+
+
+def restoredWeConnect():
+    cache = {}
+    baseUrl = 'https://emea.bff.cariad.digital/vehicle/v1'
+    for url, name in [('/vehicles', 'vehicles'), (f'/vehicles/{VIN}/selectivestatus?jobs=all', 'selectivestatus'),
+                      (f'/vehicles/{VIN}/parkingposition', 'parkingposition'), (f'/trips/{VIN}/shortterm/last', 'trip')]:
+        with open(os.path.join(FIXTURES, f'{name}.json'), 'r', encoding='utf8') as file:
+            cache[baseUrl + url] = [json.load(file), '2024-11-03 10:20:44.000000']
+    weConnect = WeConnect(username='user', password='password', updateAfterLogin=False)
+    weConnect.fillCacheFromJsonString(json.dumps(cache), maxAge=300)
+    weConnect.restore(updatePictures=False)
+    return weConnect
+
+
+def test_SaveAndLoadState(tmp_path):
+    weConnect = restoredWeConnect()
+    vehicle = weConnect.vehicles[VIN]
+    soc = vehicle.domains['charging']['batteryStatus'].currentSOC_pct
+    lastChange = datetime(2024, 11, 3, 8, 0, tzinfo=timezone.utc)
+    soc.lastChange = lastChange
+    vehicle.trips.enabled = False
+    vehicle.enableTracker()
+    vehicle.requestTracker.requests[Domain.CLIMATISATION] = [('request1', lastChange, lastChange)]
+    # Observers of the application are not saved
+    soc.addObserver(lambda element, flags: None, AddressableLeaf.ObserverEvent.VALUE_CHANGED)
+    if SUPPORT_IMAGES:
+        from PIL import Image  # pylint: disable=import-outside-toplevel
+        vehicle.pictures['car'] = AddressableAttribute(localAddress='car', parent=vehicle.pictures, value=Image.new('RGB', (4, 2), 'red'),
+                                                       valueType=Image.Image)
+
+    path = str(tmp_path / 'state.bin')
+    weConnect.saveState(path)
+
+    loaded = WeConnect(username='user', password='password', updateAfterLogin=False)
+    loaded.loadState(path)
+    loadedVehicle = loaded.vehicles[VIN]
+    assert loadedVehicle.weConnect is loaded
+    assert loadedVehicle.parent is loaded.vehicles
+    assert loadedVehicle.toJSON() == vehicle.toJSON()
+
+    loadedSoc = loadedVehicle.domains['charging']['batteryStatus'].currentSOC_pct
+    assert loadedSoc.value == soc.value
+    assert loadedSoc.lastChange == lastChange
+    assert loadedSoc.lastUpdateFromServer == soc.lastUpdateFromServer
+    assert loadedSoc.lastUpdateFromCar == soc.lastUpdateFromCar
+    assert loadedSoc.getGlobalAddress() == f'/vehicles/{VIN}/domains/charging/batteryStatus/currentSOC_pct'
+    assert not loadedVehicle.trips.enabled
+    assert loadedVehicle.loaded
+    assert loadedVehicle.requestTracker.requests == {Domain.CLIMATISATION: [('request1', lastChange, lastChange)]}
+    assert not loadedSoc.getObservers(AddressableLeaf.ObserverEvent.VALUE_CHANGED)
+    if SUPPORT_IMAGES:
+        assert loadedVehicle.pictures['car'].value.tobytes() == vehicle.pictures['car'].value.tobytes()
+
+    # The loaded tree works like a parsed one
+    changes = []
+    loadedSoc.addObserver(lambda element, flags: changes.append(element.value), AddressableLeaf.ObserverEvent.VALUE_CHANGED)
+    loadedSoc.setValueWithCarTime(12, fromServer=True)
+    assert changes == [12]
+    assert loadedVehicle.controls.climatizationControl.valueSetter.__self__ is loadedVehicle.controls
+    assert loadedSoc.version > soc.version
+    assert loaded.snapshot().vehicles[VIN].nickname.value == vehicle.nickname.value
+
+
+def test_LoadStateErrors(tmp_path):
+    weConnect = WeConnect(username='user', password='password', updateAfterLogin=False)
+    path = tmp_path / 'state.bin'
+    path.write_bytes(b'{"vehicles": []}')
+    with pytest.raises(StateError):
+        weConnect.loadState(str(path))
+    path.write_bytes(b'WCSTATE' + b'\x01\x00\x03\x000.1' + b'garbage')
+    with pytest.raises(StateError, match='version 0.1'):
+        weConnect.loadState(str(path))
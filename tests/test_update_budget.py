@@ -0,0 +1,97 @@
+from typing import List
+
+import time
+
+import pytest
+import requests
+
+from benchmarks.fixtures import FixtureAdapter, fixtureWeConnect, fleetVin
+from weconnect.errors import DeadlineExceededError, RetrievalError
+from weconnect.update_budget import UpdateBudget, budgeted
+
+
+def test_RequestTimeout():
+    budget = UpdateBudget(deadline=time.monotonic() + 10)
+    assert budget.requestTimeout(2) == 2
+    assert 9 < budget.requestTimeout(60) <= 10
+    assert 9 < budget.requestTimeout() <= 10
+    # Retried requests share the remaining time
+    assert 2 < budget.requestTimeout(60, attempts=4) <= 2.5
+
+    budget = UpdateBudget(deadline=time.monotonic() + UpdateBudget.MIN_REQUEST_TIME / 2)
+    with pytest.raises(DeadlineExceededError):
+        budget.requestTimeout(2)
+
+
+def test_RunDeferred():
+    budget = UpdateBudget(deadline=time.monotonic() + 10)
+    order = []
+
+    def exceedDeadline():
+        raise DeadlineExceededError()
+
+    def fail():
+        raise RetrievalError()
+
+    budget.defer(UpdateBudget.Priority.CHARGING_STATIONS, 'chargingStations', lambda: order.append('chargingStations'))
+    budget.defer(UpdateBudget.Priority.PICTURES, 'VIN1/pictures', exceedDeadline)
+    budget.defer(UpdateBudget.Priority.TRIPS, 'VIN1/trips', fail)
+    budget.defer(UpdateBudget.Priority.PARKING_POSITION, 'VIN1/parkingPosition', lambda: order.append('VIN1/parkingPosition'))
+    budget.defer(UpdateBudget.Priority.PARKING_POSITION, 'VIN2/parkingPosition', lambda: order.append('VIN2/parkingPosition'))
+
+    # A failing part does not stop the others
+    with pytest.raises(RetrievalError):
+        budget.runDeferred()
+    assert order == ['VIN1/parkingPosition', 'VIN2/parkingPosition', 'chargingStations']
+    assert budget.skipped == ['VIN1/pictures']
+
+    budget = UpdateBudget(deadline=time.monotonic())
+    budget.defer(UpdateBudget.Priority.PICTURES, 'VIN1/pictures', lambda: order.append('VIN1/pictures'))
+    budget.runDeferred()
+    assert 'VIN1/pictures' not in order
+    assert budget.skipped == ['VIN1/pictures']
+
+
+class StallingAdapter(FixtureAdapter):
+    """Server that never answers the status requests. Every attempt waits for its timeout, failed requests are attempted again like
+    HTTPAdapter does with max_retries and end with a ConnectionError."""
+
+    def __init__(self, attempts: int) -> None:
+        super().__init__()
+        self.attempts: int = attempts
+        self.timeouts: List[float] = []
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None,  # pylint: disable=too-many-arguments,too-many-positional-arguments
+             proxies=None):
+        if not request.url.split('?')[0].endswith('/selectivestatus'):
+            return super().send(request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+        for _ in range(self.attempts):
+            self.timeouts.append(timeout)
+            time.sleep(timeout)
+        raise requests.exceptions.ConnectionError('Max retries exceeded (read timed out)')
+
+
+def test_DeadlineWithRetries():
+    adapter = StallingAdapter(attempts=4)
+    weConnect = fixtureWeConnect(adapter, numRetries=3)
+
+    start = time.monotonic()
+    weConnect.update(updatePictures=False, deadline=start + 2)
+    # All attempts together stay within the deadline
+    assert time.monotonic() - start < 2.5
+    assert adapter.timeouts and all(timeout <= 0.5 for timeout in adapter.timeouts)
+    assert f'vehicles/{fleetVin(adapter.fixtures, 0)}' in weConnect.lastUpdateSkipped
+
+
+def test_SessionRequestTimeout():
+    weConnect = fixtureWeConnect(FixtureAdapter(), numRetries=3, timeout=60)
+    session = weConnect.session
+    assert session.requestTimeout() == 60
+
+    # Logins and token refreshes of the session are budgeted as well
+    with budgeted(UpdateBudget(deadline=time.monotonic() + 10)):
+        assert 2 < session.requestTimeout() <= 2.5
+        assert session.requestTimeout(1) == 1
+    with budgeted(UpdateBudget(deadline=time.monotonic())):
+        with pytest.raises(DeadlineExceededError):
+            session.login()
@@ -0,0 +1,55 @@
+import os
+import subprocess
+import sys
+from datetime import datetime, timezone
+
+import pytest
+
+from weconnect.util import robustTimeParse, LazyModule, isImage
+
+
+@pytest.mark.parametrize('timeString, expected', [
+    ('2024-11-03T10:20:44Z', datetime(2024, 11, 3, 10, 20, 44, tzinfo=timezone.utc)),
+    ('2024-11-03T10:20:44.123Z', datetime(2024, 11, 3, 10, 20, 44, tzinfo=timezone.utc)),
+    ('2024-11-03T10:20:44.1+00:00', datetime(2024, 11, 3, 10, 20, 44, tzinfo=timezone.utc)),
+    ('2024-11-03T12:20:44+02:00', datetime(2024, 11, 3, 10, 20, 44, tzinfo=timezone.utc)),
+])
+def test_robustTimeParse(timeString, expected):
+    assert robustTimeParse(timeString) == expected
+    # Memoized results are the same
+    assert robustTimeParse(timeString) == expected
+
+
+def test_robustTimeParseInvalid():
+    with pytest.raises(ValueError):
+        robustTimeParse('2024-13-03T10:20:44Z')
+    with pytest.raises(ValueError):
+        robustTimeParse('not a time')
+
+
+def test_LazyImports():
+    # Importing the library does not import the image stack or the modules of statuses not seen yet
+    code = ('import sys\n'
+            'import weconnect.weconnect\n'
+            'print(",".join(name for name in ("PIL", "PIL.Image", "ascii_magic", "weconnect.elements.battery_status") if name in sys.modules))\n')
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == ''
+
+
+def test_LazyModule():
+    module = LazyModule('json')
+    assert module.dumps([1]) == '[1]'
+    assert not isImage('image')
+
+
+def test_imgToASCIIArtImportFails(tmp_path):
+    pytest.importorskip('PIL')
+    # ascii_magic is found, but importing it fails
+    (tmp_path / 'ascii_magic.py').write_text('raise ImportError("No module named colorama")\n', encoding='utf8')
+    code = ('from PIL import Image\n'
+            'from weconnect import util, addressable\n'
+            'assert util.SUPPORT_ASCII_IMAGES and addressable.SUPPORT_ASCII_IMAGES\n'
+            'print(repr(util.imgToASCIIArt(Image.new("RGBA", (2, 2), (255, 0, 0, 255)))))\n')
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(tmp_path)] + sys.path))
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True, env=env)
+    assert result.stdout.strip() == "''"
@@ -0,0 +1,199 @@
+import json
+import os
+import threading
+import time
+
+import pytest
+
+from benchmarks.fixtures import FixtureAdapter, fixtureWeConnect, fleetVin
+from weconnect.auth.we_connect_session import WeConnectSession
+from weconnect.errors import RetrievalError
+from weconnect.weconnect import WeConnect
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'ressources', 'vehicles', 'ID3')
+
+
+def test_BackgroundLoad(monkeypatch):
+    loggedIn = threading.Event()
+    release = threading.Event()
+    seenDuringLoad = []
+
+    def login(self):
+        del self
+        loggedIn.set()
+        release.wait(timeout=5)
+
+    def fetchData(self, url, force=False, allowEmpty=False, allowHttpError=False, allowedErrors=None):
+        del force, allowEmpty, allowHttpError, allowedErrors
+        if url.endswith('/vehicles'):
+            return {'data': [{'vin': 'VIN1', 'nickname': 'ID.3'}]}
+        if url.endswith('/selectivestatus?jobs=' + ','.join(self.vehicles['VIN1'].planJobs())):
+            # The vehicle is in the tree before its statuses are fetched
+            seenDuringLoad.append(self.vehicles['VIN1'].loaded)
+        return {}
+    monkeypatch.setattr(WeConnectSession, 'login', login)
+    monkeypatch.setattr(WeConnect, 'fetchData', fetchData)
+
+    start = time.monotonic()
+    weConnect = WeConnect(username='user', password='password', loginOnInit=True, updatePictures=False, backgroundLoad=True)
+    assert time.monotonic() - start < 1
+    assert loggedIn.wait(timeout=5)
+    assert not weConnect.ready.done()
+
+    release.set()
+    weConnect.waitUntilReady(timeout=5)
+    assert seenDuringLoad == [False]
+    assert weConnect.vehicles['VIN1'].nickname.value == 'ID.3'
+    assert weConnect.vehicles['VIN1'].loaded
+    assert weConnect.vehicles['VIN1'].waitUntilLoaded(timeout=0)
+
+
+def test_UpdateDuringBackgroundLoad(monkeypatch):
+    backgroundLoading = threading.Event()
+    release = threading.Event()
+    inTreeDuringFetch = {}
+
+    def fetchData(self, url, force=False, allowEmpty=False, allowHttpError=False, allowedErrors=None):
+        del force, allowEmpty, allowHttpError, allowedErrors
+        if url.endswith('/vehicles'):
+            if threading.current_thread() is not threading.main_thread():
+                backgroundLoading.set()
+                release.wait(timeout=5)
+            return {'data': [{'vin': 'VIN1', 'nickname': 'ID.3'}]}
+        if '/selectivestatus' in url:
+            inTreeDuringFetch.setdefault(threading.current_thread().name, 'VIN1' in self.vehicles)
+        return {}
+    monkeypatch.setattr(WeConnect, 'fetchData', fetchData)
+
+    weConnect = WeConnect(username='user', password='password', loginOnInit=False, updatePictures=False, backgroundLoad=True)
+    assert backgroundLoading.wait(timeout=5)
+    # An update of the caller while the initial load runs fetches the statuses before the vehicle is added
+    weConnect.update(updatePictures=False)
+    assert inTreeDuringFetch == {threading.main_thread().name: False}
+    assert weConnect.vehicles['VIN1'].loaded
+
+    release.set()
+    weConnect.waitUntilReady(timeout=5)
+
+
+def test_BackgroundLoadFailed(monkeypatch):
+    def fetchData(self, url, force=False, allowEmpty=False, allowHttpError=False, allowedErrors=None):
+        del self, url, force, allowEmpty, allowHttpError, allowedErrors
+        raise RetrievalError('No connection')
+    monkeypatch.setattr(WeConnect, 'fetchData', fetchData)
+
+    weConnect = WeConnect(username='user', password='password', backgroundLoad=True)
+    with pytest.raises(RetrievalError):
+        weConnect.waitUntilReady(timeout=5)
+    assert isinstance(weConnect.ready.exception(), RetrievalError)
+
+
+def test_Restore(monkeypatch):
+    def load(name):
+        with open(os.path.join(FIXTURES, f'{name}.json'), 'r', encoding='utf8') as file:
+            return json.load(file)
+
+    def get(url, **kwargs):
+        raise AssertionError(f'Restoring requested {url}')
+    monkeypatch.setattr(WeConnectSession, 'login', get)
+    monkeypatch.setattr(WeConnectSession, 'get', get)
+
+    weConnect = WeConnect(username='user', password='password', updateAfterLogin=False, updatePictures=False)
+    assert not weConnect.restore()
+
+    vin = 'WVWZZZE1ZMP000001'
+    cacheDate = '2024-11-03 10:20:44.000000'
+    baseUrl = 'https://emea.bff.cariad.digital/vehicle/v1'
+    weConnect.fillCacheFromJsonString(json.dumps({
+        f'{baseUrl}/vehicles': [load('vehicles'), cacheDate],
+        # Recorded with another selection of jobs, the newest response of the endpoint is used
+        f'{baseUrl}/vehicles/{vin}/selectivestatus?jobs=all': [load('selectivestatus'), cacheDate],
+        f'{baseUrl}/vehicles/{vin}/parkingposition': [load('parkingposition'), cacheDate],
+        f'{baseUrl}/trips/{vin}/shortterm/last': [load('trip'), cacheDate],
+    }), maxAge=300)
+
+    assert weConnect.restore(updatePictures=False)
+    vehicle = weConnect.vehicles[vin]
+    assert vehicle.loaded
+    assert vehicle.domains['charging']['batteryStatus'].currentSOC_pct.enabled
+    assert vehicle.domains['parking']['parkingPosition'].latitude.enabled
+    assert 'shortTerm' in vehicle.trips
+    assert weConnect.snapshot().vehicles[vin].nickname.value == vehicle.nickname.value
+    # Restoring does not make the cache look fresh
+    assert weConnect.cache[f'{baseUrl}/vehicles'][1] == cacheDate
+
+
+def test_SnapshotKeepsStatusesPending():
+    adapter = FixtureAdapter(numVehicles=1)
+    weConnect = fixtureWeConnect(adapter, lazyDomains=True)
+    weConnect.update()
+    vin = fleetVin(adapter.fixtures, 0)
+    charging = dict.__getitem__(weConnect.vehicles[vin].domains, 'charging')
+    assert 'batteryStatus' in charging.pending
+
+    # The snapshot taken by update() holds the status without creating it in the tree
+    snapshot = weConnect.snapshot()
+    assert snapshot.getByAddressString(f'vehicles/{vin}/domains/charging/batteryStatus/currentSOC_pct').value == 63
+    assert 'batteryStatus' in snapshot.vehicles[vin].domains.charging.asDict()
+    assert 'batteryStatus' in charging.pending
+    assert not charging.isMaterialized('batteryStatus')
+
+    # Unchanged pending statuses are shared by the following snapshots
+    weConnect.update()
+    assert 'batteryStatus' in charging.pending
+    newSnapshot = weConnect.snapshot()
+    assert newSnapshot.vehicles[vin].domains.charging.rawChild('batteryStatus') is snapshot.vehicles[vin].domains.charging.rawChild('batteryStatus')
+
+
+def test_LazyDomainsUpdate():
+    adapter = FixtureAdapter(numVehicles=1)
+    weConnect = fixtureWeConnect(adapter, lazyDomains=True)
+    weConnect.update()
+    weConnect.update()
+    vin = fleetVin(adapter.fixtures, 0)
+    domains = weConnect.vehicles[vin].domains
+    charging = dict.__getitem__(domains, 'charging')
+    measurements = dict.__getitem__(domains, 'measurements')
+    # Statuses stay pending over updates, the ones the controls depend on are created right away
+    assert 'batteryStatus' in charging.pending
+    assert 'odometerStatus' in measurements.pending
+    assert charging.isMaterialized('chargingSettings')
+
+    # Created on access through the dict
+    assert domains['charging']['batteryStatus'].currentSOC_pct.value == 63
+    assert 'batteryStatus' not in charging.pending
+    assert charging.isMaterialized('batteryStatus')
+
+    # Created on access through the address
+    odometer = weConnect.getByAddressString(f'/vehicles/{vin}/domains/measurements/odometerStatus/odometer')
+    assert odometer.value == adapter.fixtures['selectivestatus']['measurements']['odometerStatus']['value']['odometer']
+    assert 'odometerStatus' not in measurements.pending
+    assert 'temperatureBatteryStatus' in measurements.pending
+
+
+def test_SnapshotKeptOnFailedUpdate(monkeypatch):
+    adapter = FixtureAdapter(numVehicles=1)
+    weConnect = fixtureWeConnect(adapter)
+    weConnect.update(updatePictures=False)
+    vin = fleetVin(adapter.fixtures, 0)
+    snapshot = weConnect.snapshot()
+    nickname = snapshot.getByAddressString(f'vehicles/{vin}/nickname').value
+
+    # The list of vehicles is applied, fetching the statuses fails afterwards
+    vehicles = json.loads(adapter.bodies['vehicles'])
+    vehicles['data'][0]['nickname'] = 'Renamed'
+    adapter.bodies['vehicles'] = json.dumps(vehicles).encode('utf-8')
+    fetchData = WeConnect.fetchData
+
+    def failingFetchData(self, url, *args, **kwargs):
+        if '/selectivestatus' in url:
+            raise RetrievalError('No connection')
+        return fetchData(self, url, *args, **kwargs)
+    monkeypatch.setattr(WeConnect, 'fetchData', failingFetchData)
+
+    with pytest.raises(RetrievalError):
+        weConnect.update(updatePictures=False)
+    assert weConnect.vehicles[vin].nickname.value == 'Renamed'
+    # Readers keep the snapshot of the last completed update
+    assert weConnect.snapshot() is snapshot
+    assert weConnect.snapshot().getByAddressString(f'vehicles/{vin}/nickname').value == nickname
@@ -1,20 +1,19 @@
 from __future__ import annotations
-from typing import Callable, NoReturn, Optional, Dict, List, Set, Any, Tuple, Union, Type, TypeVar, Generic
+from typing import TYPE_CHECKING, Callable, NoReturn, Optional, Dict, Iterable, Iterator, List, Set, Any, Tuple, Union, Type, TypeVar, Generic
 
-import json
+import itertools
 import logging
+import threading
 import time as timemodule
+from contextlib import contextmanager
 from datetime import datetime, timezone, time
 from enum import Enum, IntEnum, Flag, auto
 
-from weconnect.util import toBool, robustTimeParse, ExtendedWithNullEncoder
+from weconnect.util import toBool, robustTimeParse, isImage
+from weconnect import json_codec
 
-SUPPORT_IMAGES = False
-try:
-    from PIL import Image  # type: ignore
-    SUPPORT_IMAGES = True
-except ImportError:
-    pass
+if TYPE_CHECKING:
+    from weconnect.change_journal import ChangeJournal
 
 SUPPORT_ASCII_IMAGES = False
 try:
@@ -25,8 +24,72 @@ except ImportError:
 
 LOG: logging.Logger = logging.getLogger("weconnect")
 
+# Shared by all elements until the first observer is added to save an empty set per element
+NO_OBSERVERS: frozenset = frozenset()
+
+_timestampCache: Tuple[int, datetime] = (0, datetime.fromtimestamp(0, tz=timezone.utc))
+
+
+class _CycleClock(threading.local):
+    timestamp: Optional[datetime] = None
+
+
+_cycleClock: _CycleClock = _CycleClock()
+
+
+def utcNowSeconds() -> datetime:
+    """Current UTC time truncated to seconds. Calls within the same second return the same datetime object,
+    so the thousands of elements touched in one update share their timestamps instead of each holding a copy.
+    Within updateCycle() the timestamp of the cycle is returned."""
+    global _timestampCache  # pylint: disable=global-statement
+    timestamp: Optional[datetime] = _cycleClock.timestamp
+    if timestamp is not None:
+        return timestamp
+    seconds, timestamp = _timestampCache
+    now: int = int(timemodule.time())
+    if now != seconds:
+        timestamp = datetime.fromtimestamp(now, tz=timezone.utc)
+        _timestampCache = (now, timestamp)
+    return timestamp
+
+
+@contextmanager
+def updateCycle(timestamp: Optional[datetime] = None) -> Iterator[datetime]:
+    """Reads the clock once and stamps all lastUpdateFromServer, lastChange and change journal entries written by this thread
+    within the context with that time, or with timestamp if given. Nested contexts use the time of the outermost one."""
+    if _cycleClock.timestamp is not None:
+        yield _cycleClock.timestamp
+        return
+    if timestamp is None:
+        timestamp = utcNowSeconds()
+    _cycleClock.timestamp = timestamp
+    try:
+        yield timestamp
+    finally:
+        _cycleClock.timestamp = None
+
+
+def updateCycleTimestamp() -> Optional[datetime]:
+    """Timestamp of the update cycle running in this thread or None outside of a cycle"""
+    return _cycleClock.timestamp
+
+
+# Versions are handed out from one counter for all trees, next() on itertools.count is atomic and needs no lock
+_versionCounter: Iterator[int] = itertools.count(1)
+
+
+def nextVersion() -> int:
+    """Next value of the global monotonic version counter, every change to an element is assigned a new version."""
+    return next(_versionCounter)
+
 
 class AddressableLeaf():
+    # AddressableDict and AddressableList also derive from dict and list, this rules out instance slots on this common base.
+    # AddressableAttribute, which makes up the bulk of every tree, declares all fields as slots so its __dict__ is never populated.
+    LEAF_SLOTS: Tuple[str, ...] = ('_AddressableLeaf__enabled', '_AddressableLeaf__localAddress', '_AddressableLeaf__parent',
+                                   '_AddressableLeaf__observers', 'lastChange', 'lastUpdateFromServer', 'lastUpdateFromCar',
+                                   'onCompleteNotifyFlags', 'version')
+
     def __init__(
         self,
         localAddress: str,
@@ -35,12 +98,14 @@ class AddressableLeaf():
         self.__enabled: bool = False
         self.__localAddress: str = localAddress
         self.__parent: Optional[AddressableObject] = parent
-        self.__observers: Set[Tuple[Callable[[Optional[Any], AddressableLeaf.ObserverEvent], None],
-                                    AddressableLeaf.ObserverEvent, AddressableLeaf.ObserverPriority, bool]] = set()
+        self.__observers: Union[frozenset, Set[Tuple[Callable[[Optional[Any], AddressableLeaf.ObserverEvent], None],
+                                                     AddressableLeaf.ObserverEvent, AddressableLeaf.ObserverPriority, bool]]] = NO_OBSERVERS
         self.lastChange: Optional[datetime] = None
         self.lastUpdateFromServer: Optional[datetime] = None
         self.lastUpdateFromCar: Optional[datetime] = None
         self.onCompleteNotifyFlags: Optional[AddressableLeaf.ObserverEvent] = None
+        # Version of the last change of this element, for objects the last change anywhere in their subtree
+        self.version: int = 0
 
     def __del__(self) -> None:
         if self.enabled:
@@ -50,6 +115,8 @@ class AddressableLeaf():
                     onUpdateComplete: bool = False) -> None:
         if priority is None:
             priority = AddressableLeaf.ObserverPriority.USER_MID
+        if self.__observers is NO_OBSERVERS:
+            self.__observers = set()
         self.__observers.add((observer, flag, priority, onUpdateComplete))
         LOG.debug('%s: Observer added with flags: %s', self.getGlobalAddress(), flag)
 
@@ -72,6 +139,16 @@ class AddressableLeaf():
             observers.update(self.__parent.getObserverEntries(flags, onUpdateComplete))
         return sorted(observers, key=lambda entry: int(entry[2]))
 
+    def hasObservers(self, flags: AddressableLeaf.ObserverEvent) -> bool:
+        """True if this element or one of its parents has an observer for any of the flags, cheaper than getObservers"""
+        element: Optional[AddressableLeaf] = self
+        while element is not None:
+            for observerEntry in element.__observers:  # pylint: disable=protected-access
+                if observerEntry[1] & flags:
+                    return True
+            element = element.__parent  # pylint: disable=protected-access
+        return False
+
     def notify(self, flags: AddressableLeaf.ObserverEvent) -> None:
         observers: List[Callable] = self.getObservers(flags, onUpdateComplete=False)
         for observer in observers:
@@ -87,7 +164,8 @@ class AddressableLeaf():
                 self.onCompleteNotifyFlags |= flags
         else:
             self.onCompleteNotifyFlags = flags
-        LOG.debug('%s: Notify called with flags: %s for %d observers', self.getGlobalAddress(), flags, len(observers))
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug('%s: Notify called with flags: %s for %d observers', self.getGlobalAddress(), flags, len(observers))
 
     def updateComplete(self) -> None:
         if self.onCompleteNotifyFlags is not None:
@@ -99,19 +177,39 @@ class AddressableLeaf():
                           self.onCompleteNotifyFlags, len(observers))
             self.onCompleteNotifyFlags = None
 
+    def updateVersion(self, flags: AddressableLeaf.ObserverEvent, oldValue: Any = None, newValue: Any = None, address: Optional[str] = None) -> int:
+        version: int = nextVersion()
+        element: AddressableLeaf = self
+        element.version = version
+        while element.parent is not None:
+            element = element.parent
+            element.version = version
+        changeJournal: Optional[ChangeJournal] = getattr(element, 'changeJournal', None)
+        if changeJournal is not None:
+            changeJournal.record(version, address or self.getGlobalAddress(), oldValue, newValue, flags, utcNowSeconds())
+        return version
+
     @property
     def enabled(self) -> bool:
         return self.__enabled
 
     @enabled.setter
     def enabled(self, setEnabled: bool) -> None:
+        changed: bool = False
         if setEnabled and not self.__enabled:
             if self.parent is not None:
                 self.parent.addChild(self)
+            self.updateVersion(AddressableLeaf.ObserverEvent.ENABLED, newValue=self.value if isinstance(self, AddressableAttribute) else None)
             self.notify(AddressableLeaf.ObserverEvent.ENABLED)
+            changed = True
         elif not setEnabled and self.__enabled:
+            self.updateVersion(AddressableLeaf.ObserverEvent.DISABLED, oldValue=self.value if isinstance(self, AddressableAttribute) else None)
             self.notify(AddressableLeaf.ObserverEvent.DISABLED)
+            changed = True
         self.__enabled = setEnabled
+        # Invalidate after the state is set, observers called by notify may have already rebuilt the cache
+        if changed and self.__parent is not None:
+            self.__parent.invalidateLeafChildren()
 
     @property
     def localAddress(self) -> str:
@@ -119,7 +217,24 @@ class AddressableLeaf():
 
     @localAddress.setter
     def localAddress(self, newAdress: str) -> None:
+        if newAdress == self.__localAddress:
+            return
+        oldLocalAddress: str = self.__localAddress
+        oldGlobalAddress: str = self.getGlobalAddress()
         self.__localAddress = newAdress
+        if self.__enabled:
+            if self.__parent is not None:
+                self.__parent.renameChild(self, oldLocalAddress)
+            # Elements already in the tree moved, record them as removed at the old and added at the new address
+            globalAddress: str = self.getGlobalAddress()
+            elements: List[AddressableLeaf] = self.getRecursiveChildren() if isinstance(self, AddressableObject) else [self]
+            for element in elements:
+                value = element.value if isinstance(element, AddressableAttribute) else None
+                element.updateVersion(AddressableLeaf.ObserverEvent.DISABLED, oldValue=value,
+                                      address=oldGlobalAddress + element.getGlobalAddress()[len(globalAddress):])
+            for element in elements:
+                value = element.value if isinstance(element, AddressableAttribute) else None
+                element.updateVersion(AddressableLeaf.ObserverEvent.ENABLED, newValue=value)
 
     @property
     def parent(self) -> Optional[AddressableObject]:
@@ -177,7 +292,100 @@ class AddressableLeaf():
 T = TypeVar('T')
 
 
+def _convertIfNotEmpty(convert: Callable[[Any], Any]) -> Callable[[AddressableAttribute, Any, str], None]:
+    def converter(attribute: AddressableAttribute, value: Any, key: str) -> None:
+        del key
+        if isinstance(value, str) and not value:
+            attribute.enabled = False
+        else:
+            attribute.setValueWithCarTime(convert(value), lastUpdateFromCar=None, fromServer=True)
+    return converter
+
+
+def _parseTime(value: str) -> time:
+    parsedtime = timemodule.strptime(value, "%H:%M")
+    return time(hour=parsedtime.tm_hour, minute=parsedtime.tm_min)
+
+
+def _convertEnum(attribute: AddressableAttribute, value: Any, key: str) -> None:
+    if isinstance(value, str) and not value:
+        attribute.enabled = False
+        return
+    try:
+        attribute.setValueWithCarTime(attribute.valueType(value), lastUpdateFromCar=None, fromServer=True)
+    except ValueError:
+        attribute.setValueWithCarTime(attribute.valueType.UNKNOWN, lastUpdateFromCar=None, fromServer=True)
+        LOG.warning('%s: An unsupported %s: %s was provided, known values are [%s]'
+                    ' please report this as a bug', attribute.getGlobalAddress(), key, value,
+                    ', '.join([state.value for state in list(attribute.valueType)]))
+
+
+def _convertStr(attribute: AddressableAttribute, value: Any, key: str) -> None:
+    del key
+    attribute.setValueWithCarTime(str(value), lastUpdateFromCar=None, fromServer=True)
+
+
+def _convertUnknown(attribute: AddressableAttribute, value: Any, key: str) -> None:
+    del value, key
+    raise ValueError(f'Unknown attribute type {attribute.valueType}')
+
+
+_FROM_DICT_CONVERTERS: Dict[Any, Callable[[AddressableAttribute, Any, str], None]] = {}
+
+
+def fromDictConverter(valueType: Any) -> Callable[[AddressableAttribute, Any, str], None]:
+    """Converter used by AddressableAttribute.fromDict for valueType, resolved once per type and shared by all attributes"""
+    converter = _FROM_DICT_CONVERTERS.get(valueType)
+    if converter is None:
+        if not isinstance(valueType, type):
+            converter = _convertUnknown
+        elif issubclass(valueType, bool):
+            converter = _convertIfNotEmpty(toBool)
+        elif issubclass(valueType, int):
+            converter = _convertIfNotEmpty(int)
+        elif issubclass(valueType, float):
+            converter = _convertIfNotEmpty(float)
+        elif issubclass(valueType, Enum):
+            converter = _convertEnum
+        elif issubclass(valueType, datetime):
+            converter = _convertIfNotEmpty(robustTimeParse)
+        elif issubclass(valueType, time):
+            converter = _convertIfNotEmpty(_parseTime)
+        elif issubclass(valueType, str):
+            converter = _convertStr
+        else:
+            converter = _convertUnknown
+        _FROM_DICT_CONVERTERS[valueType] = converter
+    return converter
+
+
+def _newCollection(cls: type) -> Any:
+    return cls.__new__(cls)
+
+
+class _Unset:
+    """Marks slots that were never assigned in pickled attributes"""
+
+    def __reduce__(self) -> str:
+        return '_UNSET'
+
+
+_UNSET: _Unset = _Unset()
+_ALL_SLOTS: Dict[type, Tuple[str, ...]] = {}
+
+
+def _allSlots(cls: type) -> Tuple[str, ...]:
+    slots: Optional[Tuple[str, ...]] = _ALL_SLOTS.get(cls)
+    if slots is None:
+        slots = tuple(name for klass in reversed(cls.__mro__) for name in klass.__dict__.get('__slots__', ()))
+        _ALL_SLOTS[cls] = slots
+    return slots
+
+
 class AddressableAttribute(AddressableLeaf, Generic[T]):
+    __slots__ = AddressableLeaf.LEAF_SLOTS + ('_AddressableAttribute__value', '_AddressableAttribute__valueType', '_AddressableAttribute__converter',
+                                              'valueGetter', 'valueSetter')
+
     def __init__(
         self,
         localAddress: str,
@@ -190,44 +398,69 @@ class AddressableAttribute(AddressableLeaf, Generic[T]):
     ) -> None:
         super().__init__(localAddress, parent)
         self.__value: Optional[T] = None
-        self.valueType: Type[T] = valueType
+        self.valueType = valueType
         self.valueGetter = valueGetter
         self.valueSetter = valueSetter
         if value is not None:
             self.setValueWithCarTime(value, lastUpdateFromCar, fromServer=True)
 
+    def __reduce_ex__(self, protocol):
+        # The slot values are pickled in the order of allSlots() instead of a dict keyed by the slot names, that is smaller and faster
+        slots: Tuple[str, ...] = _allSlots(type(self))
+        return (_newCollection, (type(self),), tuple(getattr(self, name, _UNSET) for name in slots))
+
+    def __setstate__(self, state) -> None:
+        for name, value in zip(_allSlots(type(self)), state):
+            if value is not _UNSET:
+                object.__setattr__(self, name, value)
+
     @property
     def value(self) -> Optional[T]:
         if self.valueGetter is not None:
             return self.valueGetter()
         return self.__value
 
+    @property
+    def valueType(self) -> Type[T]:
+        return self.__valueType
+
+    @valueType.setter
+    def valueType(self, valueType: Type[T]) -> None:
+        self.__valueType = valueType
+        self.__converter = fromDictConverter(valueType)
+
     @value.setter
     def value(self, newValue: Optional[T]) -> NoReturn:
         raise NotImplementedError('You cannot set this attribute. Set is not implemented')
 
-    def asDict(self, filterCallable: Optional[Callable[[Any], None]] = None):
+    def asDict(self, filterCallable: Optional[Callable[[Any], None]] = None, sinceVersion: Optional[int] = None):
+        if sinceVersion is not None and self.version <= sinceVersion:
+            return None
         if filterCallable is None or not filterCallable(self.value):
             return self.value
         return None
 
-    def toJSON(self):
-        if SUPPORT_IMAGES and isinstance(self.value, Image.Image):
+    def toJSON(self, sinceVersion: Optional[int] = None):
+        if isImage(self.value):
+            return None
+        if sinceVersion is not None and self.version <= sinceVersion:
             return None
-        return json.dumps(self.value, cls=ExtendedWithNullEncoder, skipkeys=True, indent=4)
+        return json_codec.dumps(self.value, indent=True, unknownAsNull=True)
 
-    def setValueWithCarTime(self, newValue, lastUpdateFromCar: Optional[datetime] = None, fromServer: bool = False, noNotify: bool = False) -> None:
-        if newValue is not None and not isinstance(newValue, self.valueType):
-            raise ValueError(f'{self.getGlobalAddress()}: new value {newValue} must be of type {self.valueType}'
+    def setValueWithCarTime(self, newValue, lastUpdateFromCar: Optional[datetime] = None, fromServer: bool = False,  # noqa: C901
+                            noNotify: bool = False) -> None:
+        if newValue is not None and not isinstance(newValue, self.__valueType):
+            raise ValueError(f'{self.getGlobalAddress()}: new value {newValue} must be of type {self.__valueType}'
                              f' but is of type {type(newValue)}')
-        valueChanged: bool = newValue != self.__value
+        oldValue: Optional[T] = self.__value
+        valueChanged: bool = newValue != oldValue
         self.__value = newValue
         flags: Optional[AddressableLeaf.ObserverEvent] = None
         if not self.enabled:
             self.enabled = True
-        self.lastUpdateFromServer = datetime.utcnow().replace(microsecond=0, tzinfo=timezone.utc)
+        self.lastUpdateFromServer = utcNowSeconds()
         if valueChanged:
-            self.lastChange = datetime.utcnow().replace(microsecond=0, tzinfo=timezone.utc)
+            self.lastChange = self.lastUpdateFromServer
             flags = AddressableLeaf.ObserverEvent.VALUE_CHANGED
             if fromServer:
                 if flags is None:
@@ -244,6 +477,9 @@ class AddressableAttribute(AddressableLeaf, Generic[T]):
             else:
                 flags |= AddressableLeaf.ObserverEvent.UPDATED_FROM_CAR
 
+        if valueChanged:
+            self.updateVersion(flags, oldValue=oldValue, newValue=newValue)  # type: ignore
+
         if not noNotify and flags is not None:
             self.notify(flags)
 
@@ -254,13 +490,13 @@ class AddressableAttribute(AddressableLeaf, Generic[T]):
         if self.value is not None:
             if filename.endswith(('.txt', '.TXT', '.text')):
                 with open(filename, mode='w', encoding='utf8') as textfile:
-                    if SUPPORT_IMAGES and SUPPORT_ASCII_IMAGES and isinstance(self.value, Image.Image):
+                    if SUPPORT_ASCII_IMAGES and isImage(self.value):
                         textfile.write(imgToASCIIArt(self.value, columns=120, mode=ASCIIModes.ASCII))
                     else:
                         textfile.write(str(self))
             elif filename.endswith(('.htm', '.HTM', '.html', '.HTML')):
                 with open(filename, mode='w', encoding='utf8') as htmlfile:
-                    if SUPPORT_IMAGES and SUPPORT_ASCII_IMAGES and isinstance(self.value, Image.Image):
+                    if SUPPORT_ASCII_IMAGES and isImage(self.value):
                         html = """<!DOCTYPE html><head><title>ASCII art</title></head><body><pre style="display: inline-block; border-width: 4px 6px;
     border-color: black; border-style: solid; background-color:black; font-size: 8px;">"""
                         htmlfile.write(html)
@@ -270,18 +506,18 @@ class AddressableAttribute(AddressableLeaf, Generic[T]):
                         htmlfile.write(str(self))
             elif filename.endswith(('.json')):
                 with open(filename, mode='w', encoding='utf8') as textfile:
-                    if SUPPORT_IMAGES and SUPPORT_ASCII_IMAGES and isinstance(self.value, Image.Image):
+                    if SUPPORT_ASCII_IMAGES and isImage(self.value):
                         raise ValueError('Attribute is an image and cannot be converted to json')
                     textfile.write(self.toJSON() + '\n')
             elif filename.endswith(('.png', '.PNG')):
                 with open(filename, mode='wb') as pngfile:
-                    if SUPPORT_IMAGES and isinstance(self.value, Image.Image):
+                    if isImage(self.value):
                         self.value.save(fp=pngfile, format='PNG')  # pylint: disable=no-member
                     else:
                         raise ValueError('Attribute is no image and cannot be converted to one')
             elif filename.endswith(('.jpg', '.JPG', '.jpeg', '.JPEG')):
                 with open(filename, mode='wb') as jpgfile:
-                    if SUPPORT_IMAGES and isinstance(self.value, Image.Image):
+                    if isImage(self.value):
                         if self.value.mode in ("RGBA", "P"):  # pylint: disable=no-member
                             raise ValueError('Image contains transparency and thus cannot be saved as jpeg-file')
                         self.value.save(fp=jpgfile, format='JPEG')  # pylint: disable=no-member
@@ -292,63 +528,101 @@ class AddressableAttribute(AddressableLeaf, Generic[T]):
         else:
             raise ValueError('I cannot save None value')
 
-    def fromDict(self, fromDict: dict, key: str):  # noqa: C901
-        if fromDict is not None and key in fromDict and fromDict[key] is not None:
-            if issubclass(self.valueType, bool):
-                if not isinstance(fromDict[key], str) or len(fromDict[key]) > 0:
-                    self.setValueWithCarTime(toBool(fromDict[key]), lastUpdateFromCar=None, fromServer=True)
-                else:
-                    self.enabled = False
-            elif issubclass(self.valueType, int):
-                if not isinstance(fromDict[key], str) or len(fromDict[key]) > 0:
-                    self.setValueWithCarTime(int(fromDict[key]), lastUpdateFromCar=None, fromServer=True)
-                else:
-                    self.enabled = False
-            elif issubclass(self.valueType, float):
-                if not isinstance(fromDict[key], str) or len(fromDict[key]) > 0:
-                    self.setValueWithCarTime(float(fromDict[key]), lastUpdateFromCar=None, fromServer=True)
-                else:
-                    self.enabled = False
-            elif issubclass(self.valueType, Enum):
-                if not isinstance(fromDict[key], str) or len(fromDict[key]) > 0:
-                    try:
-                        self.setValueWithCarTime(self.valueType(fromDict[key]), lastUpdateFromCar=None, fromServer=True)
-                    except ValueError:
-                        self.setValueWithCarTime(self.valueType.UNKNOWN, lastUpdateFromCar=None, fromServer=True)
-                        LOG.warning('%s: An unsupported %s: %s was provided, known values are [%s]'
-                                    ' please report this as a bug', self.getGlobalAddress(), key, fromDict[key],
-                                    ', '.join([state.value for state in list(self.valueType)]))
-                else:
-                    self.enabled = False
-            elif issubclass(self.valueType, datetime):
-                if not isinstance(fromDict[key], str) or len(fromDict[key]) > 0:
-                    self.setValueWithCarTime(robustTimeParse(fromDict[key]), lastUpdateFromCar=None, fromServer=True)
-                else:
-                    self.enabled = False
-            elif issubclass(self.valueType, time):
-                if not isinstance(fromDict[key], str) or len(fromDict[key]) > 0:
-                    parsedtime = timemodule.strptime(fromDict[key], "%H:%M")
-                    self.setValueWithCarTime(time(hour=parsedtime.tm_hour, minute=parsedtime.tm_min), lastUpdateFromCar=None, fromServer=True)
-                else:
-                    self.enabled = False
-            elif issubclass(self.valueType, str):
-                self.setValueWithCarTime(str(fromDict[key]), lastUpdateFromCar=None, fromServer=True)
-            else:
-                raise ValueError(f'Unknown attribute type {self.valueType}')
-        else:
-            self.enabled = False
+    def fromDict(self, fromDict: dict, key: str):
+        if fromDict is not None:
+            value = fromDict.get(key)
+            if value is not None:
+                self.__converter(self, value, key)
+                return
+        self.enabled = False
 
     def __str__(self) -> str:
         if isinstance(self.value, Enum):
             return str(self.value.value)  # pylint: disable=no-member
         if isinstance(self.value, datetime):
             return self.value.isoformat()  # pylint: disable=no-member
-        if SUPPORT_IMAGES and isinstance(self.value, Image.Image):
+        if SUPPORT_ASCII_IMAGES and isImage(self.value):
             return imgToASCIIArt(self.value)  # pylint: disable=no-member
         return str(self.value)
 
 
+def _valueFormat(valueType) -> str:
+    if valueType == int:
+        return 'N (Decimal number)'
+    if valueType == float:
+        return 'F.F (Floating Point Number)'
+    if valueType == bool:
+        return 'True/False (Boolean)'
+    if isinstance(valueType, type) and issubclass(valueType, Enum):
+        try:
+            return 'select one of [' + ', '.join([enum.value for enum in valueType.allowedValues()]) + ']'
+        except AttributeError:
+            return 'select one of [' + ', '.join([enum.value for enum in valueType])
+    return ''
+
+
+def _enumParser(valueType: Type[Enum]) -> Callable[[str], Enum]:
+    def parse(value: str) -> Enum:
+        newValue = valueType(value)
+        try:
+            allowedValues = valueType.allowedValues()  # type: ignore
+            if newValue not in allowedValues:
+                raise ValueError('Value is not in allowed values')
+        except AttributeError:
+            pass
+        return newValue
+    return parse
+
+
+_VALUE_COERCIONS: Dict[Any, Callable[[Any], Tuple[Any, List[str]]]] = {}
+
+
+def valueCoercion(valueType: Any) -> Callable[[Any], Tuple[Any, List[str]]]:  # noqa: C901
+    """Coercion used by ChangeableAttribute.value for valueType (a type or a tuple of types), resolved once per type.
+    It converts strings and ints to the first matching type and returns the value and the formats of the types that failed."""
+    coercion = _VALUE_COERCIONS.get(valueType)
+    if coercion is not None:
+        return coercion
+
+    # One step per type: the type, a parser for strings (None if strings are kept) and if parsing ends the search
+    steps: List[Tuple[Any, Optional[Callable[[str], Any]], bool]] = []
+    for valType in (valueType if isinstance(valueType, tuple) else (valueType,)):
+        if valType in (int, float):
+            steps.append((valType, valType, False))
+        elif valType == bool:
+            steps.append((valType, toBool, False))
+        elif isinstance(valType, type) and issubclass(valType, Enum):
+            steps.append((valType, _enumParser(valType), True))
+        else:
+            steps.append((valType, None, False))
+
+    def coerce(newValue: Any) -> Tuple[Any, List[str]]:
+        exceptions: List[str] = []
+        for valType, parse, final in steps:
+            if isinstance(newValue, str) and valType != str:
+                if parse is not None:
+                    try:
+                        newValue = parse(newValue)
+                        exceptions = []
+                        if final:
+                            break
+                    except ValueError:
+                        exceptions.append(_valueFormat(valType))
+            elif isinstance(newValue, int) and valType != int:
+                if valType == float:
+                    newValue = float(newValue)
+                    exceptions = []
+                    break
+            else:
+                exceptions = []
+        return newValue, exceptions
+    _VALUE_COERCIONS[valueType] = coerce
+    return coerce
+
+
 class ChangeableAttribute(AddressableAttribute):
+    __slots__ = ('_ChangeableAttribute__coercion',)
+
     def __init__(
         self,
         localAddress: str,
@@ -362,57 +636,14 @@ class ChangeableAttribute(AddressableAttribute):
         super().__init__(localAddress=localAddress, parent=parent, value=value, valueType=valueType,
                          lastUpdateFromCar=lastUpdateFromCar, valueGetter=valueGetter, valueSetter=valueSetter)
 
-    @AddressableAttribute.value.setter  # type: ignore # noqa: C901
-    def value(self, newValue):  # noqa: C901
-        exceptions = []
-
-        iterablevalueType = self.valueType
-        if not isinstance(iterablevalueType, tuple):
-            iterablevalueType = (iterablevalueType,)
-        for valType in iterablevalueType:  # pylint: disable=too-many-nested-blocks
-            if isinstance(newValue, str) and valType != str:
-                try:
-                    if valType in [int, float]:
-                        newValue = valType(newValue)
-                        exceptions = []
-                    elif valType == bool:
-                        newValue = toBool(newValue)
-                        exceptions = []
-                    elif issubclass(valType, Enum):
-                        if not isinstance(newValue, Enum):
-                            newValue = valType(newValue)
-                            exceptions = []
-                        try:
-                            allowedValues = valType.allowedValues()
-                            if newValue not in allowedValues:
-                                raise ValueError('Value is not in allowed values')
-                        except AttributeError:
-                            pass
-                        newValue = valType(newValue)
-                        exceptions = []
-                        break
-                except ValueError:
-                    valueFormat = ''
-                    if valType == int:
-                        valueFormat = 'N (Decimal number)'
-                    elif valType == float:
-                        valueFormat = 'F.F (Floating Point Number)'
-                    elif valType == bool:
-                        valueFormat = 'True/False (Boolean)'
-                    elif issubclass(valType, Enum):
-                        try:
-                            valueFormat = 'select one of [' + ', '.join([enum.value for enum in valType.allowedValues()]) + ']'
-                        except AttributeError:
-                            valueFormat = 'select one of [' + ', '.join([enum.value for enum in valType])
-                    exceptions.append(valueFormat)
-            elif isinstance(newValue, int) and valType != int:
-                if valType == float:
-                    newValue = float(newValue)
-                    exceptions = []
-                    break
-            else:
-                exceptions = []
+    @AddressableAttribute.valueType.setter  # type: ignore
+    def valueType(self, valueType) -> None:
+        AddressableAttribute.valueType.fset(self, valueType)  # type: ignore
+        self.__coercion = valueCoercion(valueType)
 
+    @AddressableAttribute.value.setter  # type: ignore
+    def value(self, newValue):
+        newValue, exceptions = self.__coercion(newValue)
         if exceptions:
             raise ValueError(f'id {self.getGlobalAddress()} cannot be set to value {newValue}.'
                              f' You need to provide it in the correct format {" or ".join(exceptions)}')
@@ -423,6 +654,8 @@ class ChangeableAttribute(AddressableAttribute):
 
 
 class AliasChangeableAttribute(ChangeableAttribute):
+    __slots__ = ('targetAttribute', 'conversion')
+
     def __init__(
         self,
         localAddress: str,
@@ -448,6 +681,9 @@ class AliasChangeableAttribute(ChangeableAttribute):
 
 
 class AddressableObject(AddressableLeaf):
+    # Set on the root of a tree to record all changes in the tree
+    changeJournal: Optional[ChangeJournal] = None
+
     def __init__(
         self,
         localAddress: str,
@@ -455,6 +691,9 @@ class AddressableObject(AddressableLeaf):
     ) -> None:
         super().__init__(localAddress, parent)
         self.__children: dict[str, AddressableLeaf] = {}
+        self.__leafChildren: Optional[List[AddressableLeaf]] = None
+        # Local addresses of removed children and the version they were removed with, created with the first removal
+        self.__removed: Optional[Dict[str, int]] = None
 
     @AddressableLeaf.enabled.setter  # type: ignore
     def enabled(self, setEnabled: bool) -> None:
@@ -462,22 +701,100 @@ class AddressableObject(AddressableLeaf):
             for child in self.__children.values():
                 child.enabled = False
         AddressableLeaf.enabled.fset(self, setEnabled)  # type: ignore
+        self.invalidateLeafChildren()
 
-    def asDict(self, filterCallable: Optional[Callable[[Any], None]] = None):
+    def asDict(self, filterCallable: Optional[Callable[[Any], None]] = None, sinceVersion: Optional[int] = None):
+        """Dict of all enabled children. With sinceVersion only subtrees changed after that version are included, children disabled or
+        removed and attributes set to None after that version are included with the value None."""
         asDict = {}
         for child in self.children:
+            if sinceVersion is not None and child.version <= sinceVersion:
+                continue
             if child.enabled:
-                childDict = child.asDict(filterCallable=filterCallable)
+                childDict = child.asDict(filterCallable=filterCallable, sinceVersion=sinceVersion)
                 if childDict is not None:
                     asDict[child.getLocalAddress()] = childDict
+                elif sinceVersion is not None and isinstance(child, AddressableAttribute) and child.value is None:
+                    asDict[child.getLocalAddress()] = None
+            elif sinceVersion is not None:
+                asDict[child.getLocalAddress()] = None
+        if sinceVersion is not None and self.__removed:
+            for localAddress, version in self.__removed.items():
+                if version > sinceVersion and localAddress not in asDict and localAddress not in self.__children:
+                    asDict[localAddress] = None
         return asDict
 
-    def toJSON(self):
+    def toJSON(self, sinceVersion: Optional[int] = None):
         def filterDict(element):
-            if SUPPORT_IMAGES and isinstance(element, Image.Image):
+            if isImage(element):
                 return True
             return False
-        return json.dumps(self.asDict(filterCallable=filterDict), cls=ExtendedWithNullEncoder, skipkeys=True, indent=4)
+        return json_codec.dumps(self.asDict(filterCallable=filterDict, sinceVersion=sinceVersion), indent=True, unknownAsNull=True)
+
+    def jsonPatch(self, sinceVersion: int, untilVersion: Optional[int] = None) -> List[Dict[str, Any]]:  # noqa: C901
+        """RFC 6902 JSON Patch transforming the output of toJSON() at sinceVersion into the output at untilVersion (or now).
+        The patch is built from the change journal of the root element. If there is no journal or it does not reach back to
+        sinceVersion the patch replaces the whole document. Values are not converted, serialize with json_codec.dumps(patch, unknownAsNull=True)."""
+        root: AddressableLeaf = self.getRoot()
+        changeJournal: Optional[ChangeJournal] = getattr(root, 'changeJournal', None)
+        entries = changeJournal.entriesBetween(sinceVersion, untilVersion) if changeJournal is not None else None
+        if entries is None:
+            if untilVersion is not None and untilVersion < self.version:
+                raise ValueError(f'No change journal reaching back to version {sinceVersion} available')
+
+            def filterDict(element):
+                return isImage(element)
+            return [{'op': 'replace', 'path': '', 'value': self.asDict(filterCallable=filterDict)}]
+
+        def isPatchValue(value) -> bool:
+            return value is not None and not isImage(value)
+
+        # First and last entry of every changed element in the subtree, in the order the elements changed first
+        prefix: str = f'{self.getGlobalAddress()}/'
+        changes: Dict[str, List[Any]] = {}
+        for entry in entries:
+            if entry.address.startswith(prefix):
+                changes.setdefault(entry.address, [entry, entry])[1] = entry
+
+        patch: List[Dict[str, Any]] = []
+        removedObjects: Set[str] = set()
+        for address, (first, last) in changes.items():
+            path: str = '/' + address[len(prefix):].replace('~', '~0')
+            element: Union[AddressableLeaf, bool] = root.getByAddressString(address)
+            if element is not False:
+                isObject: bool = isinstance(element, AddressableObject)
+            else:
+                # Removed from the tree meanwhile, it was an object if any of its children changed
+                isObject = any(otherAddress.startswith(f'{address}/') for otherAddress in changes)
+            wasEnabled: bool = not first.flags & AddressableLeaf.ObserverEvent.ENABLED
+            isEnabled: bool = not last.flags & AddressableLeaf.ObserverEvent.DISABLED
+            if isObject:
+                wasPresent, isPresent, newValue = wasEnabled, isEnabled, {}
+            else:
+                wasPresent = wasEnabled and isPatchValue(first.oldValue)
+                isPresent = isEnabled and isPatchValue(last.newValue)
+                newValue = last.newValue
+            if wasPresent and isPresent:
+                if not isObject and first.oldValue != last.newValue:
+                    patch.append({'op': 'replace', 'path': path, 'value': newValue})
+            elif wasPresent:
+                patch.append({'op': 'remove', 'path': path})
+                if isObject:
+                    removedObjects.add(path)
+            elif isPresent:
+                patch.append({'op': 'add', 'path': path, 'value': newValue})
+
+        # Children of removed objects are gone with their parent
+        if removedObjects:
+            def insideRemovedObject(path: str) -> bool:
+                parentPath: str = path.rpartition('/')[0]
+                while parentPath:
+                    if parentPath in removedObjects:
+                        return True
+                    parentPath = parentPath.rpartition('/')[0]
+                return False
+            patch = [operation for operation in patch if not insideRemovedObject(operation['path'])]
+        return patch
 
     def isLeaf(self) -> bool:
         return not self.__children
@@ -486,27 +803,89 @@ class AddressableObject(AddressableLeaf):
         if not isinstance(child, AddressableLeaf):
             raise TypeError('Cannot add a child that is not addressable')
         self.__children[child.getLocalAddress()] = child
+        if self.__removed:
+            self.__removed.pop(child.getLocalAddress(), None)
+        self.invalidateLeafChildren()
         self.enabled = True
 
-    def getLeafChildren(self) -> List[AddressableLeaf]:
-        return self.getRecursiveChildren(leaveOnly=True)
+    def renameChild(self, child: AddressableLeaf, oldLocalAddress: str) -> None:
+        if self.__children.get(oldLocalAddress) is child:
+            del self.__children[oldLocalAddress]
+            self.__recordRemoved(oldLocalAddress, nextVersion())
+        self.__children[child.getLocalAddress()] = child
+        if self.__removed:
+            self.__removed.pop(child.getLocalAddress(), None)
+        self.invalidateLeafChildren()
+
+    def removeChild(self, child: AddressableLeaf) -> None:
+        if child.enabled:
+            child.enabled = False
+        localAddress = child.getLocalAddress()
+        if self.__children.get(localAddress) is child:
+            del self.__children[localAddress]
+            self.__recordRemoved(localAddress, child.version)
+        else:
+            for address, existingChild in list(self.__children.items()):
+                if existingChild is child:
+                    del self.__children[address]
+                    self.__recordRemoved(address, child.version)
+        self.invalidateLeafChildren()
+
+    def __recordRemoved(self, localAddress: str, version: int) -> None:
+        # Exports with sinceVersion report the removed child as None
+        if self.__removed is None:
+            self.__removed = {}
+        self.__removed[localAddress] = version
+
+    def invalidateLeafChildren(self) -> None:
+        element: Optional[AddressableObject] = self
+        while element is not None:
+            element.__leafChildren = None  # pylint: disable=protected-access
+            element = element.parent
 
-    def getRecursiveChildren(self, leaveOnly=False) -> List[AddressableLeaf]:
+    def getLeafChildren(self) -> List[AddressableLeaf]:
+        return list(self.__getCachedLeafChildren())
+
+    def __getCachedLeafChildren(self) -> List[AddressableLeaf]:
+        leafChildren: Optional[List[AddressableLeaf]] = self.__leafChildren
+        if leafChildren is None:
+            if not self.enabled:
+                leafChildren = []
+            elif self.isLeaf():
+                leafChildren = [self]
+            else:
+                leafChildren = []
+                for child in self.__children.values():
+                    if child.enabled:
+                        if isinstance(child, AddressableObject):
+                            leafChildren.extend(child.__getCachedLeafChildren())  # pylint: disable=protected-access
+                        else:
+                            leafChildren.append(child)
+            self.__leafChildren = leafChildren
+        return leafChildren
+
+    def iterLeafChildren(self) -> Iterator[AddressableLeaf]:
+        # Invalidation replaces the cached list instead of modifying it, iterating it is safe even if the tree changes meanwhile
+        return iter(self.__getCachedLeafChildren())
+
+    def iterRecursiveChildren(self, leaveOnly=False) -> Iterator[AddressableLeaf]:
         if not self.enabled:
-            return []
+            return
         if self.isLeaf():
-            return [self]
+            yield self
+            return
 
-        children: List[AddressableLeaf] = []
         if not leaveOnly:
-            children.append(self)
-        for child in self.__children.values():
+            yield self
+        for child in list(self.__children.values()):
             if child.enabled:
                 if isinstance(child, AddressableObject):
-                    children.extend(child.getRecursiveChildren(leaveOnly=leaveOnly))
+                    yield from child.iterRecursiveChildren(leaveOnly=leaveOnly)
                 elif isinstance(child, AddressableLeaf):
-                    children.append(child)
-        return children
+                    yield child
+
+    def getRecursiveChildren(self, leaveOnly=False) -> List[AddressableLeaf]:
+        return list(self.iterRecursiveChildren(leaveOnly=leaveOnly))
 
     @property
     def children(self) -> List[AddressableLeaf]:
@@ -517,7 +896,8 @@ class AddressableObject(AddressableLeaf):
             return super().getByAddressString(addressString)
 
         localAddress, _, childPath = addressString.partition('/')
-        if not super().getByAddressString(localAddress):
+        # Compare with False, empty AddressableDict and AddressableList are falsy
+        if super().getByAddressString(localAddress) is False:
             return False
         childAddress, _, _ = childPath.partition('/')
         if childAddress == '..':
@@ -557,6 +937,15 @@ L = TypeVar('L', bound=AddressableLeaf)
 
 
 class AddressableDict(AddressableObject, Dict[T, L]):
+    def __reduce_ex__(self, protocol):
+        # Pickle would add the items with __setitem__ before the attributes are restored, they are restored together instead
+        return (_newCollection, (type(self),), (self.__dict__, dict(dict.items(self))))
+
+    def __setstate__(self, state) -> None:
+        attributes, items = state
+        self.__dict__.update(attributes)
+        dict.update(self, items)
+
     def __setitem__(self, key: T, item: L):
         self.addChild(item)
         retVal = super().setdefault(key, item)
@@ -564,16 +953,144 @@ class AddressableDict(AddressableObject, Dict[T, L]):
             self.enabled = True
         return retVal
 
+    def __delitem__(self, key: T) -> None:
+        item = self[key]
+        super().__delitem__(key)
+        if isinstance(item, AddressableLeaf):
+            self.removeChild(item)
+
+    def pop(self, key: T, *args):
+        if key not in self:
+            return super().pop(key, *args)
+        item = super().pop(key)
+        if isinstance(item, AddressableLeaf):
+            self.removeChild(item)
+        return item
+
+    def clear(self) -> None:
+        items = list(self.values())
+        super().clear()
+        for item in items:
+            if isinstance(item, AddressableLeaf):
+                self.removeChild(item)
+
+    def reconcile(self, items: Iterable[Any], key: Callable[[Any], Any], create: Callable[[Any, Any], L],
+                  update: Optional[Callable[[L, Any], None]] = None) -> None:
+        """Makes the dict hold one element per item in one pass over items.
+
+        Elements are matched by key(item), items with key None are skipped. Matched elements are updated in place with update(element, item),
+        by default element.update(fromDict=item). For new keys create(key, item) creates the element. Elements of keys that are not in items
+        anymore are removed.
+        """
+        seen: Set[Any] = set()
+        for item in items:
+            itemKey = key(item)
+            if itemKey is None:
+                continue
+            seen.add(itemKey)
+            element = dict.get(self, itemKey)
+            if element is None:
+                self[itemKey] = create(itemKey, item)
+            elif update is None:
+                element.update(fromDict=item)
+            else:
+                update(element, item)
+        if len(seen) != len(self):
+            for staleKey in [staleKey for staleKey in self if staleKey not in seen]:
+                del self[staleKey]
+
     def __str__(self) -> str:
         return '[' + ', '.join([str(item) for item in self.values() if item.enabled]) + ']'
 
 
 class AddressableList(AddressableObject, List[L]):
+    def __reduce_ex__(self, protocol):
+        # Pickle would add the items with append() before the attributes are restored, they are restored together instead
+        return (_newCollection, (type(self),), (self.__dict__, list(self)))
+
+    def __setstate__(self, state) -> None:
+        attributes, items = state
+        self.__dict__.update(attributes)
+        list.extend(self, items)
+
     def __add__(self, item):
         retVal = super().__add__(item)
         if not self.enabled:
             self.enabled = True
         return retVal
 
+    def __delitem__(self, index) -> None:
+        items = self[index] if isinstance(index, slice) else [self[index]]
+        super().__delitem__(index)
+        for item in items:
+            if isinstance(item, AddressableLeaf):
+                self.removeChild(item)
+
+    def remove(self, item: L) -> None:
+        super().remove(item)
+        if isinstance(item, AddressableLeaf):
+            self.removeChild(item)
+
+    def pop(self, index=-1) -> L:
+        item = super().pop(index)
+        if isinstance(item, AddressableLeaf):
+            self.removeChild(item)
+        return item
+
+    def clear(self) -> None:
+        items = list(self)
+        super().clear()
+        for item in items:
+            if isinstance(item, AddressableLeaf):
+                self.removeChild(item)
+
+    def reconcile(self, items: Iterable[Any], create: Callable[[str, Any], L], update: Optional[Callable[[L, Any], None]] = None,  # noqa: C901
+                  key: Optional[Callable[[Any], Any]] = None, elementKey: Optional[Callable[[L], Any]] = None) -> None:
+        """Makes the list hold one element per item, in the order of items, in one pass over items.
+
+        Without key elements are matched by position. With key the element for which elementKey(element) equals key(item) is used, elements
+        with the same key are used in their order.
+        Matched elements are updated in place with update(element, item), by default element.update(fromDict=item). For items without
+        match create(localAddress, item) creates the element. Elements without item are removed. Afterwards the local address of every
+        element is its index.
+        """
+        items = list(items)
+        matches: List[Optional[L]]
+        removed: List[L]
+        if key is None:
+            matches = [list.__getitem__(self, index) if index < list.__len__(self) else None for index in range(len(items))]
+            removed = list.__getitem__(self, slice(len(items), None))
+        else:
+            if elementKey is None:
+                raise ValueError('elementKey is needed to match elements by key')
+            # Elements with the same key are matched in their order, the ones left over are removed
+            byKey: Dict[Any, List[L]] = {}
+            for element in reversed(self):
+                byKey.setdefault(elementKey(element), []).append(element)
+            matches = []
+            for item in items:
+                candidates: Optional[List[L]] = byKey.get(key(item))
+                matches.append(candidates.pop() if candidates else None)
+            removed = [element for candidates in byKey.values() for element in candidates]
+        # Removed first so that their addresses are free for the elements that move
+        for element in removed:
+            if isinstance(element, AddressableLeaf):
+                self.removeChild(element)
+        elements: List[L] = []
+        for index, (item, element) in enumerate(zip(items, matches)):
+            if element is None:
+                element = create(str(index), item)
+            else:
+                if update is None:
+                    element.update(fromDict=item)
+                else:
+                    update(element, item)
+                if element.localAddress != str(index):
+                    element.localAddress = str(index)
+            elements.append(element)
+        list.__setitem__(self, slice(None), elements)
+        if elements and not self.enabled:
+            self.enabled = True
+
     def __str__(self) -> str:
         return '[' + ', '.join([str(item) for item in self if item.enabled]) + ']'
@@ -14,7 +14,8 @@ from oauthlib.oauth2.rfc6749.parameters import parse_authorization_code_response
 from requests.adapters import HTTPAdapter
 
 from weconnect.auth.auth_util import addBearerAuthHeader
-from weconnect.errors import AuthentificationError, RetrievalError
+from weconnect.errors import AuthentificationError, DeadlineExceededError, RetrievalError
+from weconnect.update_budget import currentBudget
 
 from weconnect.elements.helpers.blacklist_retry import BlacklistRetry
 
@@ -74,6 +75,16 @@ class OpenIDSession(requests.Session):
                                      raise_on_status=False)
             self.mount('https://', HTTPAdapter(max_retries=retries))
 
+    def requestTimeout(self, timeout=None):
+        """Timeout for a request, timeout or the timeout of the session. While an update with a deadline runs in the calling thread, all
+        attempts of the request together fit into the remaining time and DeadlineExceededError is raised if there is not enough time left."""
+        if timeout is None:
+            timeout = self.timeout
+        budget = currentBudget()
+        if budget is None:
+            return timeout
+        return budget.requestTimeout(timeout, attempts=(self.retries or 0) + 1)
+
     @property
     def token(self):
         return self._token
@@ -233,6 +244,8 @@ class OpenIDSession(requests.Session):
                     self.login()
                 except MissingTokenError:
                     self.login()
+                except DeadlineExceededError:
+                    raise
                 except RetrievalError:
                     LOG.error('Retrieval Error while refreshing token. Probably the token was invalidated. Trying to do a new login instead.')
                     self.login()
@@ -242,11 +255,10 @@ class OpenIDSession(requests.Session):
                 self.login()
                 url, headers, data = self.addToken(url, body=data, headers=headers, access_type=access_type, token=token)
 
-        if timeout is None:
-            timeout = self.timeout
+        timeout = self.requestTimeout(timeout)
 
         return super(OpenIDSession, self).request(
-            method, url, headers=headers, data=data, **kwargs
+            method, url, headers=headers, data=data, timeout=timeout, **kwargs
         )
 
     def addToken(self, uri, body=None, headers=None, access_type=AccessType.ACCESS, token=None, **kwargs):
@@ -110,7 +110,7 @@ class VWWebSession(OpenIDSession):
                                                 f'Try to visit the URL "{url}" or log into smartphone app.')
 
             LOG.debug(f"DEBUG [do_web_auth]: Making HTTP GET request to: {url[:100]}")
-            response = self.websession.get(url, allow_redirects=False)
+            response = self.websession.get(url, allow_redirects=False, timeout=self.requestTimeout())
             if response.status_code == requests.codes['internal_server_error']:
                 raise RetrievalError('Temporary server error during login')
 
@@ -176,7 +176,7 @@ class VWWebSession(OpenIDSession):
                 LOG.debug(f"DEBUG [_get_login_form]: Custom scheme URL reached in redirect loop, returning None")
                 return None
             
-            response = self.websession.get(url, allow_redirects=False)
+            response = self.websession.get(url, allow_redirects=False, timeout=self.requestTimeout())
             if response.status_code == requests.codes['ok']:
                 break
 
@@ -208,7 +208,7 @@ class VWWebSession(OpenIDSession):
         return emailForm
 
     def _get_password_form(self, url: str, data: Dict[str, Any]) -> CredentialsFormParser:
-        response = self.websession.post(url, data=data, allow_redirects=True)
+        response = self.websession.post(url, data=data, allow_redirects=True, timeout=self.requestTimeout())
         if response.status_code != requests.codes['ok']:
             raise APICompatibilityError(f'Retrieving credentials page was not successful, '
                                         f'status code: {response.status_code}')
@@ -234,7 +234,7 @@ class VWWebSession(OpenIDSession):
         return credentialsForm
 
     def _handle_login(self, url: str, data: Dict[str, Any]) -> str:
-        response: requests.Response = self.websession.post(url, data=data, allow_redirects=False)
+        response: requests.Response = self.websession.post(url, data=data, allow_redirects=False, timeout=self.requestTimeout())
 
         if response.status_code == requests.codes['internal_server_error']:
             raise RetrievalError('Temporary server error during login')
@@ -297,7 +297,7 @@ class VWWebSession(OpenIDSession):
                 LOG.info(f"Found custom scheme URL during initial auth page fetch")
                 return url
 
-            response = self.websession.get(url, allow_redirects=False)
+            response = self.websession.get(url, allow_redirects=False, timeout=self.requestTimeout())
 
             if response.status_code == requests.codes['ok']:
                 break
@@ -331,7 +331,7 @@ class VWWebSession(OpenIDSession):
         # Post to login URL
         login_url = f'https://identity.vwgroup.io/u/login?state={state}'
         LOG.debug(f"Posting to login URL: {login_url}")
-        response = self.websession.post(login_url, data=login_form, allow_redirects=False)
+        response = self.websession.post(login_url, data=login_form, allow_redirects=False, timeout=self.requestTimeout())
 
         if response.status_code not in (requests.codes['found'], requests.codes['see_other']):
             raise AuthentificationError(f'Login failed with status code: {response.status_code}')
@@ -366,7 +366,7 @@ class VWWebSession(OpenIDSession):
             LOG.debug(f"DEBUG [_handle_new_auth_flow]: URL after urljoin: {redirect_url[:150]}")
 
             LOG.debug(f"DEBUG [_handle_new_auth_flow]: Making HTTP GET request to: {redirect_url[:100]}")
-            response = self.websession.get(redirect_url, allow_redirects=False)
+            response = self.websession.get(redirect_url, allow_redirects=False, timeout=self.requestTimeout())
 
             if response.status_code == requests.codes['internal_server_error']:
                 raise RetrievalError('Temporary server error during new auth flow')
@@ -396,7 +396,7 @@ class VWWebSession(OpenIDSession):
         return redirect_url
 
     def _handle_consent_form(self, url: str) -> str:
-        response = self.websession.get(url, allow_redirects=False)
+        response = self.websession.get(url, allow_redirects=False, timeout=self.requestTimeout())
         if response.status_code == requests.codes['internal_server_error']:
             raise RetrievalError('Temporary server error during login')
 
@@ -407,7 +407,7 @@ class VWWebSession(OpenIDSession):
         # Remove query from URL
         url = urlparse(response.url)._replace(query='').geturl()
 
-        response = self.websession.post(url, data=tcForm.data, allow_redirects=False)
+        response = self.websession.post(url, data=tcForm.data, allow_redirects=False, timeout=self.requestTimeout())
         if response.status_code == requests.codes['internal_server_error']:
             raise RetrievalError('Temporary server error during login')
 
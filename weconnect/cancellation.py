@@ -0,0 +1,116 @@
+from __future__ import annotations
+from typing import Callable, Iterator, List, Optional
+
+import logging
+import threading
+from contextlib import contextmanager
+
+from weconnect.errors import UpdateCancelledError
+
+LOG: logging.Logger = logging.getLogger("weconnect")
+
+
+class CancellationToken:
+    """Token to cancel running updates from another thread, e.g. when shutting down.
+
+    Updates check the token before every request and while downloading pictures, requests that are running are aborted by the callbacks
+    registered by the update. A cancelled update raises UpdateCancelledError, responses that were not applied to the tree yet are dropped,
+    so the tree stays as it was after the last applied response.
+    """
+
+    def __init__(self) -> None:
+        self.__event: threading.Event = threading.Event()
+        self.__lock: threading.Lock = threading.Lock()
+        self.__callbacks: List[Callable[[], None]] = []
+        self.reason: Optional[str] = None
+
+    def cancel(self, reason: Optional[str] = None) -> None:
+        """Cancels the token and runs the registered callbacks in the calling thread"""
+        with self.__lock:
+            if self.__event.is_set():
+                return
+            self.reason = reason
+            self.__event.set()
+            callbacks: List[Callable[[], None]] = list(self.__callbacks)
+        for callback in callbacks:
+            self.__run(callback)
+
+    def addCallback(self, callback: Callable[[], None]) -> None:
+        """Registers callback to be run on cancel(), e.g. to abort running requests. It is run right away if the token is cancelled."""
+        with self.__lock:
+            if not self.__event.is_set():
+                self.__callbacks.append(callback)
+                return
+        self.__run(callback)
+
+    def removeCallback(self, callback: Callable[[], None]) -> None:
+        with self.__lock:
+            if callback in self.__callbacks:
+                self.__callbacks.remove(callback)
+
+    @staticmethod
+    def __run(callback: Callable[[], None]) -> None:
+        try:
+            callback()
+        except Exception:  # pylint: disable=broad-except
+            LOG.exception('Callback of the cancellation failed')
+
+    @property
+    def cancelled(self) -> bool:
+        return self.__event.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Waits until the token is cancelled or timeout seconds passed, returns True if it was cancelled.
+        Can be used instead of time.sleep() between updates."""
+        return self.__event.wait(timeout=timeout)
+
+    def raiseIfCancelled(self) -> None:
+        if self.__event.is_set():
+            raise UpdateCancelledError(self.reason or 'Update was cancelled')
+
+
+class _CurrentToken(threading.local):
+    token: Optional[CancellationToken] = None
+
+
+_currentToken: _CurrentToken = _CurrentToken()
+
+
+@contextmanager
+def cancellable(cancellationToken: Optional[CancellationToken]) -> Iterator[Optional[CancellationToken]]:
+    """Makes cancellationToken the token checked by all requests of this thread within the context.
+    Without a token (None) the token of an outer context stays in effect."""
+    if cancellationToken is None:
+        yield _currentToken.token
+        return
+    previous: Optional[CancellationToken] = _currentToken.token
+    _currentToken.token = cancellationToken
+    try:
+        yield cancellationToken
+    finally:
+        _currentToken.token = previous
+
+
+@contextmanager
+def onCancel(cancellationToken: Optional[CancellationToken], callback: Callable[[], None]) -> Iterator[None]:
+    """Runs callback when cancellationToken is cancelled within the context. Does nothing without a token (None)."""
+    if cancellationToken is None:
+        yield
+        return
+    cancellationToken.addCallback(callback)
+    try:
+        yield
+    finally:
+        cancellationToken.removeCallback(callback)
+
+
+def currentCancellationToken() -> Optional[CancellationToken]:
+    """Token of the cancellable context running in this thread or None"""
+    return _currentToken.token
+
+
+def raiseIfCancelled() -> None:
+    """Raises UpdateCancelledError if the token of the cancellable context running in this thread was cancelled"""
+    token: Optional[CancellationToken] = _currentToken.token
+    if token is not None:
+        token.raiseIfCancelled()
@@ -0,0 +1,89 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Deque, List, NamedTuple, Optional
+
+from collections import deque
+from datetime import datetime
+from itertools import islice
+from threading import Lock
+
+if TYPE_CHECKING:
+    from weconnect.addressable import AddressableLeaf
+
+
+class ChangeJournal:
+    """Bounded in-memory journal of all changes in an element tree.
+
+    Consumers get a cursor and pull batches of entries with read(). Recording never waits for consumers, when the journal is full the
+    oldest entries are dropped and consumers that did not read them yet find the number of dropped entries in cursor.missed.
+    """
+
+    class Entry(NamedTuple):
+        sequence: int
+        address: str
+        oldValue: Any
+        newValue: Any
+        flags: AddressableLeaf.ObserverEvent
+        timestamp: datetime
+
+    class Cursor:
+        def __init__(self, position: int) -> None:
+            self.position: int = position
+            self.missed: int = 0
+
+    def __init__(self, maxEntries: int = 10000, startSequence: int = 0) -> None:
+        if maxEntries < 1:
+            raise ValueError('maxEntries must be at least 1')
+        self.__lock: Lock = Lock()
+        self.__entries: Deque[ChangeJournal.Entry] = deque(maxlen=maxEntries)
+        # Position of the oldest entry still in the journal, positions count all entries ever recorded
+        self.__firstPosition: int = 0
+        # Changes up to this sequence are not in the journal, either they happened before it was started or were dropped
+        self.__coveredAfterSequence: int = startSequence
+
+    @property
+    def maxEntries(self) -> int:
+        return self.__entries.maxlen or 0
+
+    @property
+    def lastSequence(self) -> int:
+        with self.__lock:
+            if self.__entries:
+                return self.__entries[-1].sequence
+            return 0
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def record(self, sequence: int, address: str, oldValue: Any, newValue: Any, flags: AddressableLeaf.ObserverEvent, timestamp: datetime) -> None:
+        with self.__lock:
+            if len(self.__entries) == self.__entries.maxlen:
+                self.__firstPosition += 1
+                self.__coveredAfterSequence = self.__entries[0].sequence
+            self.__entries.append(ChangeJournal.Entry(sequence, address, oldValue, newValue, flags, timestamp))
+
+    def cursor(self, fromOldest: bool = False) -> ChangeJournal.Cursor:
+        """Cursor reading all entries recorded after its creation, or all entries still in the journal if fromOldest is set"""
+        with self.__lock:
+            if fromOldest:
+                return ChangeJournal.Cursor(self.__firstPosition)
+            return ChangeJournal.Cursor(self.__firstPosition + len(self.__entries))
+
+    def read(self, cursor: ChangeJournal.Cursor, maxEntries: Optional[int] = None) -> List[ChangeJournal.Entry]:
+        """Entries after the cursor, at most maxEntries. The cursor is advanced past the returned entries."""
+        with self.__lock:
+            if cursor.position < self.__firstPosition:
+                cursor.missed += self.__firstPosition - cursor.position
+                cursor.position = self.__firstPosition
+            start: int = cursor.position - self.__firstPosition
+            stop: Optional[int] = None if maxEntries is None else start + maxEntries
+            entries: List[ChangeJournal.Entry] = list(islice(self.__entries, start, stop))
+            cursor.position += len(entries)
+        return entries
+
+    def entriesBetween(self, sinceSequence: int, untilSequence: Optional[int] = None) -> Optional[List[ChangeJournal.Entry]]:
+        """All entries with sinceSequence < sequence <= untilSequence, or None if the journal does not reach back to sinceSequence"""
+        with self.__lock:
+            if sinceSequence < self.__coveredAfterSequence:
+                return None
+            return [entry for entry in self.__entries
+                    if entry.sequence > sinceSequence and (untilSequence is None or entry.sequence <= untilSequence)]
@@ -3,6 +3,7 @@ import logging
 
 from weconnect.addressable import AddressableObject, AddressableAttribute, AddressableDict
 from weconnect.elements.generic_status import GenericStatus
+from weconnect.schema_drift import schemaDrift
 
 LOG = logging.getLogger("weconnect")
 
@@ -32,30 +33,15 @@ class AccessStatus(GenericStatus):
             self.doorLockStatus.fromDict(fromDict['value'], 'doorLockStatus')
 
             if 'doors' in fromDict['value'] and fromDict['value']['doors'] is not None:
-                for doorDict in fromDict['value']['doors']:
-                    if 'name' in doorDict:
-                        if doorDict['name'] in self.doors:
-                            self.doors[doorDict['name']].update(fromDict=doorDict)
-                        else:
-                            self.doors[doorDict['name']] = AccessStatus.Door(fromDict=doorDict, parent=self.doors)
-                for doorName in [doorName for doorName in self.doors.keys()
-                                 if doorName not in [door['name'] for door in fromDict['value']['doors'] if 'name' in door]]:
-                    del self.doors[doorName]
+                self.doors.reconcile(fromDict['value']['doors'], key=lambda door: door.get('name'),
+                                     create=lambda name, door: AccessStatus.Door(fromDict=door, parent=self.doors))
             else:
                 self.doors.clear()
                 self.doors.enabled = False
 
             if 'windows' in fromDict['value'] and fromDict['value']['windows'] is not None:
-                for windowDict in fromDict['value']['windows']:
-                    if 'name' in windowDict:
-                        if windowDict['name'] in self.windows:
-                            self.windows[windowDict['name']].update(fromDict=windowDict)
-                        else:
-                            self.windows[windowDict['name']] = AccessStatus.Window(fromDict=windowDict, parent=self.windows)
-                for windowName in [windowName for windowName in self.windows.keys()
-                                   if windowName not in [window['name']
-                                   for window in fromDict['value']['windows'] if 'name' in window]]:
-                    del self.doors[windowName]
+                self.windows.reconcile(fromDict['value']['windows'], key=lambda window: window.get('name'),
+                                       create=lambda name, window: AccessStatus.Window(fromDict=window, parent=self.windows))
             else:
                 self.windows.clear()
                 self.windows.enabled = False
@@ -143,8 +129,7 @@ class AccessStatus(GenericStatus):
                 self.lockState.enabled = False
                 self.openState.enabled = False
 
-            for key, value in {key: value for key, value in fromDict.items() if key not in ['name', 'status']}.items():
-                LOG.warning('%s: Unknown attribute %s with value %s', self.getGlobalAddress(), key, value)
+            schemaDrift.reportUnknownKeys(self, fromDict, ('name', 'status'))
 
         def __str__(self):
             returnString = f'{self.id}: '
@@ -206,8 +191,7 @@ class AccessStatus(GenericStatus):
             else:
                 self.openState.enabled = False
 
-            for key, value in {key: value for key, value in fromDict.items() if key not in ['name', 'status']}.items():
-                LOG.warning('%s: Unknown attribute %s with value %s', self.getGlobalAddress(), key, value)
+            schemaDrift.reportUnknownKeys(self, fromDict, ('name', 'status'))
 
         def __str__(self):
             return f'{self.id}: {self.openState.value.value}'  # pylint: disable=no-member
@@ -1,12 +1,22 @@
+from __future__ import annotations
 import logging
 
 from weconnect.addressable import AddressableAttribute
 from weconnect.elements.generic_status import GenericStatus
+from weconnect.elements.helpers.field_schema import Field
 
 LOG = logging.getLogger("weconnect")
 
 
 class BatteryStatus(GenericStatus):
+    currentSOC_pct: AddressableAttribute[int]
+    navigationTargetSOC_pct: AddressableAttribute[int]
+
+    FIELDS = (
+        Field('currentSOC_pct', int),
+        Field('navigationTargetSOC_pct', int),
+    )
+
     def __init__(
         self,
         vehicle,
@@ -15,10 +25,6 @@ class BatteryStatus(GenericStatus):
         fromDict=None,
         fixAPI=True,
     ):
-        self.currentSOC_pct = AddressableAttribute(
-            localAddress='currentSOC_pct', parent=self, value=None, valueType=int)
-        self.navigationTargetSOC_pct = AddressableAttribute(
-            localAddress='navigationTargetSOC_pct', parent=self, value=None, valueType=int)
         self.cruisingRangeElectric_km = AddressableAttribute(
             localAddress='cruisingRangeElectric_km', value=None, parent=self, valueType=int)
         super().__init__(vehicle=vehicle, parent=parent, statusId=statusId, fromDict=fromDict, fixAPI=fixAPI)
@@ -27,6 +33,7 @@ class BatteryStatus(GenericStatus):
         ignoreAttributes = ignoreAttributes or []
         LOG.debug('Update battery status from dict')
 
+        # cruisingRangeElectric_km is checked against the previous currentSOC_pct so it is updated before the fields
         if 'value' in fromDict:
             if 'cruisingRangeElectric_km' in fromDict['value']:
                 cruisingRangeElectric_km = int(fromDict['value']['cruisingRangeElectric_km'])
@@ -45,16 +52,10 @@ class BatteryStatus(GenericStatus):
                         cruisingRangeElectric_km, lastUpdateFromCar=None, fromServer=True)
             else:
                 self.cruisingRangeElectric_km.enabled = False
-
-            self.currentSOC_pct.fromDict(fromDict['value'], 'currentSOC_pct')
-            self.navigationTargetSOC_pct.fromDict(fromDict['value'], 'navigationTargetSOC_pct')
         else:
-            self.currentSOC_pct.enabled = False
             self.cruisingRangeElectric_km.enabled = False
-            self.navigationTargetSOC_pct.enabled = False
 
-        super().update(fromDict=fromDict, ignoreAttributes=(
-            ignoreAttributes + ['currentSOC_pct', 'navigationTargetSOC_pct', 'cruisingRangeElectric_km']))
+        super().update(fromDict=fromDict, ignoreAttributes=(ignoreAttributes + ['cruisingRangeElectric_km']))
 
     def __str__(self):
         string = super().__str__()
@@ -24,17 +24,9 @@ class CapabilityStatus(GenericStatus):
         LOG.debug('Update capability status from dict')
 
         if 'value' in fromDict:
-            for capDict in fromDict['value']:
-                if 'id' in capDict:
-                    if capDict['id'] in self.capabilities:
-                        self.capabilities[capDict['id']].update(fromDict=capDict)
-                    else:
-                        self.capabilities[capDict['id']] = GenericCapability(
-                            capabilityId=capDict['id'], fromDict=capDict, parent=self.capabilities)
-            for capabilityId in [capabilityId for capabilityId in self.capabilities.keys()
-                                 if capabilityId not in [capability['id']
-                                 for capability in fromDict['value'] if 'id' in capability]]:
-                del self.capabilities[capabilityId]
+            self.capabilities.reconcile(fromDict['value'], key=lambda capability: capability.get('id'),
+                                        create=lambda capabilityId, capability: GenericCapability(capabilityId=capabilityId, fromDict=capability,
+                                                                                                  parent=self.capabilities))
         else:
             self.capabilities.clear()
             self.capabilities.enabled = False
@@ -5,6 +5,7 @@ from weconnect.addressable import AddressableAttribute, AddressableDict, Address
 from weconnect.elements.enums import UnlockPlugState, TargetSOCReachable
 from weconnect.elements.generic_settings import GenericSettings
 from weconnect.elements.timer import Timer
+from weconnect.schema_drift import schemaDrift
 
 LOG = logging.getLogger("weconnect")
 
@@ -30,15 +31,8 @@ class ChargingProfiles(GenericSettings):
 
         if 'value' in fromDict:
             if 'profiles' in fromDict['value'] and fromDict['value']['profiles'] is not None:
-                for profileDict in fromDict['value']['profiles']:
-                    if 'id' in profileDict:
-                        if profileDict['id'] in self.profiles:
-                            self.profiles[profileDict['id']].update(fromDict=profileDict)
-                        else:
-                            self.profiles[profileDict['id']] = ChargingProfiles.ChargingProfile(fromDict=profileDict, parent=self.profiles)
-                for profileId in [profileId for profileId in self.profiles.keys()
-                                  if profileId not in [profile['id'] for profile in fromDict['value']['profiles'] if 'id' in profile]]:
-                    del self.profiles[profileId]
+                self.profiles.reconcile(fromDict['value']['profiles'], key=lambda profile: profile.get('id'),
+                                        create=lambda profileId, profile: ChargingProfiles.ChargingProfile(fromDict=profile, parent=self.profiles))
             else:
                 self.profiles.clear()
                 self.profiles.enabled = False
@@ -111,40 +105,22 @@ class ChargingProfiles(GenericSettings):
                     self.options = ChargingProfiles.ChargingProfile.Options(fromDict=fromDict['options'], parent=self)
 
             if 'timers' in fromDict and fromDict['timers'] is not None:
-                for chargingProfileTimerDict in fromDict['timers']:
-                    if 'id' in chargingProfileTimerDict:
-                        if chargingProfileTimerDict['id'] in self.timers:
-                            self.timers[chargingProfileTimerDict['id']].update(fromDict=chargingProfileTimerDict)
-                        else:
-                            self.timers[chargingProfileTimerDict['id']] = Timer(
-                                fromDict=chargingProfileTimerDict, parent=self.timers)
-                for timerId in [timerId for timerId in self.timers.keys()
-                                if timerId not in [timer['id']
-                                for timer in fromDict['timers'] if 'id' in timer]]:
-                    del self.timers[timerId]
+                self.timers.reconcile(fromDict['timers'], key=lambda timer: timer.get('id'),
+                                      create=lambda timerId, timer: Timer(fromDict=timer, parent=self.timers))
             else:
                 self.timers.clear()
                 self.timers.enabled = False
 
             if 'preferredChargingTimes' in fromDict and fromDict['preferredChargingTimes'] is not None:
-                for preferredChargingTimesDict in fromDict['preferredChargingTimes']:
-                    if 'id' in preferredChargingTimesDict:
-                        if preferredChargingTimesDict['id'] in self.preferredChargingTimes:
-                            self.preferredChargingTimes[preferredChargingTimesDict['id']].update(fromDict=preferredChargingTimesDict)
-                        else:
-                            self.preferredChargingTimes[preferredChargingTimesDict['id']] = ChargingProfiles.ChargingProfile.PreferredTime(
-                                fromDict=preferredChargingTimesDict, parent=self.preferredChargingTimes)
-                for timeId in [timeId for timeId in self.preferredChargingTimes.keys()
-                               if timeId not in [timer['id']
-                               for timer in fromDict['timers'] if 'id' in timer]]:
-                    del self.preferredChargingTimes[timeId]
+                self.preferredChargingTimes.reconcile(fromDict['preferredChargingTimes'], key=lambda preferredTime: preferredTime.get('id'),
+                                                      create=lambda timeId, preferredTime: ChargingProfiles.ChargingProfile.PreferredTime(
+                                                          fromDict=preferredTime, parent=self.preferredChargingTimes))
             else:
                 self.preferredChargingTimes.clear()
                 self.preferredChargingTimes.enabled = False
 
-            for key, value in {key: value for key, value in fromDict.items() if key not in ['id', 'name', 'maxChargingCurrent', 'minSOC_pct', 'targetSOC_pct',
-                                                                                            'timers', 'preferredChargingTimes', 'options']}.items():
-                LOG.warning('%s: Unknown attribute %s with value %s', self.getGlobalAddress(), key, value)
+            schemaDrift.reportUnknownKeys(self, fromDict, ('id', 'name', 'maxChargingCurrent', 'minSOC_pct', 'targetSOC_pct', 'timers',
+                                                           'preferredChargingTimes', 'options'))
 
         def __str__(self):
             string = ''
@@ -191,9 +167,7 @@ class ChargingProfiles(GenericSettings):
                 self.startTime.fromDict(fromDict, 'startTime')
                 self.endTime.fromDict(fromDict, 'endTime')
 
-                for key, value in {key: value for key, value in fromDict.items()
-                                   if key not in ['id', 'enabled', 'startTime', 'endTime']}.items():
-                    LOG.warning('%s: Unknown attribute %s with value %s', self.getGlobalAddress(), key, value)
+                schemaDrift.reportUnknownKeys(self, fromDict, ('id', 'enabled', 'startTime', 'endTime'))
 
             def __str__(self):
                 string = ''
@@ -227,9 +201,7 @@ class ChargingProfiles(GenericSettings):
                 self.autoUnlockPlugWhenCharged.fromDict(fromDict, 'autoUnlockPlugWhenCharged')
                 self.usePrivateCurrentEnabled.fromDict(fromDict, 'usePrivateCurrentEnabled')
 
-                for key, value in {key: value for key, value in fromDict.items() if key not in ['autoUnlockPlugWhenCharged',
-                                                                                                'usePrivateCurrentEnabled']}.items():
-                    LOG.warning('%s: Unknown attribute %s with value %s', self.getGlobalAddress(), key, value)
+                schemaDrift.reportUnknownKeys(self, fromDict, ('autoUnlockPlugWhenCharged', 'usePrivateCurrentEnabled'))
 
             def __str__(self):
                 string = ''
@@ -266,8 +238,7 @@ class ChargingProfiles(GenericSettings):
 
             self.targetSOCreachable.fromDict(fromDict, 'targetSOCreachable')
 
-            for key, value in {key: value for key, value in fromDict.items() if key not in ['id', 'targetSOCreachable']}.items():
-                LOG.warning('%s: Unknown attribute %s with value %s', self.getGlobalAddress(), key, value)
+            schemaDrift.reportUnknownKeys(self, fromDict, ('id', 'targetSOCreachable'))
 
         def __str__(self):
             string = ''
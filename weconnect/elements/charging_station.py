@@ -2,10 +2,19 @@ import logging
 from enum import Enum
 
 from weconnect.addressable import AddressableObject, AddressableAttribute, AddressableList
+from weconnect.schema_drift import schemaDrift
 
 LOG = logging.getLogger("weconnect")
 
 
+def _toEnum(enumType, value, name):
+    try:
+        return enumType(value)
+    except ValueError:
+        LOG.warning('An unsupported %s: %s was provided, please report this as a bug', name, value)
+        return enumType.UNKNOWN
+
+
 class ChargingStation(AddressableObject):  # pylint: disable=too-many-instance-attributes
 
     def __init__(
@@ -61,37 +70,20 @@ class ChargingStation(AddressableObject):  # pylint: disable=too-many-instance-a
             self.chargingPower.fromDict(fromDict, 'chargingPower')
 
             if 'chargingSpots' in fromDict and fromDict['chargingSpots'] is not None:
-                if len(fromDict['chargingSpots']) == len(self.chargingSpots):
-                    for i, spot in enumerate(fromDict['chargingSpots']):
-                        self.chargingSpots[i].update(fromDict=spot)
-                else:
-                    self.chargingSpots.clear()
-                    for spot in fromDict['chargingSpots']:
-                        self.chargingSpots.append(ChargingStation.ChargingSpot(localAddress=str(
-                            len(self.chargingSpots)), parent=self.chargingSpots, fromDict=spot))
+                self.chargingSpots.reconcile(fromDict['chargingSpots'],
+                                             create=lambda localAddress, spot: ChargingStation.ChargingSpot(localAddress=localAddress,
+                                                                                                            parent=self.chargingSpots, fromDict=spot))
             else:
                 self.chargingSpots.enabled = False
                 self.chargingSpots.clear()
 
             if 'authTypes' in fromDict and fromDict['authTypes'] is not None:
-                if len(fromDict['authTypes']) == len(self.authTypes):
-                    for i, authType in enumerate(fromDict['authTypes']):
-                        try:
-                            authTypeEnum = ChargingStation.AUTHTYPE(authType)
-                        except ValueError:
-                            authTypeEnum = ChargingStation.AUTHTYPE.UNKNOWN
-                            LOG.warning('An unsupported auth type: %s was provided, please report this as a bug', authType)
-                        self.authTypes[i].setValueWithCarTime(authTypeEnum, lastUpdateFromCar=None, fromServer=True)
-                else:
-                    self.authTypes.clear()
-                    for authType in fromDict['authTypes']:
-                        try:
-                            authTypeEnum = ChargingStation.AUTHTYPE(authType)
-                        except ValueError:
-                            authTypeEnum = ChargingStation.AUTHTYPE.UNKNOWN
-                            LOG.warning('An unsupported auth type: %s was provided, please report this as a bug', authType)
-                        self.authTypes.append(AddressableAttribute(localAddress=len(self.authTypes),
-                                              parent=self.authTypes, value=authTypeEnum, valueType=ChargingStation.AUTHTYPE))
+                self.authTypes.reconcile(fromDict['authTypes'],
+                                         create=lambda localAddress, authType: AddressableAttribute(
+                                             localAddress=localAddress, parent=self.authTypes, value=_toEnum(ChargingStation.AUTHTYPE, authType, 'auth type'),
+                                             valueType=ChargingStation.AUTHTYPE),
+                                         update=lambda attribute, authType: attribute.setValueWithCarTime(
+                                             _toEnum(ChargingStation.AUTHTYPE, authType, 'auth type'), lastUpdateFromCar=None, fromServer=True))
             else:
                 self.authTypes.enabled = False
                 self.authTypes.clear()
@@ -110,44 +102,21 @@ class ChargingStation(AddressableObject):  # pylint: disable=too-many-instance-a
                 self.operator = None
 
             if 'vwGroupPartners' in fromDict and fromDict['vwGroupPartners'] is not None:
-                if len(fromDict['vwGroupPartners']) == len(self.vwGroupPartners):
-                    for i, vwGroupPartner in enumerate(fromDict['vwGroupPartners']):
-                        try:
-                            vwGroupPartnerEnum = ChargingStation.VWGROUPPARTNER(vwGroupPartner)
-                        except ValueError:
-                            vwGroupPartnerEnum = ChargingStation.VWGROUPPARTNER.UNKNOWN
-                            LOG.warning('An unsupported vwGroupPartner: %s was provided, please report this as a bug', vwGroupPartner)
-                        self.vwGroupPartners[i].setValueWithCarTime(vwGroupPartnerEnum, lastUpdateFromCar=None, fromServer=True)
-                else:
-                    self.vwGroupPartners.clear()
-                    for vwGroupPartner in fromDict['vwGroupPartners']:
-                        try:
-                            vwGroupPartnerEnum = ChargingStation.VWGROUPPARTNER(vwGroupPartner)
-                        except ValueError:
-                            vwGroupPartnerEnum = ChargingStation.VWGROUPPARTNER.UNKNOWN
-                            LOG.warning('An unsupported vwGroupPartner type: %s was provided, please report this as a bug', authType)
-                        self.vwGroupPartners.append(AddressableAttribute(localAddress=len(self.vwGroupPartners),
-                                                    parent=self.vwGroupPartners, value=vwGroupPartnerEnum, valueType=ChargingStation.VWGROUPPARTNER))
+                self.vwGroupPartners.reconcile(fromDict['vwGroupPartners'],
+                                               create=lambda localAddress, partner: AddressableAttribute(
+                                                   localAddress=localAddress, parent=self.vwGroupPartners,
+                                                   value=_toEnum(ChargingStation.VWGROUPPARTNER, partner, 'vwGroupPartner'),
+                                                   valueType=ChargingStation.VWGROUPPARTNER),
+                                               update=lambda attribute, partner: attribute.setValueWithCarTime(
+                                                   _toEnum(ChargingStation.VWGROUPPARTNER, partner, 'vwGroupPartner'), lastUpdateFromCar=None,
+                                                   fromServer=True))
             else:
                 self.vwGroupPartners.enabled = False
                 self.vwGroupPartners.clear()
 
-            for key, value in {key: value for key, value in fromDict.items()
-                               if key not in ['id',
-                                              'name',
-                                              'latitude',
-                                              'longitude',
-                                              'distance',
-                                              'address',
-                                              'chargingPower',
-                                              'chargingSpots',
-                                              'authTypes',
-                                              'filteredOut',
-                                              'isFavorite',
-                                              'isWeChargePartner',
-                                              'cpoiOperatorInfo',
-                                              'vwGroupPartners']}.items():
-                LOG.warning('%s: Unknown attribute %s with value %s', self.getGlobalAddress(), key, value)
+            schemaDrift.reportUnknownKeys(self, fromDict, ('id', 'name', 'latitude', 'longitude', 'distance', 'address', 'chargingPower',
+                                                           'chargingSpots', 'authTypes', 'filteredOut', 'isFavorite', 'isWeChargePartner',
+                                                           'cpoiOperatorInfo', 'vwGroupPartners'))
 
     class AUTHTYPE(Enum):
         RFID = 'RFID'
@@ -208,9 +177,7 @@ class ChargingStation(AddressableObject):  # pylint: disable=too-many-instance-a
             else:
                 self.street.enabled = False
 
-            for key, value in {key: value for key, value in fromDict.items()
-                               if key not in ['city', 'country', 'postcode', 'street']}.items():
-                LOG.warning('%s: Unknown attribute %s with value %s', self.getGlobalAddress(), key, value)
+            schemaDrift.reportUnknownKeys(self, fromDict, ('city', 'country', 'postcode', 'street'))
 
         def __str__(self):
             returnString = ''
@@ -243,14 +210,9 @@ class ChargingStation(AddressableObject):  # pylint: disable=too-many-instance-a
             LOG.debug('Update charging spot from dict')
 
             if 'connectors' in fromDict and fromDict['connectors'] is not None:
-                if len(fromDict['connectors']) == len(self.connectors):
-                    for i, connector in enumerate(fromDict['connectors']):
-                        self.connectors[i].update(fromDict=connector)
-                else:
-                    self.connectors.clear()
-                    for connector in fromDict['connectors']:
-                        self.connectors.append(ChargingStation.ChargingSpot.Connector(
-                            localAddress=str(len(self.connectors)), parent=self.connectors, fromDict=connector))
+                self.connectors.reconcile(fromDict['connectors'],
+                                          create=lambda localAddress, connector: ChargingStation.ChargingSpot.Connector(
+                                              localAddress=localAddress, parent=self.connectors, fromDict=connector))
             else:
                 self.connectors.enabled = False
                 self.connectors.clear()
@@ -272,9 +234,7 @@ class ChargingStation(AddressableObject):  # pylint: disable=too-many-instance-a
             else:
                 self.available.enabled = False
 
-            for key, value in {key: value for key, value in fromDict.items()
-                               if key not in ['connectors', 'chargingPower', 'available', 'plugTypes']}.items():
-                LOG.warning('%s: Unknown attribute %s with value %s', self.getGlobalAddress(), key, value)
+            schemaDrift.reportUnknownKeys(self, fromDict, ('connectors', 'chargingPower', 'available', 'plugTypes'))
 
         def __str__(self):
             returnString = ''
@@ -335,9 +295,7 @@ class ChargingStation(AddressableObject):  # pylint: disable=too-many-instance-a
                 else:
                     self.chargingPower.enabled = False
 
-                for key, value in {key: value for key, value in fromDict.items()
-                                   if key not in ['plugType', 'chargingPower']}.items():
-                    LOG.warning('%s: Unknown attribute %s with value %s', self.getGlobalAddress(), key, value)
+                schemaDrift.reportUnknownKeys(self, fromDict, ('plugType', 'chargingPower'))
 
             def __str__(self):
                 returnString = ''
@@ -380,9 +338,7 @@ class ChargingStation(AddressableObject):  # pylint: disable=too-many-instance-a
             else:
                 self.phoneNumber.enabled = False
 
-            for key, value in {key: value for key, value in fromDict.items()
-                               if key not in ['name', 'id', 'phoneNumber']}.items():
-                LOG.warning('%s: Unknown attribute %s with value %s', self.getGlobalAddress(), key, value)
+            schemaDrift.reportUnknownKeys(self, fromDict, ('name', 'id', 'phoneNumber'))
 
         def __str__(self):
             returnString = ''
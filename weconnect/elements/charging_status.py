@@ -1,97 +1,38 @@
+from __future__ import annotations
 from enum import Enum
 import logging
 
 from weconnect.addressable import AddressableAttribute
 from weconnect.elements.generic_status import GenericStatus
+from weconnect.elements.helpers.field_schema import Field
 
 LOG = logging.getLogger("weconnect")
 
 
-class ChargingStatus(GenericStatus):
-    def __init__(
-        self,
-        vehicle,
-        parent,
-        statusId,
-        fromDict=None,
-        fixAPI=True,
-    ):
-        self.remainingChargingTimeToComplete_min = AddressableAttribute(
-            localAddress='remainingChargingTimeToComplete_min', parent=self, value=None, valueType=int)
-        self.chargingState = AddressableAttribute(
-            localAddress='chargingState', value=None, parent=self, valueType=ChargingStatus.ChargingState)
-        self.chargeMode = AddressableAttribute(
-            localAddress='chargeMode', value=None, parent=self, valueType=ChargingStatus.ChargeMode)
-        self.chargePower_kW = AddressableAttribute(
-            localAddress='chargePower_kW', value=None, parent=self, valueType=float)
-        self.chargeRate_kmph = AddressableAttribute(
-            localAddress='chargeRate_kmph', value=None, parent=self, valueType=float)
-        self.chargeType = AddressableAttribute(localAddress='chargeType', value=None, parent=self, valueType=ChargingStatus.ChargeType)
-        self.chargingSettings = AddressableAttribute(localAddress='chargingSettings', value=None, parent=self, valueType=str)
-        self.chargingScenario = AddressableAttribute(localAddress='chargingScenario', value=None, parent=self, valueType=ChargingStatus.ChargingScenario)
-        super().__init__(vehicle=vehicle, parent=parent, statusId=statusId, fromDict=fromDict, fixAPI=fixAPI)
-
-    def update(self, fromDict, ignoreAttributes=None):  # noqa: C901
-        ignoreAttributes = ignoreAttributes or []
-        LOG.debug('Update Charging status from dict')
-
-        if 'value' in fromDict:
-            self.remainingChargingTimeToComplete_min.fromDict(fromDict['value'], 'remainingChargingTimeToComplete_min')
-            self.chargingState.fromDict(fromDict['value'], 'chargingState')
-            self.chargeMode.fromDict(fromDict['value'], 'chargeMode')
-            self.chargePower_kW.fromDict(fromDict['value'], 'chargePower_kW')
-            if 'chargePower_kW' in fromDict['value']:
-                chargePower_kW = float(fromDict['value']['chargePower_kW'])
-                if self.fixAPI and chargePower_kW != 0 \
-                        and self.chargingState.value in [ChargingStatus.ChargingState.OFF,
-                                                         ChargingStatus.ChargingState.READY_FOR_CHARGING,
-                                                         ChargingStatus.ChargingState.NOT_READY_FOR_CHARGING,
-                                                         ChargingStatus.ChargingState.CHARGE_PURPOSE_REACHED_NOT_CONSERVATION_CHARGING,
-                                                         ChargingStatus.ChargingState.ERROR]:
-                    chargePower_kW = 0.0
-                    LOG.debug('%s: Attribute chargePower_kW is %s while chargingState is %s. Setting 0 instead',
-                              self.getGlobalAddress(), fromDict['value']['chargePower_kW'], self.chargingState.value)
-                self.chargePower_kW.setValueWithCarTime(chargePower_kW, lastUpdateFromCar=None, fromServer=True)
-            else:
-                self.chargePower_kW.enabled = False
-            if 'chargeRate_kmph' in fromDict['value']:
-                chargeRate_kmph = float(fromDict['value']['chargeRate_kmph'])
-                if self.fixAPI and chargeRate_kmph != 0 \
-                        and self.chargingState.value in [ChargingStatus.ChargingState.OFF,
+def _fixWhileNotCharging(key):
+    def fix(status, value):
+        fixed = float(value)
+        if fixed != 0 and status.chargingState.value in [ChargingStatus.ChargingState.OFF,
                                                          ChargingStatus.ChargingState.READY_FOR_CHARGING,
                                                          ChargingStatus.ChargingState.NOT_READY_FOR_CHARGING,
                                                          ChargingStatus.ChargingState.CHARGE_PURPOSE_REACHED_NOT_CONSERVATION_CHARGING,
                                                          ChargingStatus.ChargingState.ERROR]:
-                    chargeRate_kmph = 0.0
-                    LOG.debug('%s: Attribute chargeRate_kmph is %s while chargingState is %s. Setting 0 instead',
-                              self.getGlobalAddress(), fromDict['value']['chargeRate_kmph'], self.chargingState.value)
-                self.chargeRate_kmph.setValueWithCarTime(chargeRate_kmph, lastUpdateFromCar=None, fromServer=True)
-            else:
-                self.chargeRate_kmph.enabled = False
-            self.chargeType.fromDict(fromDict['value'], 'chargeType')
-            self.chargingSettings.fromDict(fromDict['value'], 'chargingSettings')
-            self.chargingScenario.fromDict(fromDict['value'], 'chargingScenario')
-        else:
-            self.remainingChargingTimeToComplete_min.enabled = False
-            self.chargingState.enabled = False
-            self.chargeMode.enabled = False
-            self.chargePower_kW.enabled = False
-            self.chargeRate_kmph.enabled = False
-            self.chargeType.enabled = False
-            self.chargingSettings.enabled = False
-            self.chargingScenario.enabled = False
+            LOG.debug('%s: Attribute %s is %s while chargingState is %s. Setting 0 instead',
+                      status.getGlobalAddress(), key, value, status.chargingState.value)
+            return 0.0
+        return fixed
+    return fix
 
-        super().update(fromDict=fromDict, ignoreAttributes=(ignoreAttributes
-                                                            + [
-                                                                'remainingChargingTimeToComplete_min',
-                                                                'chargingState',
-                                                                'chargeMode',
-                                                                'chargePower_kW',
-                                                                'chargeRate_kmph',
-                                                                'chargeType',
-                                                                'chargingSettings',
-                                                                'chargingScenario'
-                                                            ]))
+
+class ChargingStatus(GenericStatus):
+    remainingChargingTimeToComplete_min: AddressableAttribute[int]
+    chargingState: AddressableAttribute[ChargingStatus.ChargingState]
+    chargeMode: AddressableAttribute[ChargingStatus.ChargeMode]
+    chargePower_kW: AddressableAttribute[float]
+    chargeRate_kmph: AddressableAttribute[float]
+    chargeType: AddressableAttribute[ChargingStatus.ChargeType]
+    chargingSettings: AddressableAttribute[str]
+    chargingScenario: AddressableAttribute[ChargingStatus.ChargingScenario]
 
     def __str__(self):
         string = super().__str__()
@@ -156,3 +97,16 @@ class ChargingStatus(GenericStatus):
         OPTIMISED_CHARGING_FINISHED = 'optimisedChargingFinished'
         ERROR_CHARGING_SYSTEM = 'errorChargingSystem'
         UNKNOWN = 'unknown charging scenario'
+
+    # Declared after the enums used as value types
+    FIELDS = (
+        Field('remainingChargingTimeToComplete_min', int),
+        # chargingState has to be updated before the fields fixed according to it
+        Field('chargingState', ChargingState),
+        Field('chargeMode', ChargeMode),
+        Field('chargePower_kW', float, fixAPI=_fixWhileNotCharging('chargePower_kW')),
+        Field('chargeRate_kmph', float, fixAPI=_fixWhileNotCharging('chargeRate_kmph')),
+        Field('chargeType', ChargeType),
+        Field('chargingSettings', str),
+        Field('chargingScenario', ChargingScenario),
+    )
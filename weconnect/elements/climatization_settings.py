@@ -176,7 +176,7 @@ class ClimatizationSettings(GenericSettings):
                 settingsDict['windowHeatingEnabled'] = self.windowHeatingEnabled.value
             if self.heaterSource.enabled:
                 settingsDict['heaterSource'] = self.heaterSource.value.value
-            for child in self.getLeafChildren():
+            for child in self.iterLeafChildren():
                 if re.match(regex, child.getLocalAddress()):
                     settingsDict[child.getLocalAddress()] = child.value
             data = json.dumps(settingsDict)
@@ -1,48 +1,26 @@
+from __future__ import annotations
 from enum import Enum
 import logging
 
 from weconnect.addressable import AddressableAttribute
 from weconnect.elements.generic_status import GenericStatus
+from weconnect.elements.helpers.field_schema import Field
 
 LOG = logging.getLogger("weconnect")
 
 
+def _fixRemainingTime(status, value):
+    remainingTime = int(value)
+    if remainingTime != 0 and status.climatisationState.value == ClimatizationStatus.ClimatizationState.OFF:
+        LOG.debug('%s: Attribute remainingClimatisationTime_min is %s while climatisationState is %s. Setting 0 instead',
+                  status.getGlobalAddress(), value, status.climatisationState.value)
+        return 0
+    return remainingTime
+
+
 class ClimatizationStatus(GenericStatus):
-    def __init__(
-        self,
-        vehicle,
-        parent,
-        statusId,
-        fromDict=None,
-        fixAPI=True,
-    ):
-        self.remainingClimatisationTime_min = AddressableAttribute(
-            localAddress='remainingClimatisationTime_min', parent=self, value=None, valueType=int)
-        self.climatisationState = AddressableAttribute(localAddress='climatisationState', value=None, parent=self,
-                                                       valueType=ClimatizationStatus.ClimatizationState)
-        super().__init__(vehicle=vehicle, parent=parent, statusId=statusId, fromDict=fromDict, fixAPI=fixAPI)
-
-    def update(self, fromDict, ignoreAttributes=None):
-        ignoreAttributes = ignoreAttributes or []
-        LOG.debug('Update Climatization status from dict')
-
-        if 'value' in fromDict:
-            self.climatisationState.fromDict(fromDict['value'], 'climatisationState')
-            if 'remainingClimatisationTime_min' in fromDict['value']:
-                remainingTime = int(fromDict['value']['remainingClimatisationTime_min'])
-                if self.fixAPI and remainingTime != 0 and self.climatisationState.value == ClimatizationStatus.ClimatizationState.OFF:
-                    remainingTime = 0
-                    LOG.debug('%s: Attribute remainingClimatisationTime_min is %s while climatisationState is %s. Setting 0 instead',
-                              self.getGlobalAddress(), fromDict['value']['remainingClimatisationTime_min'], self.climatisationState.value)
-                self.remainingClimatisationTime_min.setValueWithCarTime(remainingTime, lastUpdateFromCar=None, fromServer=True)
-            else:
-                self.remainingClimatisationTime_min.enabled = False
-        else:
-            self.remainingClimatisationTime_min.enabled = False
-            self.climatisationState.enabled = False
-
-        super().update(fromDict=fromDict, ignoreAttributes=(
-            ignoreAttributes + ['remainingClimatisationTime_min', 'climatisationState']))
+    climatisationState: AddressableAttribute[ClimatizationStatus.ClimatizationState]
+    remainingClimatisationTime_min: AddressableAttribute[int]
 
     def __str__(self):
         string = super().__str__()
@@ -59,3 +37,10 @@ class ClimatizationStatus(GenericStatus):
         VENTILATION = 'ventilation'
         INVALID = 'invalid'
         UNKNOWN = 'unknown climatization state'
+
+    # Declared after the enums used as value types
+    FIELDS = (
+        # climatisationState has to be updated before remainingClimatisationTime_min is fixed according to it
+        Field('climatisationState', ClimatizationState),
+        Field('remainingClimatisationTime_min', int, fixAPI=_fixRemainingTime),
+    )
@@ -27,17 +27,8 @@ class ClimatizationTimer(GenericStatus):
 
         if 'value' in fromDict:
             if 'timers' in fromDict['value'] and fromDict['value']['timers'] is not None:
-                for climatizationTimerDict in fromDict['value']['timers']:
-                    if 'id' in climatizationTimerDict:
-                        if climatizationTimerDict['id'] in self.timers:
-                            self.timers[climatizationTimerDict['id']].update(fromDict=climatizationTimerDict)
-                        else:
-                            self.timers[climatizationTimerDict['id']] = Timer(
-                                fromDict=climatizationTimerDict, parent=self.timers)
-                for timerId in [timerId for timerId in self.timers.keys()
-                                if timerId not in [timer['id']
-                                for timer in fromDict['value']['timers'] if 'id' in timer]]:
-                    del self.timers[timerId]
+                self.timers.reconcile(fromDict['value']['timers'], key=lambda timer: timer.get('id'),
+                                      create=lambda timerId, timer: Timer(fromDict=timer, parent=self.timers))
             else:
                 self.timers.clear()
                 self.timers.enabled = False
@@ -20,6 +20,10 @@ LOG = logging.getLogger("weconnect")
 
 
 class Controls(AddressableObject):
+    # Statuses the controls are derived from, the vehicle always creates them right away
+    CONTROLLED_STATUSES = (ClimatizationSettings, ChargingSettings, WindowHeatingStatus, AccessStatus, AuxiliaryHeatingTimer, ActiveVentilationTimer,
+                           ParkingPosition)
+
     def __init__(
         self,
         localAddress,
@@ -41,7 +45,8 @@ class Controls(AddressableObject):
     def update(self):  # noqa: C901
         capabilities = self.vehicle.capabilities
         for domain in self.vehicle.domains.values():
-            for status in domain.values():
+            # Statuses that are not created yet are never of one of the CONTROLLED_STATUSES
+            for status in domain.materializedValues():
                 if isinstance(status, ClimatizationSettings) and not status.error.enabled:
                     if self.climatizationControl is None:
                         self.climatizationControl = ChangeableAttribute(
@@ -102,9 +107,10 @@ class Controls(AddressableObject):
             if 'climatisation' not in self.vehicle.domains and 'climatisationSettings' not in self.vehicle.domains['climatisation']:
                 raise ControlError('Could not control climatisation, there are no climatisationSettings for the vehicle available.')
             climatizationSettings = self.vehicle.domains['climatisation']['climatisationSettings']
-            for child in climatizationSettings.getLeafChildren():
-                if isinstance(child, ChangeableAttribute):
-                    settingsDict[child.getLocalAddress()] = child.value
+            with self.vehicle.lock.read():
+                for child in climatizationSettings.iterLeafChildren():
+                    if isinstance(child, ChangeableAttribute):
+                        settingsDict[child.getLocalAddress()] = child.value
             if temperature is not None:
                 if 'targetTemperature_C' in settingsDict:
                     settingsDict['targetTemperature_C'] = temperature
@@ -6,6 +6,7 @@ from weconnect.addressable import AddressableAttribute, AddressableDict, Address
 from weconnect.elements.generic_status import GenericStatus
 
 from weconnect.util import robustTimeParse, toBool
+from weconnect.schema_drift import schemaDrift
 
 LOG = logging.getLogger("weconnect")
 
@@ -33,17 +34,8 @@ class DepartureTimersStatus(GenericStatus):
             self.minSOC_pct.fromDict(fromDict['value'], 'minSOC_pct')
 
             if 'timers' in fromDict['value'] and fromDict['value']['timers'] is not None:
-                for climatizationTimerDict in fromDict['value']['timers']:
-                    if 'id' in climatizationTimerDict:
-                        if climatizationTimerDict['id'] in self.timers:
-                            self.timers[climatizationTimerDict['id']].update(fromDict=climatizationTimerDict)
-                        else:
-                            self.timers[climatizationTimerDict['id']] = DepartureTimersStatus.Timer(
-                                fromDict=climatizationTimerDict, parent=self.timers)
-                for timerId in [timerId for timerId in self.timers.keys()
-                                if timerId not in [timer['id']
-                                for timer in fromDict['value']['timers'] if 'id' in timer]]:
-                    del self.timers[timerId]
+                self.timers.reconcile(fromDict['value']['timers'], key=lambda timer: timer.get('id'),
+                                      create=lambda timerId, timer: DepartureTimersStatus.Timer(fromDict=timer, parent=self.timers))
             else:
                 self.timers.clear()
                 self.timers.enabled = False
@@ -124,25 +116,15 @@ class DepartureTimersStatus(GenericStatus):
                 self.singleTimer = None
 
             if 'preferredChargingTimes' in fromDict and fromDict['preferredChargingTimes'] is not None:
-                for preferredChargingTimeDict in fromDict['preferredChargingTimes']:
-                    if 'id' in preferredChargingTimeDict:
-                        if preferredChargingTimeDict['id'] in self.preferredChargingTimes:
-                            self.preferredChargingTimes[preferredChargingTimeDict['id']].update(fromDict=preferredChargingTimeDict)
-                        else:
-                            self.preferredChargingTimes[preferredChargingTimeDict['id']] = DepartureTimersStatus.Timer.PreferredChargingTimes(
-                                localAddress=preferredChargingTimeDict['id'], fromDict=preferredChargingTimeDict, parent=self.preferredChargingTimes)
-                for timerId in [timerId for timerId in self.preferredChargingTimes.keys()
-                                if timerId not in [timer['id']
-                                for timer in fromDict['preferredChargingTimes'] if 'id' in timer]]:
-                    del self.PreferredChargingTimes[timerId]
+                self.preferredChargingTimes.reconcile(fromDict['preferredChargingTimes'], key=lambda preferredTime: preferredTime.get('id'),
+                                                      create=lambda timeId, preferredTime: DepartureTimersStatus.Timer.PreferredChargingTimes(
+                                                          localAddress=timeId, fromDict=preferredTime, parent=self.preferredChargingTimes))
             else:
                 self.preferredChargingTimes.clear()
                 self.preferredChargingTimes.enabled = False
 
-            for key, value in {key: value for key, value in fromDict.items()
-                               if key not in ['id', 'enabled', 'climatisation', 'charging', 'targetSOC_pct', 'recurringTimer', 'singleTimer',
-                                              'preferredChargingTimes']}.items():
-                LOG.warning('%s: Unknown attribute %s with value %s', self.getGlobalAddress(), key, value)
+            schemaDrift.reportUnknownKeys(self, fromDict, ('id', 'enabled', 'climatisation', 'charging', 'targetSOC_pct', 'recurringTimer',
+                                                           'singleTimer', 'preferredChargingTimes'))
 
         def __str__(self):
             string = f'{self.id}: Enabled: {self.timerEnabled.value}'
@@ -195,34 +177,26 @@ class DepartureTimersStatus(GenericStatus):
                     self.targetTimeLocal.enabled = False
 
                 if 'repetitionDays' in fromDict and fromDict['repetitionDays'] is not None:
-                    for day in fromDict['repetitionDays']:
-                        if day in self.repetitionDays:
-                            self.repetitionDays[day].setValueWithCarTime(True, lastUpdateFromCar=None, fromServer=True)
-                        else:
-                            self.repetitionDays[day] = AddressableAttribute(
-                                localAddress=day, parent=self.repetitionDays, value=True, valueType=bool)
-                    for day in [day for day in self.repetitionDays if day not in fromDict['repetitionDays']]:
-                        del self.repetitionDays[day]
+                    self.repetitionDays.reconcile(fromDict['repetitionDays'], key=lambda day: day,
+                                                  create=lambda day, _: AddressableAttribute(localAddress=day, parent=self.repetitionDays,
+                                                                                             value=True, valueType=bool),
+                                                  update=lambda attribute, _: attribute.setValueWithCarTime(True, lastUpdateFromCar=None,
+                                                                                                            fromServer=True))
                 else:
                     self.repetitionDays.clear()
                     self.repetitionDays.enabled = False
 
                 if 'recurringOn' in fromDict and fromDict['recurringOn'] is not None:
-                    for day, enabled in fromDict['recurringOn'].items():
-                        if day in self.recurringOn:
-                            self.recurringOn[day].setValueWithCarTime(enabled, lastUpdateFromCar=None, fromServer=True)
-                        else:
-                            self.recurringOn[day] = AddressableAttribute(
-                                localAddress=day, parent=self.recurringOn, value=enabled, valueType=bool)
-                    for day in [day for day in self.recurringOn if day not in fromDict['recurringOn']]:
-                        del self.recurringOn[day]
+                    self.recurringOn.reconcile(fromDict['recurringOn'].items(), key=lambda dayEnabled: dayEnabled[0],
+                                               create=lambda day, dayEnabled: AddressableAttribute(localAddress=day, parent=self.recurringOn,
+                                                                                                   value=dayEnabled[1], valueType=bool),
+                                               update=lambda attribute, dayEnabled: attribute.setValueWithCarTime(dayEnabled[1], lastUpdateFromCar=None,
+                                                                                                                  fromServer=True))
                 else:
                     self.recurringOn.clear()
                     self.recurringOn.enabled = False
 
-                for key, value in {key: value for key, value in fromDict.items()
-                                   if key not in ['departureTimeLocal', 'targetTimeLocal', 'repetitionDays', 'recurringOn']}.items():
-                    LOG.warning('%s: Unknown attribute %s with value %s', self.getGlobalAddress(), key, value)
+                schemaDrift.reportUnknownKeys(self, fromDict, ('departureTimeLocal', 'targetTimeLocal', 'repetitionDays', 'recurringOn'))
 
             def __str__(self):
                 string = f'{self.departureTimeLocal.value.strftime("%H:%M")} on '  # pylint: disable=no-member
@@ -273,9 +247,7 @@ class DepartureTimersStatus(GenericStatus):
                 else:
                     self.endTimeLocal.enabled = False
 
-                for key, value in {key: value for key, value in fromDict.items()
-                                   if key not in ['id', 'enabled', 'startTimeLocal', 'endTimeLocal']}.items():
-                    LOG.warning('%s: Unknown attribute %s with value %s', self.getGlobalAddress(), key, value)
+                schemaDrift.reportUnknownKeys(self, fromDict, ('id', 'enabled', 'startTimeLocal', 'endTimeLocal'))
 
             def __str__(self):
                 string = f'{self.id}: Enabled: {self.timerEnabled.value}'
@@ -307,9 +279,7 @@ class DepartureTimersStatus(GenericStatus):
                 else:
                     self.departureDateTimeLocal.enabled = False
 
-                for key, value in {key: value for key, value in fromDict.items()
-                                   if key not in ['departureDateTimeLocal']}.items():
-                    LOG.warning('%s: Unknown attribute %s with value %s', self.getGlobalAddress(), key, value)
+                schemaDrift.reportUnknownKeys(self, fromDict, ('departureDateTimeLocal',))
 
             def __str__(self):
                 returnString = ""
@@ -6,6 +6,7 @@ from datetime import datetime
 
 from weconnect.addressable import AddressableObject, AddressableAttribute
 from weconnect.elements.enums import SpinState
+from weconnect.schema_drift import schemaDrift
 
 if TYPE_CHECKING:
     from weconnect.elements.generic_status import GenericStatus
@@ -82,10 +83,8 @@ class Error(AddressableObject):
         else:
             self.enabled = True
 
-        for key, value in {key: value for key, value in fromDict.items()
-                           if key not in ['code', 'message', 'group', 'info', 'errorTimeStamp', 'retry', 'remainingTries', 'spinLockedWaitingTime',
-                                          'spinState']}.items():
-            LOG.warning('%s: Unknown attribute %s with value %s', self.getGlobalAddress(), key, value)
+        schemaDrift.reportUnknownKeys(self, fromDict, ('code', 'message', 'group', 'info', 'errorTimeStamp', 'retry', 'remainingTries',
+                                                       'spinLockedWaitingTime', 'spinState'))
 
     def __str__(self) -> str:
         returnString = f'Error {self.code.value}: {self.message.value} \n\tinfo: {self.info.value} \n\ttimestamp: {self.timestamp.value}'
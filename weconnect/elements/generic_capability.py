@@ -3,6 +3,7 @@ import logging
 from datetime import datetime
 
 from weconnect.addressable import AddressableObject, AddressableAttribute
+from weconnect.schema_drift import schemaDrift
 
 LOG = logging.getLogger("weconnect")
 
@@ -47,9 +48,7 @@ class GenericCapability(AddressableObject):
         self.expirationDate.fromDict(fromDict, 'expirationDate')
         self.userDisablingAllowed.fromDict(fromDict, 'userDisablingAllowed')
 
-        for key, value in {key: value for key, value in fromDict.items()
-                           if key not in ['id', 'status', 'expirationDate', 'userDisablingAllowed']}.items():
-            LOG.warning('%s: Unknown attribute %s with value %s', self.getGlobalAddress(), key, value)
+        schemaDrift.reportUnknownKeys(self, fromDict, ('id', 'status', 'expirationDate', 'userDisablingAllowed'))
 
     def __str__(self):
         returnString = f'[{self.id.value}]'
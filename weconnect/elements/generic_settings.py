@@ -21,7 +21,7 @@ class GenericSettings(GenericStatus):
             setting = self.id.partition('Settings')[0]
             url = f'https://emea.bff.cariad.digital/vehicle/v1/vehicles/{self.vehicle.vin.value}/{setting}/settings'
             settingsDict = dict()
-            for child in self.getLeafChildren():
+            for child in self.iterLeafChildren():
                 if isinstance(child, ChangeableAttribute) and not isinstance(child, AliasChangeableAttribute):
                     if isinstance(child.value, Enum):  # pylint: disable=no-member # this is a fales positive
                         settingsDict[child.getLocalAddress()] = child.value.value  # pylint: disable=no-member # this is a fales positive
@@ -1,7 +1,8 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, Optional, Dict, Any, List
+from typing import TYPE_CHECKING, ClassVar, Optional, Dict, Any, List, Tuple
 
 from enum import Enum
+import copy
 import logging
 from datetime import datetime, timedelta, timezone
 
@@ -9,14 +10,27 @@ if TYPE_CHECKING:
     from weconnect.elements.vehicle import Vehicle
 
 from weconnect.util import robustTimeParse
-from weconnect.addressable import AddressableObject, AddressableAttribute, AddressableList, AddressableDict
+from weconnect.addressable import AddressableLeaf, AddressableObject, AddressableAttribute, AddressableList, AddressableDict, utcNowSeconds
 from weconnect.elements.control_operation import Operation
 from weconnect.elements.error import Error
+from weconnect.elements.helpers.field_schema import Field, FieldSchema
+from weconnect.schema_drift import schemaDrift
 
 LOG: logging.Logger = logging.getLogger("weconnect")
 
+TIMEZONE_FIX_STEP: timedelta = timedelta(minutes=30)
+
 
 class GenericStatus(AddressableObject):
+    # Plain attributes of the status, created and updated by fieldSchema. Subclasses also annotate them on class level so that static
+    # analysis knows them.
+    FIELDS: ClassVar[Tuple[Field, ...]] = ()
+    fieldSchema: ClassVar[FieldSchema] = FieldSchema((), alwaysKnownKeys=('carCapturedTimestamp',))
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.fieldSchema = FieldSchema(cls.FIELDS, alwaysKnownKeys=('carCapturedTimestamp',))
+
     def __init__(
         self,
         vehicle: Vehicle,
@@ -29,13 +43,48 @@ class GenericStatus(AddressableObject):
         self.fixAPI: bool = fixAPI
         super().__init__(localAddress=statusId, parent=parent)
         self.id: str = statusId
+        self.fieldSchema.createAttributes(self)
         self.carCapturedTimestamp: AddressableAttribute[datetime] = AddressableAttribute(
             localAddress='carCapturedTimestamp', parent=self, value=None, valueType=datetime)
         self.error: Error = Error(localAddress='error', parent=self)
         self.requests: AddressableDict[GenericStatus.Request] = AddressableDict(localAddress='request', parent=self)
+        # Copy of the dict of the last update and the version of the subtree right after it
+        self.lastFromDict: Optional[Dict[str, Any]] = None
+        self.lastVersion: Optional[int] = None
+        # Set when fixAPI moved a carCapturedTimestamp from the future, the fix depends on the current time
+        self.__timestampFixed: bool = False
 
         if fromDict is not None:
-            self.update(fromDict=fromDict)
+            self.__updateAndRemember(fromDict)
+
+    def updateIfChanged(self, fromDict: Dict[str, Any]) -> bool:
+        """Update from fromDict unless it is identical to the dict of the last update and nothing changed in between.
+        For an identical dict only the time of the last update from the server is set on all attributes.
+
+        Returns:
+            bool: True if the status was updated
+        """
+        # A corrected carCapturedTimestamp is corrected again as the result changes with the time
+        if self.enabled and not self.__timestampFixed and self.lastVersion == self.version and self.lastFromDict == fromDict:
+            self.touchFromServer()
+            return False
+        self.__updateAndRemember(fromDict)
+        return True
+
+    def __updateAndRemember(self, fromDict: Dict[str, Any]) -> None:
+        # Copied before update() as some statuses modify the dict they are updated from
+        lastFromDict: Dict[str, Any] = copy.deepcopy(fromDict)
+        self.update(fromDict=fromDict)
+        self.lastFromDict = lastFromDict
+        self.lastVersion = self.version
+
+    def touchFromServer(self) -> None:
+        now = utcNowSeconds()
+        for child in self.iterLeafChildren():
+            if isinstance(child, AddressableAttribute):
+                child.lastUpdateFromServer = now
+                if child.hasObservers(AddressableLeaf.ObserverEvent.UPDATED_FROM_SERVER):
+                    child.notify(AddressableLeaf.ObserverEvent.UPDATED_FROM_SERVER)
 
     def hasError(self) -> bool:
         return self.error.enabled
@@ -46,6 +95,7 @@ class GenericStatus(AddressableObject):
     def update(self, fromDict: Dict[str, Any], ignoreAttributes: Optional[List[str]] = None):  # noqa: C901
         ignoreAttributes = ignoreAttributes or []
         LOG.debug('Update status from dict')
+        self.__timestampFixed = False
 
         if 'value' in fromDict:
             if 'carCapturedTimestamp' in fromDict['value']:
@@ -55,11 +105,12 @@ class GenericStatus(AddressableObject):
                     # Unfortunatly it is unknown what the timezone of the car is. So the best we can do is substract 30
                     # minutes as long as the timestamp is in the future. This will create false results when the query
                     # interval is large
-                    fixed: timedelta = timedelta(hours=0, minutes=0)
-                    while carCapturedTimestamp > datetime.utcnow().replace(tzinfo=timezone.utc):
-                        carCapturedTimestamp -= timedelta(hours=0, minutes=30)
-                        fixed -= timedelta(hours=0, minutes=30)
-                    if fixed > timedelta(hours=0, minutes=0):
+                    ahead: timedelta = carCapturedTimestamp - datetime.now(tz=timezone.utc)
+                    if ahead > timedelta(0):
+                        # Number of 30 minute steps needed to get to or before now, rounded up
+                        fixed: timedelta = -(-ahead // TIMEZONE_FIX_STEP) * TIMEZONE_FIX_STEP
+                        carCapturedTimestamp -= fixed
+                        self.__timestampFixed = True
                         LOG.warning('%s: Attribute carCapturedTimestamp was in the future. Substracted %s to fix this.'
                                     ' This is a problem of the weconnect API and might be fixed in the future',
                                     self.getGlobalAddress(), fixed)
@@ -75,11 +126,13 @@ class GenericStatus(AddressableObject):
                 self.carCapturedTimestamp.enabled = False
 
             if isinstance(fromDict['value'], Dict):
-                for key, value in {key: value for key, value in fromDict['value'].items()
-                                   if key not in (['carCapturedTimestamp'] + ignoreAttributes)
-                                   }.items():
-                    LOG.warning('%s: Unknown attribute %s with value %s', self.getGlobalAddress(), key, value)
+                self.fieldSchema.update(self, fromDict['value'])
+                knownKeys = self.fieldSchema.knownKeys
+                for key, value in fromDict['value'].items():
+                    if key not in knownKeys and key not in ignoreAttributes:
+                        schemaDrift.report(self, key, value)
         else:
+            self.fieldSchema.disable(self)
             self.carCapturedTimestamp.setValueWithCarTime(None, fromServer=True)
             self.carCapturedTimestamp.enabled = False
 
@@ -89,34 +142,15 @@ class GenericStatus(AddressableObject):
             self.error.reset()
 
         if 'requests' in fromDict:
-            requestsToRemove = list(self.requests.keys())
-            for request in fromDict['requests']:
-                key = None
-                if 'requestId' in request:
-                    key = request['requestId']
-                elif 'operation' in request:
-                    key = request['operation']
-                else:
-                    key = "none"
-                if key in self.requests:
-                    self.requests[key].update(fromDict=request)
-                    if key in requestsToRemove:
-                        requestsToRemove.remove(key)
-                else:
-                    newRequest = GenericStatus.Request(localAddress=key, parent=self.requests, fromDict=request)
-                    self.requests[key] = newRequest
-
-            for requestKey in requestsToRemove:
-                self.requests[requestKey].enabled = False
-                del self.requests[requestKey]
-
+            self.requests.reconcile(fromDict['requests'], key=lambda request: request.get('requestId', request.get('operation', 'none')),
+                                    create=lambda key, request: GenericStatus.Request(localAddress=key, parent=self.requests, fromDict=request))
         else:
             self.requests.clear()
             self.requests.enabled = False
 
-        for key, value in {key: value for key, value in fromDict.items()
-                           if key not in (['value', 'error', 'requests'] + ['carCapturedTimestamp'] + ignoreAttributes)}.items():
-            LOG.warning('%s: Unknown element %s with value %s', self.getGlobalAddress(), key, value)
+        for key, value in fromDict.items():
+            if key not in ('value', 'error', 'requests', 'carCapturedTimestamp') and key not in ignoreAttributes:
+                schemaDrift.report(self, key, value)
 
     def __str__(self) -> str:
         returnString: str = f'[{self.id}]'
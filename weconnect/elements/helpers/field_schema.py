@@ -0,0 +1,51 @@
+from __future__ import annotations
+from typing import Any, Callable, Dict, FrozenSet, NamedTuple, Optional, Tuple, Type
+
+from weconnect.addressable import AddressableAttribute, AddressableObject
+
+
+class Field(NamedTuple):
+    """Declaration of a plain attribute of an element that is read from the key of the same name in the 'value' dict.
+
+    fixAPI is called with the element and the raw value if the element has fixAPI enabled. It has to return the converted value to use,
+    None sets the error state (value None). Without the hook or with fixAPI disabled the value is converted according to valueType.
+    """
+    key: str
+    valueType: Any
+    address: Optional[str] = None
+    fixAPI: Optional[Callable[[Any, Any], Any]] = None
+    attributeClass: Type[AddressableAttribute] = AddressableAttribute
+
+
+class FieldSchema:
+    """The fields of an element class. Creates their attributes and updates them in a loop over the fields, the known keys and the
+    attribute names are only computed once per class."""
+
+    def __init__(self, fields: Tuple[Field, ...], alwaysKnownKeys: Tuple[str, ...] = ()) -> None:
+        self.fields: Tuple[Field, ...] = tuple(fields)
+        self.knownKeys: FrozenSet[str] = frozenset([field.key for field in self.fields] + list(alwaysKnownKeys))
+        # (key, attribute name, hook) per field, in declaration order so that hooks can depend on fields updated before
+        self.__steps: Tuple[Tuple[str, str, Optional[Callable[[Any, Any], Any]]], ...] = \
+            tuple((field.key, field.address or field.key, field.fixAPI) for field in self.fields)
+
+    def __len__(self) -> int:
+        return len(self.fields)
+
+    def createAttributes(self, element: AddressableObject) -> None:
+        for field in self.fields:
+            address: str = field.address or field.key
+            setattr(element, address, field.attributeClass(localAddress=address, parent=element, value=None, valueType=field.valueType))
+
+    def update(self, element: Any, valueDict: Dict[str, Any]) -> None:
+        fixAPI: bool = element.fixAPI
+        for key, attributeName, hook in self.__steps:
+            attribute: AddressableAttribute = getattr(element, attributeName)
+            value = valueDict.get(key)
+            if value is not None and hook is not None and fixAPI:
+                attribute.setValueWithCarTime(hook(element, value), lastUpdateFromCar=None, fromServer=True)
+            else:
+                attribute.fromDict(valueDict, key)
+
+    def disable(self, element: Any) -> None:
+        for _, attributeName, _ in self.__steps:
+            getattr(element, attributeName).enabled = False
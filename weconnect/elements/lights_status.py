@@ -3,6 +3,7 @@ import logging
 
 from weconnect.addressable import AddressableAttribute, AddressableObject, AddressableDict
 from weconnect.elements.generic_status import GenericStatus
+from weconnect.schema_drift import schemaDrift
 
 LOG = logging.getLogger("weconnect")
 
@@ -25,15 +26,8 @@ class LightsStatus(GenericStatus):
 
         if 'value' in fromDict:
             if 'lights' in fromDict['value'] and fromDict['value']['lights'] is not None:
-                for lightDict in fromDict['value']['lights']:
-                    if 'name' in lightDict:
-                        if lightDict['name'] in self.lights:
-                            self.lights[lightDict['name']].update(fromDict=lightDict)
-                        else:
-                            self.lights[lightDict['name']] = LightsStatus.Light(fromDict=lightDict, parent=self.lights)
-                for lightName in [lightName for lightName in self.lights.keys()
-                                  if lightName not in [light['name'] for light in fromDict['value']['lights'] if 'name' in light]]:
-                    del self.lights[lightName]
+                self.lights.reconcile(fromDict['value']['lights'], key=lambda light: light.get('name'),
+                                      create=lambda name, light: LightsStatus.Light(fromDict=light, parent=self.lights))
             else:
                 self.lights.clear()
                 self.lights.enabled = False
@@ -74,8 +68,7 @@ class LightsStatus(GenericStatus):
 
             self.status.fromDict(fromDict, 'status')
 
-            for key, value in {key: value for key, value in fromDict.items() if key not in ['name', 'status']}.items():
-                LOG.warning('%s: Unknown attribute %s with value %s', self.getGlobalAddress(), key, value)
+            schemaDrift.reportUnknownKeys(self, fromDict, ('name', 'status'))
 
         def __str__(self):
             return f'{self.id}: {self.status.value.value}'  # pylint: disable=no-member
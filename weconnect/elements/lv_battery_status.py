@@ -1,36 +1,16 @@
+from __future__ import annotations
 from enum import Enum
 import logging
 
 from weconnect.addressable import AddressableAttribute
 from weconnect.elements.generic_status import GenericStatus
+from weconnect.elements.helpers.field_schema import Field
 
 LOG = logging.getLogger("weconnect")
 
 
 class LVBatteryStatus(GenericStatus):
-    def __init__(
-        self,
-        vehicle,
-        parent,
-        statusId,
-        fromDict=None,
-        fixAPI=True,
-    ):
-        self.batterySupport = AddressableAttribute(localAddress='batterySupport', value=None, parent=self,
-                                                   valueType=LVBatteryStatus.BatterySupport)
-        super().__init__(vehicle=vehicle, parent=parent, statusId=statusId, fromDict=fromDict, fixAPI=fixAPI)
-
-    def update(self, fromDict, ignoreAttributes=None):
-        ignoreAttributes = ignoreAttributes or []
-        LOG.debug('Update lv battery status from dict')
-
-        if 'value' in fromDict:
-            self.batterySupport.fromDict(fromDict['value'], 'batterySupport')
-        else:
-            self.batterySupport.enabled = False
-
-        super().update(fromDict=fromDict, ignoreAttributes=(
-            ignoreAttributes + ['batterySupport']))
+    batterySupport: AddressableAttribute[LVBatteryStatus.BatterySupport]
 
     def __str__(self):
         string = super().__str__()
@@ -46,3 +26,8 @@ class LVBatteryStatus(GenericStatus):
         ENABLED = 'enabled'
         INVALID = 'invalid'
         UNKNOWN = 'unknown battery support'
+
+    # Declared after the enums used as value types
+    FIELDS = (
+        Field('batterySupport', BatterySupport),
+    )
@@ -1,47 +1,19 @@
+from __future__ import annotations
 from enum import Enum
 import logging
 
 from weconnect.addressable import AddressableAttribute
 from weconnect.elements.generic_status import GenericStatus
+from weconnect.elements.helpers.field_schema import Field
 
 LOG = logging.getLogger("weconnect")
 
 
 class PlugStatus(GenericStatus):
-    def __init__(
-        self,
-        vehicle,
-        parent,
-        statusId,
-        fromDict=None,
-        fixAPI=True,
-    ):
-        self.plugConnectionState = AddressableAttribute(
-            localAddress='plugConnectionState', parent=self, value=None, valueType=PlugStatus.PlugConnectionState)
-        self.plugLockState = AddressableAttribute(
-            localAddress='plugLockState', value=None, parent=self, valueType=PlugStatus.PlugLockState)
-        self.externalPower = AddressableAttribute(
-            localAddress='externalPower', value=None, parent=self, valueType=PlugStatus.ExternalPower)
-        self.ledColor = AddressableAttribute(localAddress='ledColor', value=None, parent=self, valueType=PlugStatus.LedColor)
-        super().__init__(vehicle=vehicle, parent=parent, statusId=statusId, fromDict=fromDict, fixAPI=fixAPI)
-
-    def update(self, fromDict, ignoreAttributes=None):
-        ignoreAttributes = ignoreAttributes or []
-        LOG.debug('Update Plug status from dict')
-
-        if 'value' in fromDict:
-            self.plugConnectionState.fromDict(fromDict['value'], 'plugConnectionState')
-            self.plugLockState.fromDict(fromDict['value'], 'plugLockState')
-            self.externalPower.fromDict(fromDict['value'], 'externalPower')
-            self.ledColor.fromDict(fromDict['value'], 'ledColor')
-        else:
-            self.plugConnectionState.enabled = False
-            self.plugLockState.enabled = False
-            self.externalPower.enabled = False
-            self.ledColor.enabled = False
-
-        super().update(fromDict=fromDict, ignoreAttributes=(
-            ignoreAttributes + ['plugConnectionState', 'plugLockState', 'externalPower', 'ledColor']))
+    plugConnectionState: AddressableAttribute[PlugStatus.PlugConnectionState]
+    plugLockState: AddressableAttribute[PlugStatus.PlugLockState]
+    externalPower: AddressableAttribute[PlugStatus.ExternalPower]
+    ledColor: AddressableAttribute[PlugStatus.LedColor]
 
     def __str__(self):
         string = super().__str__()
@@ -83,3 +55,11 @@ class PlugStatus(GenericStatus):
         GREEN = 'green'
         RED = 'red'
         UNKNOWN = 'unknown plug led color'
+
+    # Declared after the enums used as value types
+    FIELDS = (
+        Field('plugConnectionState', PlugConnectionState),
+        Field('plugLockState', PlugLockState),
+        Field('externalPower', ExternalPower),
+        Field('ledColor', LedColor),
+    )
@@ -1,51 +1,27 @@
+from __future__ import annotations
 import logging
 
 from weconnect.addressable import AddressableAttribute
 from weconnect.elements.generic_status import GenericStatus
+from weconnect.elements.helpers.field_schema import Field
 
 LOG = logging.getLogger("weconnect")
 
 
 class RangeMeasurements(GenericStatus):
-    def __init__(
-        self,
-        vehicle,
-        parent,
-        statusId,
-        fromDict=None,
-        fixAPI=True,
-    ):
-        self.totalRange_km = AddressableAttribute(
-            localAddress='totalRange_km', value=None, parent=self, valueType=int)
-        self.electricRange = AddressableAttribute(
-            localAddress='electricRange', parent=self, value=None, valueType=int)
-        self.gasolineRange = AddressableAttribute(
-            localAddress='gasolineRange', value=None, parent=self, valueType=int)
-        self.adBlueRange = AddressableAttribute(
-            localAddress='adBlueRange', value=None, parent=self, valueType=int)
-        self.dieselRange = AddressableAttribute(
-            localAddress='dieselRange', value=None, parent=self, valueType=int)
-        super().__init__(vehicle=vehicle, parent=parent, statusId=statusId, fromDict=fromDict, fixAPI=fixAPI)
-
-    def update(self, fromDict, ignoreAttributes=None):
-        ignoreAttributes = ignoreAttributes or []
-        LOG.debug('Update battery status from dict')
-
-        if 'value' in fromDict:
-            self.totalRange_km.fromDict(fromDict['value'], 'totalRange_km')
-            self.electricRange.fromDict(fromDict['value'], 'electricRange')
-            self.gasolineRange.fromDict(fromDict['value'], 'gasolineRange')
-            self.adBlueRange.fromDict(fromDict['value'], 'adBlueRange')
-            self.dieselRange.fromDict(fromDict['value'], 'dieselRange')
-        else:
-            self.totalRange_km.enabled = False
-            self.electricRange.enabled = False
-            self.gasolineRange.enabled = False
-            self.adBlueRange.enabled = False
-            self.dieselRange.enabled = False
-
-        super().update(fromDict=fromDict, ignoreAttributes=(
-            ignoreAttributes + ['totalRange_km', 'electricRange', 'gasolineRange', 'adBlueRange', 'dieselRange']))
+    totalRange_km: AddressableAttribute[int]
+    electricRange: AddressableAttribute[int]
+    gasolineRange: AddressableAttribute[int]
+    adBlueRange: AddressableAttribute[int]
+    dieselRange: AddressableAttribute[int]
+
+    FIELDS = (
+        Field('totalRange_km', int),
+        Field('electricRange', int),
+        Field('gasolineRange', int),
+        Field('adBlueRange', int),
+        Field('dieselRange', int),
+    )
 
     def __str__(self):
         string = super().__str__()
@@ -3,6 +3,7 @@ import logging
 
 from weconnect.addressable import AddressableAttribute, AddressableObject
 from weconnect.elements.generic_status import GenericStatus
+from weconnect.schema_drift import schemaDrift
 
 LOG = logging.getLogger("weconnect")
 
@@ -107,9 +108,7 @@ class RangeStatus(GenericStatus):
 
             self.currentSOC_pct.fromDict(fromDict, 'currentSOC_pct')
 
-            for key, value in {key: value for key, value in fromDict.items()
-                               if key not in ['type', 'currentSOC_pct', 'currentFuelLevel_pct', 'remainingRange_km']}.items():
-                LOG.warning('%s: Unknown attribute %s with value %s', self.getGlobalAddress(), key, value)
+            schemaDrift.reportUnknownKeys(self, fromDict, ('type', 'currentSOC_pct', 'currentFuelLevel_pct', 'remainingRange_km'))
 
         def __str__(self):
             string = ""
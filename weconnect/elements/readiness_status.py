@@ -4,6 +4,7 @@ import logging
 from weconnect.addressable import AddressableObject, AddressableAttribute
 from weconnect.elements.generic_status import GenericStatus
 from weconnect.util import toBool
+from weconnect.schema_drift import schemaDrift
 
 LOG = logging.getLogger("weconnect")
 
@@ -78,9 +79,7 @@ class ReadinessStatus(GenericStatus):
             self.batteryPowerLevel.fromDict(fromDict, 'batteryPowerLevel')
             self.dailyPowerBudgetAvailable.fromDict(fromDict, 'dailyPowerBudgetAvailable')
 
-            for key, value in {key: value for key, value in fromDict.items()
-                               if key not in ['isOnline', 'isActive', 'batteryPowerLevel', 'dailyPowerBudgetAvailable']}.items():
-                LOG.warning('%s: Unknown attribute %s with value %s', self.getGlobalAddress(), key, value)
+            schemaDrift.reportUnknownKeys(self, fromDict, ('isOnline', 'isActive', 'batteryPowerLevel', 'dailyPowerBudgetAvailable'))
 
         def __str__(self):
             returnString = 'Connection State: '
@@ -129,9 +128,7 @@ class ReadinessStatus(GenericStatus):
             else:
                 self.dailyPowerBudgetWarning.enabled = False
 
-            for key, value in {key: value for key, value in fromDict.items()
-                               if key not in ['insufficientBatteryLevelWarning', 'dailyPowerBudgetWarning']}.items():
-                LOG.warning('%s: Unknown attribute %s with value %s', self.getGlobalAddress(), key, value)
+            schemaDrift.reportUnknownKeys(self, fromDict, ('insufficientBatteryLevelWarning', 'dailyPowerBudgetWarning'))
 
         def __str__(self):
             returnString = 'Connection Warning: '
@@ -1,40 +1,22 @@
+from __future__ import annotations
 import logging
 
 from weconnect.addressable import AddressableAttribute
 from weconnect.elements.generic_status import GenericStatus
+from weconnect.elements.helpers.field_schema import Field
 from weconnect.util import kelvinToCelsius
 
 LOG = logging.getLogger("weconnect")
 
 
 class TemperatureBatteryStatus(GenericStatus):
-    def __init__(
-        self,
-        vehicle,
-        parent,
-        statusId,
-        fromDict=None,
-        fixAPI=True,
-    ):
-        self.temperatureHvBatteryMin_K = AddressableAttribute(localAddress='temperatureHvBatteryMin_K', parent=self, value=None, valueType=float)
-        self.temperatureHvBatteryMax_K = AddressableAttribute(localAddress='temperatureHvBatteryMax_K', parent=self, value=None, valueType=float)
-        super().__init__(vehicle=vehicle, parent=parent, statusId=statusId, fromDict=fromDict, fixAPI=fixAPI)
+    temperatureHvBatteryMin_K: AddressableAttribute[float]
+    temperatureHvBatteryMax_K: AddressableAttribute[float]
 
-    def update(self, fromDict, ignoreAttributes=None):
-        ignoreAttributes = ignoreAttributes or []
-        LOG.debug('Update battery temperature status from dict')
-
-        if 'value' in fromDict:
-            self.temperatureHvBatteryMin_K.fromDict(fromDict['value'], 'temperatureHvBatteryMin_K')
-            self.temperatureHvBatteryMax_K.fromDict(fromDict['value'], 'temperatureHvBatteryMax_K')
-
-        else:
-            self.temperatureHvBatteryMin_K.enabled = False
-            self.temperatureHvBatteryMax_K.enabled = False
-
-        super().update(fromDict=fromDict, ignoreAttributes=(ignoreAttributes
-                                                            + ['temperatureHvBatteryMin_K',
-                                                               'temperatureHvBatteryMax_K']))
+    FIELDS = (
+        Field('temperatureHvBatteryMin_K', float),
+        Field('temperatureHvBatteryMax_K', float),
+    )
 
     def __str__(self):
         string = super().__str__()
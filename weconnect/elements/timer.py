@@ -4,6 +4,7 @@ import logging
 from weconnect.addressable import AddressableObject, AddressableAttribute, AddressableDict
 
 from weconnect.util import robustTimeParse, toBool
+from weconnect.schema_drift import schemaDrift
 
 LOG = logging.getLogger("weconnect")
 
@@ -61,9 +62,7 @@ class Timer(AddressableObject):
             self.singleTimer.enabled = False
             self.singleTimer = None
 
-        for key, value in {key: value for key, value in fromDict.items()
-                           if key not in ['id', 'enabled', 'climatisation', 'recurringTimer', 'singleTimer']}.items():
-            LOG.warning('%s: Unknown attribute %s with value %s', self.getGlobalAddress(), key, value)
+        schemaDrift.reportUnknownKeys(self, fromDict, ('id', 'enabled', 'climatisation', 'recurringTimer', 'singleTimer'))
 
     def __str__(self):
         string = f'{self.id}: Enabled: {self.timerEnabled.value}'
@@ -106,34 +105,26 @@ class Timer(AddressableObject):
                 self.targetTime.enabled = False
 
             if 'recurringOn' in fromDict and fromDict['recurringOn'] is not None:
-                for day, state in fromDict['recurringOn'].items():
-                    if day in self.recurringOn:
-                        self.recurringOn[day].setValueWithCarTime(state, lastUpdateFromCar=None, fromServer=True)
-                    else:
-                        self.recurringOn[day] = AddressableAttribute(
-                            localAddress=day, parent=self.recurringOn, value=state, valueType=bool)
-                for day in [day for day in self.recurringOn.keys() if day not in fromDict['recurringOn'].keys()]:
-                    del self.recurringOn[day]
+                self.recurringOn.reconcile(fromDict['recurringOn'].items(), key=lambda dayState: dayState[0],
+                                           create=lambda day, dayState: AddressableAttribute(localAddress=day, parent=self.recurringOn,
+                                                                                             value=dayState[1], valueType=bool),
+                                           update=lambda attribute, dayState: attribute.setValueWithCarTime(dayState[1], lastUpdateFromCar=None,
+                                                                                                            fromServer=True))
             else:
                 self.recurringOn.clear()
                 self.recurringOn.enabled = False
 
             if 'repetitionDays' in fromDict and fromDict['repetitionDays'] is not None:
-                for day in fromDict['repetitionDays']:
-                    if day in self.repetitionDays:
-                        self.repetitionDays[day].setValueWithCarTime(state, lastUpdateFromCar=None, fromServer=True)
-                    else:
-                        self.repetitionDays[day] = AddressableAttribute(
-                            localAddress=day, parent=self.repetitionDays, value=state, valueType=bool)
-                for day in [day for day in self.repetitionDays.keys() if day not in fromDict['repetitionDays']]:
-                    del self.repetitionDays[day]
+                self.repetitionDays.reconcile(fromDict['repetitionDays'], key=lambda day: day,
+                                              create=lambda day, _: AddressableAttribute(localAddress=day, parent=self.repetitionDays,
+                                                                                         value=True, valueType=bool),
+                                              update=lambda attribute, _: attribute.setValueWithCarTime(True, lastUpdateFromCar=None,
+                                                                                                        fromServer=True))
             else:
                 self.repetitionDays.clear()
                 self.repetitionDays.enabled = False
 
-            for key, value in {key: value for key, value in fromDict.items()
-                               if key not in ['startTime', 'targetTime', 'recurringOn', 'repetitionDays']}.items():
-                LOG.warning('%s: Unknown attribute %s with value %s', self.getGlobalAddress(), key, value)
+            schemaDrift.reportUnknownKeys(self, fromDict, ('startTime', 'targetTime', 'recurringOn', 'repetitionDays'))
 
         def __str__(self):
             if self.startTime.enabled:
@@ -202,14 +193,8 @@ class Timer(AddressableObject):
             else:
                 self.startTime.enabled = False
 
-            for key, value in {key: value for key, value in fromDict.items()
-                               if key not in ['startDateTime',
-                                              'targetDateTime',
-                                              'startDateTimeLocal',
-                                              'targetDateTimeLocal',
-                                              'occurringOn',
-                                              'startTime']}.items():
-                LOG.warning('%s: Unknown attribute %s with value %s', self.getGlobalAddress(), key, value)
+            schemaDrift.reportUnknownKeys(self, fromDict, ('startDateTime', 'targetDateTime', 'startDateTimeLocal', 'targetDateTimeLocal',
+                                                           'occurringOn', 'startTime'))
 
         def __str__(self):
             returnString = ""
@@ -5,6 +5,7 @@ from datetime import datetime
 
 from weconnect.addressable import AddressableObject, AddressableAttribute
 from weconnect.elements.enums import CarType
+from weconnect.schema_drift import schemaDrift
 
 LOG = logging.getLogger("weconnect")
 
@@ -59,21 +60,9 @@ class Trip(AddressableObject):  # pylint: disable=too-many-instance-attributes
             self.averageAuxConsumption.fromDict(fromDict, 'averageAuxConsumption')
             self.averageRecuperation.fromDict(fromDict, 'averageRecuperation')
 
-            for key, value in {key: value for key, value in fromDict.items()
-                               if key not in ['id',
-                                              'tripEndTimestamp',
-                                              'tripType',
-                                              'vehicleType',
-                                              'mileage_km',
-                                              'startMileage_km',
-                                              'overallMileage_km',
-                                              'travelTime',
-                                              'averageFuelConsumption',
-                                              'averageElectricConsumption',
-                                              'averageSpeed_kmph',
-                                              'averageAuxConsumption',
-                                              'averageRecuperation']}.items():
-                LOG.warning('%s: Unknown attribute %s with value %s', self.getGlobalAddress(), key, value)
+            schemaDrift.reportUnknownKeys(self, fromDict, ('id', 'tripEndTimestamp', 'tripType', 'vehicleType', 'mileage_km', 'startMileage_km',
+                                                           'overallMileage_km', 'travelTime', 'averageFuelConsumption', 'averageElectricConsumption',
+                                                           'averageSpeed_kmph', 'averageAuxConsumption', 'averageRecuperation'))
 
     class TripType(Enum):
         SHORTTERM = 'shortTerm'
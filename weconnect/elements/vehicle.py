@@ -1,77 +1,252 @@
 from __future__ import annotations
-from typing import Dict, List, Set, Any, Type, Optional, cast, TYPE_CHECKING
+from typing import Callable, Dict, Iterator, List, Set, Any, Tuple, Type, Optional, Union, cast, TYPE_CHECKING
 import os
-from threading import Lock
+from functools import partial, lru_cache
 from enum import Enum
 from datetime import datetime, timedelta
 import base64
 import io
+import importlib
 import logging
+import threading
 
 from weconnect.elements.generic_status import GenericStatus
 
-from requests import exceptions, codes
+from requests import exceptions, codes, Response
 
-from weconnect.addressable import AddressableObject, AddressableAttribute, AddressableDict, AddressableList
+from weconnect.addressable import AddressableLeaf, AddressableObject, AddressableAttribute, AddressableDict, AddressableList
 if TYPE_CHECKING:
     from weconnect.weconnect import WeConnect
 from weconnect.elements.generic_capability import GenericCapability
-from weconnect.elements.generic_request_status import GenericRequestStatus
 from weconnect.elements.controls import Controls
 from weconnect.elements.access_status import AccessStatus
-from weconnect.elements.activeventilation_timer import ActiveVentilationTimer
-from weconnect.elements.auxiliaryheating_timer import AuxiliaryHeatingTimer
-from weconnect.elements.auxiliaryheating_status import AuxiliaryHeatingStatus
-from weconnect.elements.battery_status import BatteryStatus
-from weconnect.elements.lv_battery_status import LVBatteryStatus
-from weconnect.elements.battery_support_status import BatterySupportStatus
-from weconnect.elements.capability_status import CapabilityStatus
 from weconnect.elements.charging_status import ChargingStatus
-from weconnect.elements.charging_settings import ChargingSettings
-from weconnect.elements.charging_care_settings import ChargingCareSettings
-from weconnect.elements.charge_mode import ChargeMode
 from weconnect.elements.climatization_status import ClimatizationStatus
-from weconnect.elements.climatization_settings import ClimatizationSettings
-from weconnect.elements.climatization_timer import ClimatizationTimer
-from weconnect.elements.departure_timers_status import DepartureTimersStatus
-from weconnect.elements.fuel_level_status import FuelLevelStatus
 from weconnect.elements.lights_status import LightsStatus
-from weconnect.elements.maintenance_status import MaintenanceStatus
-from weconnect.elements.warning_lights_status import WarningLightsStatus
+from weconnect.schema_drift import schemaDrift
 from weconnect.elements.parking_position import ParkingPosition
 from weconnect.elements.plug_status import PlugStatus
-from weconnect.elements.range_status import RangeStatus
-from weconnect.elements.window_heating_status import WindowHeatingStatus
-from weconnect.elements.odometer_measurement import OdometerMeasurement
-from weconnect.elements.range_measurements import RangeMeasurements
-from weconnect.elements.readiness_status import ReadinessStatus
-from weconnect.elements.temperature_battery_status import TemperatureBatteryStatus
-from weconnect.elements.temperature_outside_status import TemperatureOutsideStatus
-from weconnect.elements.charging_profiles import ChargingProfiles
 from weconnect.elements.trip import Trip
 from weconnect.errors import APICompatibilityError, RetrievalError, APIError, TooManyRequestsError
-from weconnect.util import toBool
+from weconnect.update_budget import UpdateBudget
+from weconnect.cancellation import CancellationToken, cancellable, raiseIfCancelled
+from weconnect.util import toBool, LazyModule, Image, SUPPORT_IMAGES
 from weconnect.weconnect_errors import ErrorEventType
 from weconnect.domain import Domain
 from weconnect.elements.error import Error
 
 from weconnect.elements.helpers.request_tracker import RequestTracker
+from weconnect.read_write_lock import ReadWriteLock
 
-SUPPORT_IMAGES = False
-try:
-    from PIL import Image, ImageDraw  # type: ignore
-    SUPPORT_IMAGES = True
-except ImportError:
-    pass
+ImageDraw: Any = LazyModule('PIL.ImageDraw')
 
 LOG: logging.Logger = logging.getLogger("weconnect")
 
 
+# Statuses of each domain in the selectivestatus response and the classes they are parsed with, as module.Class below weconnect.elements.
+# The modules are imported by statusClass() when a response contains the status for the first time.
+JOB_KEY_CLASS_MAP: Dict[Domain, Dict[str, str]] = {
+    Domain.ACCESS: {
+        'accessStatus': 'access_status.AccessStatus'
+    },
+    Domain.AUTOMATION: {
+        'climatisationTimer': 'climatization_timer.ClimatizationTimer',
+        'climatisationTimersRequestStatus': 'generic_request_status.GenericRequestStatus',
+        'chargingProfiles': 'charging_profiles.ChargingProfiles',
+    },
+    Domain.ACTIVEVENTILATION: {
+    },
+    Domain.USER_CAPABILITIES: {
+        'capabilitiesStatus': 'capability_status.CapabilityStatus',
+    },
+    Domain.CHARGING: {
+        'batteryStatus': 'battery_status.BatteryStatus',
+        'chargingStatus': 'charging_status.ChargingStatus',
+        'chargingSettings': 'charging_settings.ChargingSettings',
+        'chargeMode': 'charge_mode.ChargeMode',
+        'plugStatus': 'plug_status.PlugStatus',
+        'chargingRequestStatus': 'generic_request_status.GenericRequestStatus',
+        'chargingSettingsRequestStatus': 'generic_request_status.GenericRequestStatus',
+        'chargingCareSettings': 'charging_care_settings.ChargingCareSettings',
+    },
+    Domain.CHARGING_PROFILES: {
+        'chargingProfilesStatus': 'charging_profiles.ChargingProfiles',
+    },
+    Domain.BATTERY_CHARGING_CARE: {
+        'chargingCareSettings': 'charging_care_settings.ChargingCareSettings'
+    },
+    Domain.CLIMATISATION: {
+        'climatisationStatus': 'climatization_status.ClimatizationStatus',
+        'climatisationSettings': 'climatization_settings.ClimatizationSettings',
+        'windowHeatingStatus': 'window_heating_status.WindowHeatingStatus',
+        'climatisationRequestStatus': 'generic_request_status.GenericRequestStatus',
+        'climatisationSettingsRequestStatus': 'generic_request_status.GenericRequestStatus',
+        'auxiliaryHeatingStatus': 'auxiliaryheating_status.AuxiliaryHeatingStatus',
+        'climatisationTemperatureOutside': 'generic_status.GenericStatus',
+    },
+    Domain.CLIMATISATION_TIMERS: {
+        'climatisationTimersStatus': 'climatization_timer.ClimatizationTimer',
+        'activeVentilationTimersStatus': 'activeventilation_timer.ActiveVentilationTimer',
+        'auxiliaryHeatingTimersStatus': 'auxiliaryheating_timer.AuxiliaryHeatingTimer',
+    },
+    Domain.DEPARTURE_TIMERS: {
+        'departureTimersStatus': 'departure_timers_status.DepartureTimersStatus',
+    },
+    Domain.FUEL_STATUS: {
+        'rangeStatus': 'range_status.RangeStatus',
+    },
+    Domain.VEHICLE_LIGHTS: {
+        'lightsStatus': 'lights_status.LightsStatus',
+    },
+    Domain.LV_BATTERY: {
+        'lvBatteryStatus': 'lv_battery_status.LVBatteryStatus',
+    },
+    Domain.READINESS: {
+        'readinessStatus': 'readiness_status.ReadinessStatus',
+        'readinessBatterySupportStatus': 'generic_status.GenericStatus',
+    },
+    Domain.VEHICLE_HEALTH_INSPECTION: {
+        'maintenanceStatus': 'maintenance_status.MaintenanceStatus',
+    },
+    Domain.VEHICLE_HEALTH_WARNINGS: {
+        'warningLights': 'warning_lights_status.WarningLightsStatus',
+    },
+    Domain.OIL_LEVEL: {
+        'oilLevelStatus': 'generic_status.GenericStatus',
+    },
+    Domain.MEASUREMENTS: {
+        'rangeStatus': 'range_measurements.RangeMeasurements',
+        'odometerStatus': 'odometer_measurement.OdometerMeasurement',
+        'oilLevelStatus': 'generic_status.GenericStatus',
+        'measurements': 'generic_status.GenericStatus',
+        'temperatureBatteryStatus': 'temperature_battery_status.TemperatureBatteryStatus',
+        'temperatureOutsideStatus': 'temperature_outside_status.TemperatureOutsideStatus',
+        'fuelLevelStatus': 'fuel_level_status.FuelLevelStatus',
+    },
+    Domain.BATTERY_SUPPORT: {
+        'batterySupportStatus': 'battery_support_status.BatterySupportStatus',
+    }
+}
+_STATUS_CLASSES: Dict[str, Type[GenericStatus]] = {}
+
+
+def statusClass(name: str) -> Type[GenericStatus]:
+    """Class of a status in JOB_KEY_CLASS_MAP, imported on first use"""
+    statusCls: Optional[Type[GenericStatus]] = _STATUS_CLASSES.get(name)
+    if statusCls is None:
+        moduleName, className = name.rsplit('.', 1)
+        statusCls = getattr(importlib.import_module(f'weconnect.elements.{moduleName}'), className)
+        _STATUS_CLASSES[name] = statusCls
+    return statusCls
+
+
+@lru_cache(maxsize=None)
+def badgeImage(badge: str) -> Image.Image:
+    """Badge drawn on the status pictures, loaded when the first status picture is created"""
+    image = Image.open(f'{os.path.dirname(__file__)}/../badges/{badge}.png')
+    image.thumbnail((100, 100))
+    return image
+
+
+# Domains that can be requested as jobs from the selectivestatus endpoint
+JOB_DOMAINS: Tuple[Domain, ...] = tuple(domain for domain in Domain if domain not in (Domain.ALL, Domain.ALL_CAPABLE, Domain.PARKING))
+
+
 class DomainDict(AddressableDict):
+    """Statuses of one domain.
+
+    In lazy mode a status is kept as the raw dict from the response and only created when it is accessed through the dict, with
+    getByAddressString or when the domain is exported with asDict()/toJSON(). Elements of statuses that were not created yet are not part
+    of the tree, so they neither notify observers nor appear in getLeafChildren().
+    """
     def __init__(self, **kwargs):
         self.error: Error = Error(localAddress='error', parent=self)
+        # Statuses not created yet: key -> (factory, fromDict)
+        self.pending: Dict[str, Tuple[Callable[..., GenericStatus], Dict[str, Any]]] = {}
         super(DomainDict, self).__init__(**kwargs)
 
+    def setPending(self, key: str, factory: Callable[..., GenericStatus], fromDict: Dict[str, Any]) -> None:
+        pending = self.pending.get(key)
+        if pending is not None and pending[1] == fromDict:
+            return
+        self.pending[key] = (factory, fromDict)
+        if not self.enabled:
+            self.enabled = True
+        # Let exports with sinceVersion know that there is something new below
+        self.updateVersion(AddressableLeaf.ObserverEvent.VALUE_CHANGED)
+
+    def isMaterialized(self, key: str) -> bool:
+        return dict.__contains__(self, key)
+
+    def materializedValues(self) -> List[GenericStatus]:
+        return list(dict.values(self))
+
+    def materialize(self, key: Optional[str] = None) -> None:
+        """Creates the pending status key, or all pending statuses if key is None"""
+        keys: List[str] = list(self.pending) if key is None else [key]
+        for pendingKey in keys:
+            pending = self.pending.pop(pendingKey, None)
+            if pending is not None:
+                factory, fromDict = pending
+                LOG.debug('Status %s accessed, creating it', pendingKey)
+                self[pendingKey] = factory(fromDict=fromDict)
+
+    def __getitem__(self, key: str) -> GenericStatus:
+        if key in self.pending:
+            self.materialize(key)
+        return super().__getitem__(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self.pending:
+            self.materialize(key)
+        return super().get(key, default)
+
+    def __contains__(self, key: object) -> bool:
+        return dict.__contains__(self, key) or key in self.pending
+
+    def __len__(self) -> int:
+        return dict.__len__(self) + len(self.pending)
+
+    def __iter__(self) -> Iterator[str]:
+        self.materialize()
+        return super().__iter__()
+
+    def keys(self):
+        self.materialize()
+        return super().keys()
+
+    def values(self):
+        self.materialize()
+        return super().values()
+
+    def items(self):
+        self.materialize()
+        return super().items()
+
+    def pop(self, key: str, *args):
+        if key in self.pending:
+            self.materialize(key)
+        return super().pop(key, *args)
+
+    def clear(self) -> None:
+        self.pending.clear()
+        super().clear()
+
+    def asDict(self, filterCallable: Optional[Callable[[Any], None]] = None, sinceVersion: Optional[int] = None):
+        self.materialize()
+        return super().asDict(filterCallable=filterCallable, sinceVersion=sinceVersion)
+
+    def iterRecursiveChildren(self, leaveOnly=False) -> Iterator[AddressableLeaf]:
+        self.materialize()
+        return super().iterRecursiveChildren(leaveOnly=leaveOnly)
+
+    def getByAddressString(self, addressString: str) -> Union[AddressableLeaf, bool]:
+        _, _, childPath = addressString.partition('/')
+        childAddress, _, _ = childPath.partition('/')
+        if childAddress in self.pending:
+            self.materialize(childAddress)
+        return super().getByAddressString(addressString)
+
     def updateError(self, fromDict: Dict[str, Any]):
         if 'error' in fromDict:
             self.error.update(fromDict['error'])
@@ -94,11 +269,14 @@ class Vehicle(AddressableObject):  # pylint: disable=too-many-instance-attribute
         updateCapabilities: bool = True,
         updatePictures: bool = True,
         selective: Optional[list[Domain]] = None,
-        enableTracker: bool = False
+        enableTracker: bool = False,
+        lazyDomains: bool = False,
+        fetchStatus: bool = True
     ) -> None:
         self.weConnect: WeConnect = weConnect
         super().__init__(localAddress=vin, parent=parent)
-        self.lock = Lock()
+        # Held for writing only while data is applied to the vehicle, never during requests
+        self.lock: ReadWriteLock = ReadWriteLock()
         self.vin: AddressableAttribute[str] = AddressableAttribute(localAddress='vin', parent=self, value=None, valueType=str)
         self.role: AddressableAttribute[Vehicle.User.Role] = AddressableAttribute(localAddress='role', parent=self, value=None, valueType=Vehicle.User.Role)
         self.enrollmentStatus: AddressableAttribute[Vehicle.User.EnrollmentStatus] = AddressableAttribute(localAddress='enrollmentStatus', parent=self,
@@ -121,17 +299,32 @@ class Vehicle(AddressableObject):  # pylint: disable=too-many-instance-attribute
         self.coUsers: AddressableList[Vehicle.User] = AddressableList(localAddress='coUsers', parent=self)
         self.controls: Controls = Controls(localAddress='controls', vehicle=self, parent=self)
         self.fixAPI: bool = fixAPI
+        # Keep statuses as raw dicts until they are accessed, see DomainDict
+        self.lazyDomains: bool = lazyDomains
+        # (capabilities version, updateCapabilities, selective) and the jobs planned for it
+        self.__jobsPlan: Optional[Tuple[Tuple[Any, ...], Tuple[str, ...]]] = None
+        # Set once the statuses were fetched and applied for the first time
+        self.__loaded: threading.Event = threading.Event()
 
         if SUPPORT_IMAGES:
             self.__carImages: Dict[str, Image.Image] = {}
-            self.__badges: Dict[Vehicle.Badge, Image.Image] = {}
             self.pictures: AddressableDict[str, Image.Image] = AddressableDict(localAddress='pictures', parent=self)
 
         self.requestTracker: Optional[RequestTracker] = None
         if enableTracker:
             self.requestTracker = RequestTracker(self)
 
-        self.update(fromDict, updateCapabilities=updateCapabilities, updatePictures=updatePictures, selective=selective)
+        self.update(fromDict, updateCapabilities=updateCapabilities, updatePictures=updatePictures, selective=selective, fetchStatus=fetchStatus)
+
+    @property
+    def loaded(self) -> bool:
+        """True once the statuses of the vehicle were fetched for the first time. Vehicles created with fetchStatus=False are in the tree
+        before that, e.g. during the initial load in the background."""
+        return self.__loaded.is_set()
+
+    def waitUntilLoaded(self, timeout: Optional[float] = None) -> bool:
+        """Waits until the statuses of the vehicle were fetched for the first time, returns False if that did not happen within timeout seconds"""
+        return self.__loaded.wait(timeout=timeout)
 
     def enableTracker(self) -> None:
         if self.requestTracker is None:
@@ -152,181 +345,81 @@ class Vehicle(AddressableObject):  # pylint: disable=too-many-instance-attribute
         updateCapabilities: bool = True,
         updatePictures: bool = True,
         force: bool = False,
-        selective: Optional[list[Domain]] = None
+        selective: Optional[list[Domain]] = None,
+        fetchStatus: bool = True
     ) -> None:
-        if fromDict is not None:
-            LOG.debug('Create /update vehicle')
-
-            self.vin.fromDict(fromDict, 'vin')
-            self.role.fromDict(fromDict, 'role')
-            self.enrollmentStatus.fromDict(fromDict, 'enrollmentStatus')
-            self.userRoleStatus.fromDict(fromDict, 'userRoleStatus')
-            self.model.fromDict(fromDict, 'model')
-            self.devicePlatform.fromDict(fromDict, 'devicePlatform')
-            self.nickname.fromDict(fromDict, 'nickname')
-            self.brandCode.fromDict(fromDict, 'brandCode')
-
-            if updateCapabilities and 'capabilities' in fromDict and fromDict['capabilities'] is not None:
-                for capDict in fromDict['capabilities']:
-                    if 'id' in capDict:
-                        if capDict['id'] in self.capabilities:
-                            self.capabilities[capDict['id']].update(fromDict=capDict)
-                        else:
-                            self.capabilities[capDict['id']] = GenericCapability(
-                                capabilityId=capDict['id'], parent=self.capabilities, fromDict=capDict,
-                                fixAPI=self.fixAPI)
-                for capabilityId in [capabilityId for capabilityId in self.capabilities.keys()
-                                     if capabilityId not in [capability['id']
-                                     for capability in fromDict['capabilities'] if 'id' in capability]]:
-                    del self.capabilities[capabilityId]
-            else:
-                self.capabilities.clear()
-                self.capabilities.enabled = False
+        with self.lock.write():
+            if fromDict is not None:
+                LOG.debug('Create /update vehicle')
+
+                self.vin.fromDict(fromDict, 'vin')
+                self.role.fromDict(fromDict, 'role')
+                self.enrollmentStatus.fromDict(fromDict, 'enrollmentStatus')
+                self.userRoleStatus.fromDict(fromDict, 'userRoleStatus')
+                self.model.fromDict(fromDict, 'model')
+                self.devicePlatform.fromDict(fromDict, 'devicePlatform')
+                self.nickname.fromDict(fromDict, 'nickname')
+                self.brandCode.fromDict(fromDict, 'brandCode')
+
+                if updateCapabilities and 'capabilities' in fromDict and fromDict['capabilities'] is not None:
+                    self.capabilities.reconcile(fromDict['capabilities'], key=lambda capability: capability.get('id'),
+                                                create=lambda capabilityId, capability: GenericCapability(capabilityId=capabilityId,
+                                                                                                          parent=self.capabilities,
+                                                                                                          fromDict=capability, fixAPI=self.fixAPI))
+                else:
+                    self.capabilities.clear()
+                    self.capabilities.enabled = False
 
-            if 'images' in fromDict:
-                self.images.setValueWithCarTime(fromDict['images'], lastUpdateFromCar=None, fromServer=True)
-            else:
-                self.images.enabled = False
+                if 'images' in fromDict:
+                    self.images.setValueWithCarTime(fromDict['images'], lastUpdateFromCar=None, fromServer=True)
+                else:
+                    self.images.enabled = False
 
-            if 'tags' in fromDict:
-                self.tags.setValueWithCarTime(fromDict['tags'], lastUpdateFromCar=None, fromServer=True)
-            else:
-                self.tags.enabled = False
-
-            if 'coUsers' in fromDict and fromDict['coUsers'] is not None:
-                for user in fromDict['coUsers']:
-                    if 'id' in user:
-                        usersWithId = [x for x in self.coUsers if x.id.value == user['id']]
-                        if len(usersWithId) > 0:
-                            usersWithId[0].update(fromDict=user)
-                        else:
-                            self.coUsers.append(Vehicle.User(localAddress=str(len(self.coUsers)), parent=self.coUsers, fromDict=user))
-                    else:
+                if 'tags' in fromDict:
+                    self.tags.setValueWithCarTime(fromDict['tags'], lastUpdateFromCar=None, fromServer=True)
+                else:
+                    self.tags.enabled = False
+
+                if 'coUsers' in fromDict and fromDict['coUsers'] is not None:
+                    if any('id' not in user for user in fromDict['coUsers']):
                         raise APICompatibilityError('User is missing id field')
-                # Remove all users that are not in list anymore
-                for user in [user for user in self.coUsers if user.id.value not in [x['id'] for x in fromDict['coUsers']]]:
-                    self.coUsers.remove(user)
-            else:
-                self.coUsers.enabled = False
-                self.coUsers.clear()
-
-            for key, value in {key: value for key, value in fromDict.items()
-                               if key not in ['vin',
-                                              'role',
-                                              'enrollmentStatus',
-                                              'userRoleStatus',
-                                              'model',
-                                              'devicePlatform',
-                                              'nickname',
-                                              'brandCode',
-                                              'capabilities',
-                                              'images',
-                                              'tags',
-                                              'coUsers']}.items():
-                LOG.warning('%s: Unknown attribute %s with value %s', self.getGlobalAddress(), key, value)
+                    self.coUsers.reconcile(fromDict['coUsers'], key=lambda user: user['id'], elementKey=lambda user: user.id.value,
+                                           create=lambda localAddress, user: Vehicle.User(localAddress=localAddress, parent=self.coUsers, fromDict=user))
+                else:
+                    self.coUsers.enabled = False
+                    self.coUsers.clear()
+
+                schemaDrift.reportUnknownKeys(self, fromDict, ('vin', 'role', 'enrollmentStatus', 'userRoleStatus', 'model', 'devicePlatform', 'nickname',
+                                                               'brandCode', 'capabilities', 'images', 'tags', 'coUsers'))
 
+        if not fetchStatus:
+            return
         self.updateStatus(updateCapabilities=updateCapabilities, force=force, selective=selective)
         if SUPPORT_IMAGES and updatePictures:
-            for badge in Vehicle.Badge:
-                badgeImg: Image = Image.open(f'{os.path.dirname(__file__)}/../badges/{badge.value}.png')
-                badgeImg.thumbnail((100, 100))
-                self.__badges[badge] = badgeImg
-
-            self.updatePictures()
-
-    def updateStatus(self, updateCapabilities: bool = True, force: bool = False,  # noqa: C901 # pylint: disable=too-many-branches
-                     selective: Optional[list[Domain]] = None):
-        jobKeyClassMap: Dict[Domain, Dict[str, Type[GenericStatus]]] = {
-            Domain.ACCESS: {
-                'accessStatus': AccessStatus
-            },
-            Domain.AUTOMATION: {
-                'climatisationTimer': ClimatizationTimer,
-                'climatisationTimersRequestStatus': GenericRequestStatus,
-                'chargingProfiles': ChargingProfiles,
-            },
-            Domain.ACTIVEVENTILATION: {
-            },
-            Domain.USER_CAPABILITIES: {
-                'capabilitiesStatus': CapabilityStatus,
-            },
-            Domain.CHARGING: {
-                'batteryStatus': BatteryStatus,
-                'chargingStatus': ChargingStatus,
-                'chargingSettings': ChargingSettings,
-                'chargeMode': ChargeMode,
-                'plugStatus': PlugStatus,
-                'chargingRequestStatus': GenericRequestStatus,
-                'chargingSettingsRequestStatus': GenericRequestStatus,
-                'chargingCareSettings': ChargingCareSettings,
-            },
-            Domain.CHARGING_PROFILES: {
-                'chargingProfilesStatus': ChargingProfiles,
-            },
-            Domain.BATTERY_CHARGING_CARE: {
-                'chargingCareSettings': ChargingCareSettings
-            },
-            Domain.CLIMATISATION: {
-                'climatisationStatus': ClimatizationStatus,
-                'climatisationSettings': ClimatizationSettings,
-                'windowHeatingStatus': WindowHeatingStatus,
-                'climatisationRequestStatus': GenericRequestStatus,
-                'climatisationSettingsRequestStatus': GenericRequestStatus,
-                'auxiliaryHeatingStatus': AuxiliaryHeatingStatus,
-                'climatisationTemperatureOutside': GenericStatus,
-            },
-            Domain.CLIMATISATION_TIMERS: {
-                'climatisationTimersStatus': ClimatizationTimer,
-                'activeVentilationTimersStatus': ActiveVentilationTimer,
-                'auxiliaryHeatingTimersStatus': AuxiliaryHeatingTimer,
-            },
-            Domain.DEPARTURE_TIMERS: {
-                'departureTimersStatus': DepartureTimersStatus,
-            },
-            Domain.FUEL_STATUS: {
-                'rangeStatus': RangeStatus,
-            },
-            Domain.VEHICLE_LIGHTS: {
-                'lightsStatus': LightsStatus,
-            },
-            Domain.LV_BATTERY: {
-                'lvBatteryStatus': LVBatteryStatus,
-            },
-            Domain.READINESS: {
-                'readinessStatus': ReadinessStatus,
-                'readinessBatterySupportStatus': GenericStatus,
-            },
-            Domain.VEHICLE_HEALTH_INSPECTION: {
-                'maintenanceStatus': MaintenanceStatus,
-            },
-            Domain.VEHICLE_HEALTH_WARNINGS: {
-                'warningLights': WarningLightsStatus,
-            },
-            Domain.OIL_LEVEL: {
-                'oilLevelStatus': GenericStatus,
-            },
-            Domain.MEASUREMENTS: {
-                'rangeStatus': RangeMeasurements,
-                'odometerStatus': OdometerMeasurement,
-                'oilLevelStatus': GenericStatus,
-                'measurements': GenericStatus,
-                'temperatureBatteryStatus': TemperatureBatteryStatus,
-                'temperatureOutsideStatus': TemperatureOutsideStatus,
-                'fuelLevelStatus': FuelLevelStatus,
-            },
-            Domain.BATTERY_SUPPORT: {
-                'batterySupportStatus': BatterySupportStatus,
-            }
-        }
-        if self.vin.value is None:
-            raise APIError('')
+            self.__runOrDefer(UpdateBudget.Priority.PICTURES, 'pictures', self.updatePictures)
+
+    @property
+    def jobsPlan(self) -> Optional[Tuple[str, ...]]:
+        """Jobs requested with the last status update, None before the first update"""
+        if self.__jobsPlan is None:
+            return None
+        return self.__jobsPlan[1]
+
+    def planJobs(self, updateCapabilities: bool = True, selective: Optional[list[Domain]] = None) -> Tuple[str, ...]:
+        """Jobs to request from the selectivestatus endpoint. The plan is cached until the capabilities or the selection change."""
+        planKey: Tuple[Any, ...] = (self.capabilities.version, updateCapabilities, None if selective is None else tuple(selective))
+        if self.__jobsPlan is not None and self.__jobsPlan[0] == planKey:
+            return self.__jobsPlan[1]
+
+        jobs: List[str]
         if selective is None:
-            jobs = [domain.value for domain in Domain if domain != Domain.ALL and domain != Domain.ALL_CAPABLE and domain != Domain.PARKING]
+            jobs = [domain.value for domain in JOB_DOMAINS]
         elif Domain.ALL_CAPABLE in selective:
             if self.capabilities:
                 jobs = []
-                for dom in [domain for domain in Domain if domain != Domain.ALL and domain != Domain.ALL_CAPABLE and domain != Domain.PARKING]:
-                    if dom.value in self.capabilities and self.capabilities[dom.value].enabled and not self.capabilities[dom.value].status.enabled:
+                for dom in JOB_DOMAINS:
+                    capability: Optional[GenericCapability] = dict.get(self.capabilities, dom.value)
+                    if capability is not None and capability.enabled and not capability.status.enabled:
                         jobs.append(dom.value)
                 if updateCapabilities:
                     jobs.append(Domain.USER_CAPABILITIES.value)
@@ -336,166 +429,252 @@ class Vehicle(AddressableObject):  # pylint: disable=too-many-instance-attribute
             jobs = ['all']
         else:
             jobs = [domain.value for domain in selective]
-        with self.lock:
-            url: str = 'https://emea.bff.cariad.digital/vehicle/v1/vehicles/' + self.vin.value + '/selectivestatus?jobs=' + ','.join(jobs)
-            data: Optional[Dict[str, Any]] = self.weConnect.fetchData(url, force)
+        self.__jobsPlan = (planKey, tuple(jobs))
+        return self.__jobsPlan[1]
+
+    def updateStatus(self, updateCapabilities: bool = True, force: bool = False, selective: Optional[list[Domain]] = None,
+                     cancellationToken: Optional[CancellationToken] = None) -> None:
+        """Update the statuses of the vehicle. When cancellationToken is cancelled no further request is made and UpdateCancelledError is
+        raised, statuses applied before stay as they are."""
+        with cancellable(cancellationToken):
+            self.__updateStatus(updateCapabilities=updateCapabilities, force=force, selective=selective)
+        self.__loaded.set()
+
+    def __updateStatus(self, updateCapabilities: bool = True, force: bool = False,
+                       selective: Optional[list[Domain]] = None) -> None:
+        if self.vin.value is None:
+            raise APIError('')
+        jobs: Tuple[str, ...] = self.planJobs(updateCapabilities=updateCapabilities, selective=selective)
+        url: str = 'https://emea.bff.cariad.digital/vehicle/v1/vehicles/' + self.vin.value + '/selectivestatus?jobs=' + ','.join(jobs)
+        data: Optional[Dict[str, Any]] = self.weConnect.fetchData(url, force)
+        if data is not None:
             if len(data) == 0:
-                LOG.warning('%s: Vehicle data for %s is empty, this can happen when there are too many requests', self.getGlobalAddress(), self.vin.value)
+                LOG.warning('%s: Vehicle data for %s is empty, this can happen when there are too many requests', self.getGlobalAddress(),
+                            self.vin.value)
+            with self.lock.write():
+                self.__applyStatus(data, updateCapabilities=updateCapabilities)
+
+        if (selective is None or any(x in selective for x in [Domain.ALL, Domain.ALL_CAPABLE, Domain.PARKING])) \
+                and (not updateCapabilities or ('parkingPosition' in self.capabilities and self.capabilities['parkingPosition'].status.value is None)):
+            self.__runOrDefer(UpdateBudget.Priority.PARKING_POSITION, 'parkingPosition', partial(self.updateParkingPosition, force=force))
+
+        if (selective is None or any(x in selective for x in [Domain.ALL, Domain.ALL_CAPABLE, Domain.TRIPS])):
+            self.__runOrDefer(UpdateBudget.Priority.TRIPS, 'trips', partial(self.updateTrips, force=force))
+        # Controls
+        with self.lock.write():
+            self.controls.update()
+
+    def __applyStatus(self, data: Dict[str, Any], updateCapabilities: bool) -> None:
+        """Applies the response of selectivestatus to the domains, called with the write lock held"""
+        # Changes have to be journaled completely, so a journal makes all statuses be created right away
+        lazy: bool = self.lazyDomains and getattr(self.getRoot(), 'changeJournal', None) is None
+        for domain, keyClassMap in JOB_KEY_CLASS_MAP.items():
+            if not updateCapabilities and domain == Domain.USER_CAPABILITIES:
+                continue
+            if domain.value in data:
+                self.__applyDomain(domain, keyClassMap, data[domain.value], lazy=lazy)
+        # check that there is no additional domain than the configured ones
+        knownDomains = [domain.value for domain in JOB_KEY_CLASS_MAP.keys()]
+        for key, value in data.items():
+            if key not in knownDomains:
+                schemaDrift.report(self, key, value)
+
+    def __applyDomain(self, domain: Domain, keyClassMap: Dict[str, str], domainData: Dict[str, Any], lazy: bool) -> None:  # noqa: C901
+        if domain.value not in self.domains:
+            self.domains[domain.value] = DomainDict(localAddress=domain.value, parent=self.domains)
+        domainDict: DomainDict = self.domains[domain.value]
+        # Observers have to see all changes in the domain
+        lazyDomain: bool = lazy and not domainDict.hasObservers(AddressableLeaf.ObserverEvent.ALL)
+        if not lazyDomain and domainDict.pending:
+            domainDict.materialize()
+        for key, className in keyClassMap.items():
+            if key in domainData:
+                if domainDict.isMaterialized(key):
+                    if dict.__getitem__(domainDict, key).updateIfChanged(fromDict=domainData[key]):
+                        LOG.debug('Status %s exists, updated it', key)
+                    continue
+                statusCls: Type[GenericStatus] = statusClass(className)
+                if lazyDomain and not issubclass(statusCls, Controls.CONTROLLED_STATUSES):
+                    domainDict.setPending(key, partial(statusCls, vehicle=self, parent=domainDict, statusId=key, fixAPI=self.fixAPI),
+                                          domainData[key])
+                else:
+                    LOG.debug('Status %s does not exist, creating it', key)
+                    domainDict[key] = statusCls(vehicle=self, parent=domainDict, statusId=key, fromDict=domainData[key], fixAPI=self.fixAPI)
+        if 'error' in domainData:
+            domainDict.updateError(domainData)
+
+        # check that there is no additional status than the configured ones, except for "target" that we merge into
+        # the known ones
+        for key, value in domainData.items():
+            if key not in keyClassMap and key != 'error':
+                schemaDrift.report(self, f'{domain.value}/{key}', value)
+
+    def __runOrDefer(self, priority: UpdateBudget.Priority, name: str, function: Callable[[], None]) -> None:
+        """Runs function now, or after the statuses of all vehicles if the running update has a deadline"""
+        budget: Optional[UpdateBudget] = self.weConnect.budget
+        if budget is None:
+            function()
+        else:
+            budget.defer(priority, f'{self.getGlobalAddress()}/{name}', function)
+
+    def updateParkingPosition(self, force: bool = False) -> None:
+        url = 'https://emea.bff.cariad.digital/vehicle/v1/vehicles/' + self.vin.value + '/parkingposition'
+        data = self.weConnect.fetchData(url, force, allowEmpty=True, allowHttpError=True, allowedErrors=[codes['not_found'],
+                                                                                                         codes['no_content'],
+                                                                                                         codes['bad_gateway'],
+                                                                                                         codes['forbidden']])
+        with self.lock.write():
             if data is not None:
-                for domain, keyClassMap in jobKeyClassMap.items():
-                    if not updateCapabilities and domain == Domain.USER_CAPABILITIES:
-                        continue
-                    if domain.value in data:
-                        if domain.value not in self.domains:
-                            self.domains[domain.value] = DomainDict(localAddress=domain.value, parent=self.domains)
-                        for key, className in keyClassMap.items():
-                            if key in data[domain.value]:
-                                if key in self.domains[domain.value]:
-                                    LOG.debug('Status %s exists, updating it', key)
-                                    self.domains[domain.value][key].update(fromDict=data[domain.value][key])
-                                else:
-                                    LOG.debug('Status %s does not exist, creating it', key)
-                                    self.domains[domain.value][key] = className(vehicle=self, parent=self.domains[domain.value], statusId=key,
-                                                                                fromDict=data[domain.value][key], fixAPI=self.fixAPI)
-                        if 'error' in data[domain.value]:
-                            self.domains[domain.value].updateError(data[domain.value])
-
-                        # check that there is no additional status than the configured ones, except for "target" that we merge into
-                        # the known ones
-                        for key, value in {key: value for key, value in data[domain.value].items()
-                                           if key not in list(keyClassMap.keys()) and key not in ['error']}.items():
-                            LOG.warning('%s: Unknown attribute %s with value %s in domain %s', self.getGlobalAddress(), key, value, domain.value)
-                # check that there is no additional domain than the configured ones
-                for key, value in {key: value for key, value in data.items() if key not in list([domain.value for domain in jobKeyClassMap.keys()])}.items():
-                    LOG.warning('%s: Unknown domain %s with value %s', self.getGlobalAddress(), key, value)
-
-            if (selective is None or any(x in selective for x in [Domain.ALL, Domain.ALL_CAPABLE, Domain.PARKING])) \
-                    and (not updateCapabilities or ('parkingPosition' in self.capabilities and self.capabilities['parkingPosition'].status.value is None)):
-                url = 'https://emea.bff.cariad.digital/vehicle/v1/vehicles/' + self.vin.value + '/parkingposition'
+                if 'parking' not in self.domains:
+                    self.domains['parking'] = DomainDict(localAddress='parking', parent=self.domains)
+                if 'parkingPosition' in self.domains['parking']:
+                    self.domains['parking']['parkingPosition'].update(fromDict=data)
+                else:
+                    self.domains['parking']['parkingPosition'] = ParkingPosition(vehicle=self,
+                                                                                 parent=self.domains['parking'],
+                                                                                 statusId='parkingPosition',
+                                                                                 fromDict=data)
+            else:
+                if self.statusExists('parking', 'parkingPosition'):
+                    parkingPosition: ParkingPosition = cast(ParkingPosition, self.domains['parking']['parkingPosition'])
+                    parkingPosition.latitude.enabled = False
+                    parkingPosition.longitude.enabled = False
+                    parkingPosition.carCapturedTimestamp.setValueWithCarTime(None, fromServer=True)
+                    parkingPosition.carCapturedTimestamp.enabled = False
+                    parkingPosition.enabled = False
+        # The controls depend on the parking position
+        with self.lock.write():
+            self.controls.update()
+
+    def updateTrips(self, force: bool = False) -> None:
+        try:
+            for tripType in [tripType for tripType in Trip.TripType if tripType != Trip.TripType.UNKNOWN]:
+                url = 'https://emea.bff.cariad.digital/vehicle/v1/trips/' + self.vin.value + '/' + tripType.value.lower() + '/last'
+
                 data = self.weConnect.fetchData(url, force, allowEmpty=True, allowHttpError=True, allowedErrors=[codes['not_found'],
                                                                                                                  codes['no_content'],
                                                                                                                  codes['bad_gateway'],
                                                                                                                  codes['forbidden']])
-                if data is not None:
-                    if 'parking' not in self.domains:
-                        self.domains['parking'] = DomainDict(localAddress='parking', parent=self)
-                    if 'parkingPosition' in self.domains['parking']:
-                        self.domains['parking']['parkingPosition'].update(fromDict=data)
-                    else:
-                        self.domains['parking']['parkingPosition'] = ParkingPosition(vehicle=self,
-                                                                                     parent=self.domains['parking'],
-                                                                                     statusId='parkingPosition',
-                                                                                     fromDict=data)
-                else:
-                    if self.statusExists('parking', 'parkingPosition'):
-                        parkingPosition: ParkingPosition = cast(ParkingPosition, self.domains['parking']['parkingPosition'])
-                        parkingPosition.latitude.enabled = False
-                        parkingPosition.longitude.enabled = False
-                        parkingPosition.carCapturedTimestamp.setValueWithCarTime(None, fromServer=True)
-                        parkingPosition.carCapturedTimestamp.enabled = False
-                        parkingPosition.enabled = False
-
-            if (selective is None or any(x in selective for x in [Domain.ALL, Domain.ALL_CAPABLE, Domain.TRIPS])):
-                try:
-                    for tripType in [tripType for tripType in Trip.TripType if tripType != Trip.TripType.UNKNOWN]:
-                        url = 'https://emea.bff.cariad.digital/vehicle/v1/trips/' + self.vin.value + '/' + tripType.value.lower() + '/last'
-
-                        data = self.weConnect.fetchData(url, force, allowEmpty=True, allowHttpError=True, allowedErrors=[codes['not_found'],
-                                                                                                                         codes['no_content'],
-                                                                                                                         codes['bad_gateway'],
-                                                                                                                         codes['forbidden']])
-                        if data is not None and 'data' in data:
-                            if tripType.value in self.trips:
-                                self.trips[tripType.value].update(fromDict=data['data'])
-                            else:
-                                self.trips[tripType.value] = Trip(vehicle=self,
-                                                                  parent=self.trips,
-                                                                  tripType=tripType.value,
-                                                                  fromDict=data['data'])
+                with self.lock.write():
+                    if data is not None and 'data' in data:
+                        if tripType.value in self.trips:
+                            self.trips[tripType.value].update(fromDict=data['data'])
                         else:
-                            if tripType.value in self.trips:
-                                self.trips[tripType.value].enabled = False
-                except TooManyRequestsError:
-                    LOG.warning('Trips could not be fetched for car %s due to too many requests.', self.vin.value)
-        # Controls
-        self.controls.update()
-
-    def updatePictures(self) -> None:  # noqa: C901
+                            self.trips[tripType.value] = Trip(vehicle=self,
+                                                              parent=self.trips,
+                                                              tripType=tripType.value,
+                                                              fromDict=data['data'])
+                    else:
+                        if tripType.value in self.trips:
+                            self.trips[tripType.value].enabled = False
+        except TooManyRequestsError:
+            LOG.warning('Trips could not be fetched for car %s due to too many requests.', self.vin.value)
+
+    def updatePictures(self, cancellationToken: Optional[CancellationToken] = None) -> None:
+        """Update the pictures of the vehicle. When cancellationToken is cancelled running downloads are aborted and UpdateCancelledError
+        is raised, no picture of this call is applied then."""
+        with cancellable(cancellationToken):
+            self.__updatePictures()
+
+    def __updatePictures(self) -> None:  # noqa: C901
         if not SUPPORT_IMAGES:
             return
-        with self.lock:
-            url: str = f'https://emea.bff.cariad.digital/media/v2/vehicle-images/{self.vin.value}?resolution=2x'
-            data = self.weConnect.fetchData(url, allowHttpError=True)
-            if data is not None and 'data' in data:  # pylint: disable=too-many-nested-blocks
-                for image in data['data']:
-                    img = None
-                    cacheDate = None
-                    imageurl: str = image['url']
-                    if self.weConnect.maxAgePictures is not None and self.weConnect.cache is not None and imageurl in self.weConnect.cache:
-                        img, cacheDateString = self.weConnect.cache[imageurl]
-                        img = base64.b64decode(img)
-                        img = Image.open(io.BytesIO(img))
-                        cacheDate = datetime.fromisoformat(cacheDateString)
-                    if img is None or self.weConnect.maxAgePictures is None \
-                            or (cacheDate is not None and cacheDate < (datetime.utcnow() - timedelta(seconds=self.weConnect.maxAgePictures))):
-                        try:
-                            imageDownloadResponse = self.weConnect.session.get(imageurl, stream=True)
+        url: str = f'https://emea.bff.cariad.digital/media/v2/vehicle-images/{self.vin.value}?resolution=2x'
+        data = self.weConnect.fetchData(url, allowHttpError=True)
+        if data is not None and 'data' in data:  # pylint: disable=too-many-nested-blocks
+            images: Dict[str, Image.Image] = {}
+            for image in data['data']:
+                img = None
+                cacheDate = None
+                imageurl: str = image['url']
+                # Restoring from the cache uses cached pictures of any age and downloads nothing
+                offline: bool = self.weConnect.offline
+                if (self.weConnect.maxAgePictures is not None or offline) and self.weConnect.cache is not None and imageurl in self.weConnect.cache:
+                    img, cacheDateString = self.weConnect.cache[imageurl]
+                    img = base64.b64decode(img)
+                    img = Image.open(io.BytesIO(img))
+                    cacheDate = datetime.fromisoformat(cacheDateString)
+                if not offline and (img is None or self.weConnect.maxAgePictures is None
+                                    or (cacheDate is not None and cacheDate < (datetime.utcnow() - timedelta(seconds=self.weConnect.maxAgePictures)))):
+                    try:
+                        imageDownloadResponse = self.weConnect.session.get(imageurl, stream=True, timeout=self.weConnect.requestTimeout())
+                        self.weConnect.recordElapsed(imageDownloadResponse.elapsed)
+                        if imageDownloadResponse.status_code == codes['ok']:
+                            img = self.__readImage(imageDownloadResponse)
+                            if self.weConnect.cache is not None:
+                                buffered = io.BytesIO()
+                                img.save(buffered, format="PNG")
+                                imgStr = base64.b64encode(buffered.getvalue()).decode("utf-8")
+                                self.weConnect.cache[imageurl] = (imgStr, str(datetime.utcnow()))
+                        elif imageDownloadResponse.status_code == codes['unauthorized']:
+                            LOG.info('Server asks for new authorization')
+                            self.weConnect.login()
+                            imageDownloadResponse = self.weConnect.session.get(imageurl, stream=True, timeout=self.weConnect.requestTimeout())
                             self.weConnect.recordElapsed(imageDownloadResponse.elapsed)
                             if imageDownloadResponse.status_code == codes['ok']:
-                                img = Image.open(imageDownloadResponse.raw)
+                                img = self.__readImage(imageDownloadResponse)
                                 if self.weConnect.cache is not None:
                                     buffered = io.BytesIO()
                                     img.save(buffered, format="PNG")
                                     imgStr = base64.b64encode(buffered.getvalue()).decode("utf-8")
                                     self.weConnect.cache[imageurl] = (imgStr, str(datetime.utcnow()))
-                            elif imageDownloadResponse.status_code == codes['unauthorized']:
-                                LOG.info('Server asks for new authorization')
-                                self.weConnect.login()
-                                imageDownloadResponse = self.weConnect.session.get(imageurl, stream=True)
-                                self.weConnect.recordElapsed(imageDownloadResponse.elapsed)
-                                if imageDownloadResponse.status_code == codes['ok']:
-                                    img = Image.open(imageDownloadResponse.raw)
-                                    if self.weConnect.cache is not None:
-                                        buffered = io.BytesIO()
-                                        img.save(buffered, format="PNG")
-                                        imgStr = base64.b64encode(buffered.getvalue()).decode("utf-8")
-                                        self.weConnect.cache[imageurl] = (imgStr, str(datetime.utcnow()))
-                                else:
-                                    self.weConnect.notifyError(self, ErrorEventType.HTTP, str(imageDownloadResponse.status_code),
-                                                               'Could not fetch vehicle image due to server error')
-                                    raise RetrievalError('Could not retrieve vehicle image even after re-authorization.'
-                                                         f' Status Code was: {imageDownloadResponse.status_code}')
+                            else:
                                 self.weConnect.notifyError(self, ErrorEventType.HTTP, str(imageDownloadResponse.status_code),
                                                            'Could not fetch vehicle image due to server error')
-                                raise RetrievalError(f'Could not retrieve vehicle image. Status Code was: {imageDownloadResponse.status_code}')
-                            else:
-                                LOG.warning('Failed downloading picture %s with status code %d will try again in next update', image['id'],
-                                            imageDownloadResponse.status_code)
-                        except exceptions.ConnectionError as connectionError:
-                            self.weConnect.notifyError(self, ErrorEventType.CONNECTION, 'connection',
-                                                       'Could not fetch vehicle image due to connection problem')
-                            raise RetrievalError from connectionError
-                        except exceptions.ChunkedEncodingError as chunkedEncodingError:
-                            self.weConnect.notifyError(self, ErrorEventType.CONNECTION, 'chunked encoding error',
-                                                       'Could not refresh token due to connection problem with chunked encoding')
-                            raise RetrievalError from chunkedEncodingError
-                        except exceptions.ReadTimeout as timeoutError:
-                            self.weConnect.notifyError(self, ErrorEventType.TIMEOUT, 'timeout', 'Could not fetch vehicle image due to timeout')
-                            raise RetrievalError from timeoutError
-                        except exceptions.RetryError as retryError:
-                            raise RetrievalError from retryError
-
-                    if img is not None:
-                        self.__carImages[image['id']] = img
-                        if image['id'] == 'car_34view':
-                            if 'car' in self.pictures:
-                                self.pictures['car'].setValueWithCarTime(self.__carImages['car_34view'], lastUpdateFromCar=None, fromServer=True)
-                            else:
-                                self.pictures['car'] = AddressableAttribute(localAddress='car', parent=self.pictures, value=self.__carImages['car_34view'],
-                                                                            valueType=Image.Image)
+                                raise RetrievalError('Could not retrieve vehicle image even after re-authorization.'
+                                                     f' Status Code was: {imageDownloadResponse.status_code}')
+                            self.weConnect.notifyError(self, ErrorEventType.HTTP, str(imageDownloadResponse.status_code),
+                                                       'Could not fetch vehicle image due to server error')
+                            raise RetrievalError(f'Could not retrieve vehicle image. Status Code was: {imageDownloadResponse.status_code}')
+                        else:
+                            LOG.warning('Failed downloading picture %s with status code %d will try again in next update', image['id'],
+                                        imageDownloadResponse.status_code)
+                    except exceptions.ConnectionError as connectionError:
+                        # The download was aborted by the cancellation of the update
+                        raiseIfCancelled()
+                        self.weConnect.notifyError(self, ErrorEventType.CONNECTION, 'connection',
+                                                   'Could not fetch vehicle image due to connection problem')
+                        raise RetrievalError from connectionError
+                    except exceptions.ChunkedEncodingError as chunkedEncodingError:
+                        raiseIfCancelled()
+                        self.weConnect.notifyError(self, ErrorEventType.CONNECTION, 'chunked encoding error',
+                                                   'Could not refresh token due to connection problem with chunked encoding')
+                        raise RetrievalError from chunkedEncodingError
+                    except exceptions.ReadTimeout as timeoutError:
+                        self.weConnect.notifyError(self, ErrorEventType.TIMEOUT, 'timeout', 'Could not fetch vehicle image due to timeout')
+                        raise RetrievalError from timeoutError
+                    except exceptions.RetryError as retryError:
+                        raise RetrievalError from retryError
+
+                if img is not None:
+                    images[image['id']] = img
+
+            # Only applying the downloaded images needs the lock
+            with self.lock.write():
+                for imageId, img in images.items():
+                    self.__carImages[imageId] = img
+                    if imageId == 'car_34view':
+                        if 'car' in self.pictures:
+                            self.pictures['car'].setValueWithCarTime(self.__carImages['car_34view'], lastUpdateFromCar=None, fromServer=True)
+                        else:
+                            self.pictures['car'] = AddressableAttribute(localAddress='car', parent=self.pictures, value=self.__carImages['car_34view'],
+                                                                        valueType=Image.Image)
 
                 self.updateStatusPicture()
 
+    @staticmethod
+    def __readImage(response: Response) -> Image.Image:
+        """Reads the image from a streamed response in chunks, so that a cancelled update does not wait for the whole download"""
+        buffered = io.BytesIO()
+        try:
+            for chunk in response.iter_content(chunk_size=65536):
+                raiseIfCancelled()
+                buffered.write(chunk)
+        finally:
+            response.close()
+        buffered.seek(0)
+        return Image.open(buffered)
+
     def updateStatusPicture(self) -> None:  # noqa: C901
         if not SUPPORT_IMAGES:
             return
@@ -614,8 +793,8 @@ class Vehicle(AddressableObject):  # pylint: disable=too-many-instance-attribute
             imgWithBadges = img.copy()
             badgeoffset = 0
             for badge in badges:
-                badgeImage = self.__badges[badge].convert("RGBA")
-                imgWithBadges.paste(badgeImage, (0, badgeoffset), badgeImage)
+                badgeRGBA = badgeImage(badge.value).convert("RGBA")
+                imgWithBadges.paste(badgeRGBA, (0, badgeoffset), badgeRGBA)
                 badgeoffset += 110
 
             warningLightoffset = 0
@@ -640,8 +819,8 @@ class Vehicle(AddressableObject):  # pylint: disable=too-many-instance-attribute
 
                 badgeoffset = 0
                 for badge in badges:
-                    badgeImage = self.__badges[badge].convert("RGBA")
-                    carWithBadges.paste(badgeImage, (0, badgeoffset), badgeImage)
+                    badgeRGBA = badgeImage(badge.value).convert("RGBA")
+                    carWithBadges.paste(badgeRGBA, (0, badgeoffset), badgeRGBA)
                     badgeoffset += 110
 
                 warningLightoffset = 0
@@ -5,13 +5,9 @@ import logging
 
 from weconnect.addressable import AddressableAttribute, AddressableObject, AddressableDict
 from weconnect.elements.generic_status import GenericStatus
+from weconnect.schema_drift import schemaDrift
+from weconnect.util import Image, SUPPORT_IMAGES
 
-SUPPORT_IMAGES = False
-try:
-    from PIL import Image  # type: ignore
-    SUPPORT_IMAGES = True
-except ImportError:
-    pass
 
 LOG = logging.getLogger("weconnect")
 
@@ -45,17 +41,9 @@ class WarningLightsStatus(GenericStatus):
                 self.mileage_km.enabled = False
 
             if 'warningLights' in fromDict['value'] and fromDict['value']['warningLights'] is not None:
-                for warningLightDict in fromDict['value']['warningLights']:
-                    if 'messageId' in warningLightDict:
-                        if warningLightDict['messageId'] in self.warningLights:
-                            self.warningLights[warningLightDict['messageId']].update(fromDict=warningLightDict)
-                        else:
-                            self.warningLights[warningLightDict['messageId']] = WarningLightsStatus.WarningLight(fromDict=warningLightDict,
-                                                                                                                 parent=self.warningLights)
-                for warningLightMessageId in [warningLightMessageId for warningLightMessageId in self.warningLights.keys()
-                                              if warningLightMessageId not in [warningLight['messageId'] for warningLight in fromDict['value']['warningLights']
-                                                                               if 'messageId' in warningLight]]:
-                    del self.warningLights[warningLightMessageId]
+                self.warningLights.reconcile(fromDict['value']['warningLights'], key=lambda warningLight: warningLight.get('messageId'),
+                                             create=lambda messageId, warningLight: WarningLightsStatus.WarningLight(fromDict=warningLight,
+                                                                                                                     parent=self.warningLights))
             else:
                 self.warningLights.clear()
                 self.warningLights.enabled = False
@@ -135,10 +123,8 @@ class WarningLightsStatus(GenericStatus):
             self.serviceLead.fromDict(fromDict, 'serviceLead')
             self.customerRelevance.fromDict(fromDict, 'customerRelevance')
 
-            for key, value in {key: value for key, value in fromDict.items() if key not in ['messageId', 'category', 'priority', 'icon', 'iconName',
-                                                                                            'serviceLead', 'customerRelevance', 'text',
-                                                                                            'notificationId', 'iconColor']}.items():
-                LOG.warning('%s: Unknown attribute %s with value %s', self.getGlobalAddress(), key, value)
+            schemaDrift.reportUnknownKeys(self, fromDict, ('messageId', 'category', 'priority', 'icon', 'iconName', 'serviceLead',
+                                                           'customerRelevance', 'text', 'notificationId', 'iconColor'))
 
         def __str__(self):
             returnStr = f'{self.messageId.value}: {self.text.value}'  # pylint: disable=no-member
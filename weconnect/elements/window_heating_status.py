@@ -3,6 +3,7 @@ import logging
 
 from weconnect.addressable import AddressableAttribute, AddressableDict, AddressableObject
 from weconnect.elements.generic_status import GenericStatus
+from weconnect.schema_drift import schemaDrift
 
 LOG = logging.getLogger("weconnect")
 
@@ -76,9 +77,7 @@ class WindowHeatingStatus(GenericStatus):
 
             self.windowHeatingState.fromDict(fromDict, 'windowHeatingState')
 
-            for key, value in {key: value for key, value in fromDict.items()
-                               if key not in ['windowLocation', 'windowHeatingState']}.items():
-                LOG.warning('%s: Unknown attribute %s with value %s', self.getGlobalAddress(), key, value)
+            schemaDrift.reportUnknownKeys(self, fromDict, ('windowLocation', 'windowHeatingState'))
 
         def __str__(self):
             return f'{self.id}: {self.windowHeatingState.value.value}'  # pylint: disable=no-member
@@ -28,3 +28,11 @@ class APICompatibilityError(Exception):
 
 class APIError(Exception):
     pass
+
+
+class DeadlineExceededError(RetrievalError):
+    pass
+
+
+class UpdateCancelledError(Exception):
+    pass
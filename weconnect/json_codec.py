@@ -0,0 +1,99 @@
+from __future__ import annotations
+from typing import Any, Union
+
+from datetime import datetime
+from enum import Enum
+import json
+import re
+
+from weconnect.util import ExtendedEncoder, ExtendedWithNullEncoder
+
+SUPPORT_ORJSON = False
+try:
+    import orjson  # type: ignore
+    SUPPORT_ORJSON = True
+except ImportError:
+    pass
+
+
+class JsonCodec:
+    """Encodes and decodes JSON with the json module of the standard library.
+
+    Values that are no JSON types are encoded like ExtendedEncoder does (datetime as isoformat string, Enum as its value). With
+    unknownAsNull all other unknown values become null like with ExtendedWithNullEncoder.
+    """
+    name: str = 'json'
+
+    # Methods instead of static methods so that subclasses using other libraries can override them
+    def loads(self, data: Union[str, bytes, bytearray]) -> Any:  # pylint: disable=no-self-use
+        return json.loads(data)
+
+    def dumps(self, obj: Any, indent: bool = False, unknownAsNull: bool = False) -> str:  # pylint: disable=no-self-use
+        if unknownAsNull:
+            return json.dumps(obj, cls=ExtendedWithNullEncoder, skipkeys=True, indent=(4 if indent else None))
+        return json.dumps(obj, cls=ExtendedEncoder, indent=(4 if indent else None))
+
+
+class OrjsonCodec(JsonCodec):
+    """Encodes and decodes JSON with orjson.
+
+    The output is the same as the one of JsonCodec except that characters outside of ASCII are not escaped. Objects orjson cannot encode
+    (e.g. dicts with keys that are no strings) are handed to JsonCodec.
+    """
+    name: str = 'orjson'
+
+    # orjson only indents with two spaces, the line breaks are the same as with json.dumps(indent=4)
+    __INDENT = re.compile(r'^( +)', re.MULTILINE)
+
+    def loads(self, data: Union[str, bytes, bytearray]) -> Any:  # pylint: disable=no-self-use
+        return orjson.loads(data)
+
+    def dumps(self, obj: Any, indent: bool = False, unknownAsNull: bool = False) -> str:
+        option: int = orjson.OPT_PASSTHROUGH_DATETIME
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            encoded: str = orjson.dumps(obj, default=(OrjsonCodec.__defaultWithNull if unknownAsNull else OrjsonCodec.__default),
+                                        option=option).decode('utf-8')
+        except orjson.JSONEncodeError:
+            return super().dumps(obj, indent=indent, unknownAsNull=unknownAsNull)
+        if indent:
+            return OrjsonCodec.__INDENT.sub(lambda match: match.group(1) * 2, encoded)
+        return encoded
+
+    @staticmethod
+    def __default(o: Any) -> Any:
+        if isinstance(o, datetime):
+            return o.isoformat()
+        if isinstance(o, Enum):
+            return o.value
+        raise TypeError(f'Object of type {o.__class__.__name__} is not JSON serializable')
+
+    @staticmethod
+    def __defaultWithNull(o: Any) -> Any:
+        if isinstance(o, datetime):
+            return o.isoformat()
+        if isinstance(o, Enum):
+            return o.value
+        return None
+
+
+_codec: JsonCodec = OrjsonCodec() if SUPPORT_ORJSON else JsonCodec()
+
+
+def getCodec() -> JsonCodec:
+    return _codec
+
+
+def setCodec(codec: JsonCodec) -> None:
+    """Replaces the codec used for responses, the cache and toJSON(), e.g. setCodec(JsonCodec()) to always use the standard library"""
+    global _codec  # pylint: disable=global-statement,invalid-name
+    _codec = codec
+
+
+def loads(data: Union[str, bytes, bytearray]) -> Any:
+    return _codec.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False, unknownAsNull: bool = False) -> str:
+    return _codec.dumps(obj, indent=indent, unknownAsNull=unknownAsNull)
@@ -0,0 +1,97 @@
+from __future__ import annotations
+from typing import Iterator, Optional
+
+import threading
+from contextlib import contextmanager
+
+
+class ReadWriteLock:
+    """Lock that any number of readers can hold at the same time while a writer holds it exclusively.
+
+    Waiting writers are preferred over new readers so that a steady stream of readers cannot starve an update. Both sides are reentrant and
+    the thread holding the write side can also acquire the read side, e.g. in observers called while data is applied. Upgrading from the read
+    to the write side is not possible as two upgrading readers would wait for each other.
+
+    Used as a context manager (with lock:) it acquires the write side, like the plain lock it replaces.
+    """
+
+    def __init__(self) -> None:
+        self.__condition: threading.Condition = threading.Condition(threading.Lock())
+        self.__readers: int = 0
+        self.__writer: Optional[int] = None
+        self.__writerDepth: int = 0
+        self.__waitingWriters: int = 0
+        self.__local: threading.local = threading.local()
+
+    def acquireRead(self, timeout: Optional[float] = None) -> bool:
+        """Acquires the read side, returns False if it could not be acquired within timeout seconds"""
+        readDepth: int = getattr(self.__local, 'readDepth', 0)
+        with self.__condition:
+            if readDepth == 0 and self.__writer != threading.get_ident():
+                if not self.__condition.wait_for(lambda: self.__writer is None and self.__waitingWriters == 0, timeout=timeout):
+                    return False
+            self.__readers += 1
+        self.__local.readDepth = readDepth + 1
+        return True
+
+    def releaseRead(self) -> None:
+        with self.__condition:
+            self.__readers -= 1
+            if self.__readers == 0:
+                self.__condition.notify_all()
+        self.__local.readDepth -= 1
+
+    def acquireWrite(self, timeout: Optional[float] = None) -> bool:
+        """Acquires the write side, returns False if it could not be acquired within timeout seconds"""
+        me: int = threading.get_ident()
+        with self.__condition:
+            if self.__writer == me:
+                self.__writerDepth += 1
+                return True
+            if getattr(self.__local, 'readDepth', 0) > 0:
+                raise RuntimeError('The write side cannot be acquired while holding the read side')
+            self.__waitingWriters += 1
+            try:
+                acquired: bool = self.__condition.wait_for(lambda: self.__writer is None and self.__readers == 0, timeout=timeout)
+            finally:
+                self.__waitingWriters -= 1
+                if self.__waitingWriters == 0:
+                    # Readers held back for this writer may go on if it gave up
+                    self.__condition.notify_all()
+            if not acquired:
+                return False
+            self.__writer = me
+            self.__writerDepth = 1
+            return True
+
+    def releaseWrite(self) -> None:
+        with self.__condition:
+            if self.__writer != threading.get_ident():
+                raise RuntimeError('The write side is not held by this thread')
+            self.__writerDepth -= 1
+            if self.__writerDepth == 0:
+                self.__writer = None
+                self.__condition.notify_all()
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        self.acquireRead()
+        try:
+            yield
+        finally:
+            self.releaseRead()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        self.acquireWrite()
+        try:
+            yield
+        finally:
+            self.releaseWrite()
+
+    def __enter__(self) -> ReadWriteLock:
+        self.acquireWrite()
+        return self
+
+    def __exit__(self, excType, excValue, traceback) -> None:
+        self.releaseWrite()
@@ -0,0 +1,75 @@
+from __future__ import annotations
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import logging
+from datetime import datetime
+from threading import Lock
+
+from weconnect.addressable import AddressableLeaf, utcNowSeconds
+
+LOG: logging.Logger = logging.getLogger("weconnect")
+
+
+class SchemaDriftRegistry:
+    """Keys in API responses that the element classes do not know.
+
+    Each unknown key is logged once per element class when it is seen the first time, later occurrences are only counted.
+    """
+
+    class Entry:
+        def __init__(self, className: str, key: str, address: str, value: Any, firstSeen: datetime) -> None:
+            self.className: str = className
+            self.key: str = key
+            # Address and value of the first occurrence
+            self.address: str = address
+            self.value: Any = value
+            self.firstSeen: datetime = firstSeen
+            self.lastSeen: datetime = firstSeen
+            self.count: int = 1
+
+        def __str__(self) -> str:
+            return f'{self.className}: {self.key} (seen {self.count} times, first at {self.address} with value {self.value})'
+
+    def __init__(self) -> None:
+        self.__lock: Lock = Lock()
+        self.__entries: Dict[Tuple[type, str], SchemaDriftRegistry.Entry] = {}
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def report(self, element: AddressableLeaf, key: str, value: Any) -> bool:
+        """Records the unknown key of element. Returns True if the key is new for the class of element."""
+        entry: Optional[SchemaDriftRegistry.Entry] = self.__entries.get((type(element), key))
+        if entry is not None:
+            with self.__lock:
+                entry.count += 1
+                entry.lastSeen = utcNowSeconds()
+            return False
+        with self.__lock:
+            if (type(element), key) in self.__entries:
+                self.__entries[(type(element), key)].count += 1
+                return False
+            address: str = element.getGlobalAddress()
+            self.__entries[(type(element), key)] = SchemaDriftRegistry.Entry(className=type(element).__qualname__, key=key, address=address,
+                                                                             value=value, firstSeen=utcNowSeconds())
+        LOG.warning('%s: Unknown attribute %s with value %s', address, key, value)
+        return True
+
+    def reportUnknownKeys(self, element: AddressableLeaf, fromDict: Dict[str, Any], knownKeys: Iterable[str]) -> None:
+        """Reports all keys of fromDict that are not in knownKeys"""
+        for key, value in fromDict.items():
+            if key not in knownKeys:
+                self.report(element, key, value)
+
+    def entries(self, className: Optional[str] = None) -> List[SchemaDriftRegistry.Entry]:
+        """All unknown keys seen so far, optionally only those of the element class with the (qualified) name className"""
+        with self.__lock:
+            return [entry for entry in self.__entries.values() if className is None or entry.className == className]
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+
+
+# Shared by all trees as the known keys are a property of the element classes
+schemaDrift: SchemaDriftRegistry = SchemaDriftRegistry()
@@ -0,0 +1,166 @@
+from __future__ import annotations
+from typing import Any, Callable, Dict, Iterator, Mapping, NamedTuple, Optional, Tuple, Union
+
+import copy
+from datetime import datetime
+
+from weconnect.addressable import AddressableObject, AddressableAttribute, updateCycle, utcNowSeconds
+from weconnect.read_write_lock import ReadWriteLock
+from weconnect.util import isImage
+from weconnect import json_codec
+
+
+class AttributeSnapshot(NamedTuple):
+    """Value of an attribute at the time of the snapshot"""
+    value: Any
+    lastChange: Optional[datetime]
+    version: int
+
+    def asDict(self, filterCallable: Optional[Callable[[Any], bool]] = None) -> Any:
+        if filterCallable is None or not filterCallable(self.value):
+            return self.value
+        return None
+
+
+class PendingSnapshot:
+    """Stands in for a status that is not created yet (see DomainDict). The status is parsed from the raw dict into a copy outside of the
+    tree when the snapshot is accessed, so taking a snapshot neither creates statuses nor changes the tree."""
+    __slots__ = ('localAddress', 'fromDict', '__factory', '__timestamp', '__snapshot')
+
+    def __init__(self, localAddress: str, factory: Callable[..., AddressableObject], fromDict: Dict[str, Any], timestamp: datetime) -> None:
+        self.localAddress: str = localAddress
+        # The raw dict of the status, the same object as long as the status did not change
+        self.fromDict: Dict[str, Any] = fromDict
+        self.__factory: Optional[Callable[..., AddressableObject]] = factory
+        self.__timestamp: datetime = timestamp
+        self.__snapshot: Optional[ObjectSnapshot] = None
+
+    def resolve(self) -> ObjectSnapshot:
+        snapshot: Optional[ObjectSnapshot] = self.__snapshot
+        if snapshot is None:
+            factory = self.__factory
+            if factory is None:
+                # Resolved by another thread in the meantime
+                return self.__snapshot  # type: ignore
+            # Parsers may modify the dict they get, the status is created from a copy and with the time of the snapshot
+            with updateCycle(self.__timestamp):
+                status: AddressableObject = factory(fromDict=copy.deepcopy(self.fromDict),
+                                                    parent=AddressableObject(localAddress='', parent=None))
+            snapshot = _takeSnapshot(status, None, None)
+            self.__snapshot = snapshot
+            self.__factory = None
+        return snapshot
+
+
+class ObjectSnapshot(Mapping[str, Union['ObjectSnapshot', AttributeSnapshot]]):
+    """Read-only copy of an element and its enabled children.
+
+    Children are available by their local address as items (snapshot['domains']) and as attributes (snapshot.domains). Snapshots never
+    change, subtrees that did not change between two snapshots are the same objects in both.
+    """
+    __slots__ = ('localAddress', 'version', 'timestamp', '_ObjectSnapshot__children')
+
+    def __init__(self, localAddress: str, version: int, children: Dict[str, Union[ObjectSnapshot, AttributeSnapshot, PendingSnapshot]],
+                 timestamp: Optional[datetime] = None) -> None:
+        object.__setattr__(self, 'localAddress', localAddress)
+        object.__setattr__(self, 'version', version)
+        # Time of the update the snapshot was taken after, only set for the root
+        object.__setattr__(self, 'timestamp', timestamp)
+        object.__setattr__(self, '_ObjectSnapshot__children', children)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError('Snapshots are read-only')
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError('Snapshots are read-only')
+
+    def __getattr__(self, name: str) -> Union[ObjectSnapshot, AttributeSnapshot]:
+        if name.startswith('__'):
+            raise AttributeError(name)
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(f'{self.localAddress} has no child {name}') from None
+
+    def __getitem__(self, key: str) -> Union[ObjectSnapshot, AttributeSnapshot]:
+        child = self.__children[key]
+        if isinstance(child, PendingSnapshot):
+            return child.resolve()
+        return child
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.__children
+
+    def rawChild(self, key: str) -> Union[ObjectSnapshot, AttributeSnapshot, PendingSnapshot, None]:
+        """Child key without parsing it if it is a pending status, None if there is no such child"""
+        return self.__children.get(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__children)
+
+    def __len__(self) -> int:
+        return len(self.__children)
+
+    def getByAddressString(self, addressString: str) -> Union[ObjectSnapshot, AttributeSnapshot, None]:
+        """Child at the address relative to this snapshot (e.g. 'vehicles/VIN/domains'), None if there is no such child"""
+        element: Union[ObjectSnapshot, AttributeSnapshot] = self
+        for localAddress in addressString.strip('/').split('/'):
+            if not localAddress:
+                continue
+            if not isinstance(element, ObjectSnapshot) or localAddress not in element:
+                return None
+            element = element[localAddress]
+        return element
+
+    def asDict(self, filterCallable: Optional[Callable[[Any], bool]] = None) -> Dict[str, Any]:
+        asDict: Dict[str, Any] = {}
+        for localAddress in self.__children:
+            childDict = self[localAddress].asDict(filterCallable=filterCallable)
+            if childDict is not None:
+                asDict[localAddress] = childDict
+        return asDict
+
+    def toJSON(self) -> str:
+        return json_codec.dumps(self.asDict(filterCallable=isImage), indent=True, unknownAsNull=True)
+
+    def __repr__(self) -> str:
+        return f'ObjectSnapshot({self.localAddress!r}, version={self.version})'
+
+
+def takeSnapshot(element: AddressableObject, previous: Optional[ObjectSnapshot] = None,
+                 timestamp: Optional[datetime] = None) -> ObjectSnapshot:
+    """Snapshot of element. Subtrees of previous (a snapshot of the same element) that have the version of the element are reused."""
+    if previous is not None and previous.version == element.version and timestamp == previous.timestamp:
+        return previous
+    # Elements with their own lock (WeConnect, Vehicle) are copied while no data is applied to them
+    lock: Optional[ReadWriteLock] = getattr(element, 'lock', None)
+    if isinstance(lock, ReadWriteLock):
+        with lock.read():
+            return _takeSnapshot(element, previous, timestamp)
+    return _takeSnapshot(element, previous, timestamp)
+
+
+def _takeSnapshot(element: AddressableObject, previous: Optional[ObjectSnapshot], timestamp: Optional[datetime]) -> ObjectSnapshot:
+    children: Dict[str, Union[ObjectSnapshot, AttributeSnapshot, PendingSnapshot]] = {}
+    for child in element.children:
+        if not child.enabled:
+            continue
+        localAddress: str = child.getLocalAddress()
+        previousChild = previous.rawChild(localAddress) if previous is not None else None
+        if isinstance(child, AddressableObject):
+            children[localAddress] = takeSnapshot(child, previousChild if isinstance(previousChild, ObjectSnapshot) else None)
+        elif isinstance(previousChild, AttributeSnapshot) and previousChild.version == child.version:
+            children[localAddress] = previousChild
+        elif isinstance(child, AddressableAttribute):
+            children[localAddress] = AttributeSnapshot(child.value, child.lastChange, child.version)
+    # Statuses kept as raw dicts are not created, the snapshot keeps their dicts
+    pending: Optional[Dict[str, Tuple[Callable[..., AddressableObject], Dict[str, Any]]]] = getattr(element, 'pending', None)
+    if pending:
+        pendingTimestamp: datetime = timestamp or utcNowSeconds()
+        for localAddress, (factory, fromDict) in list(pending.items()):
+            previousChild = previous.rawChild(localAddress) if previous is not None else None
+            if isinstance(previousChild, PendingSnapshot) and previousChild.fromDict is fromDict:
+                children[localAddress] = previousChild
+            else:
+                children[localAddress] = PendingSnapshot(localAddress, factory, fromDict, pendingTimestamp)
+    return ObjectSnapshot(element.getLocalAddress(), element.version, children, timestamp=timestamp)
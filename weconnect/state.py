@@ -0,0 +1,186 @@
+"""Saving and loading the state of the vehicles and charging stations of a WeConnect instance.
+
+The elements are stored as they are, with their values, enabled flags, timestamps, versions, request trackers and pictures (as raw image
+data), so loading a state does not run the element parsers and keeps the time of every change. The file is a short header followed by
+the pickled elements compressed with zlib. Like any pickle it must only be loaded from trusted files, e.g. written by the same service.
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+import io
+import pickle  # nosec
+import struct
+import threading
+import types
+import zlib
+from datetime import datetime
+from enum import Enum
+
+from weconnect.__version import __version__
+from weconnect.addressable import AddressableLeaf, AddressableObject, AddressableDict, fromDictConverter, valueCoercion, nextVersion, \
+    NO_OBSERVERS, _FROM_DICT_CONVERTERS, _VALUE_COERCIONS
+from weconnect.read_write_lock import ReadWriteLock
+
+if TYPE_CHECKING:
+    from weconnect.weconnect import WeConnect
+
+MAGIC: bytes = b'WCSTATE'
+FORMAT_VERSION: int = 1
+
+# Values that are always pickled as they are, checked first as persistent_id is called for every object
+_PLAIN_TYPES: frozenset = frozenset({str, int, float, bool, type(None), bytes, tuple, list, dict, datetime})
+
+
+class StateError(Exception):
+    pass
+
+
+def saveState(weConnect: WeConnect, path: str) -> None:
+    """Writes the vehicles and charging stations of weConnect to path"""
+    with weConnect.lock.read():
+        vehicles: Dict[str, Any] = dict(dict.items(weConnect.vehicles))
+        stations: Dict[str, Any] = dict(dict.items(weConnect.chargingStations))
+        buffer: io.BytesIO = io.BytesIO()
+        locks: List[ReadWriteLock] = [vehicle.lock for vehicle in vehicles.values()]
+        for lock in locks:
+            lock.acquireRead()
+        try:
+            _StatePickler(buffer, weConnect).dump((vehicles, stations))
+        finally:
+            for lock in locks:
+                lock.releaseRead()
+    versionBytes: bytes = __version__.encode('utf-8')
+    with open(path, 'wb') as file:
+        file.write(MAGIC + struct.pack('<HH', FORMAT_VERSION, len(versionBytes)) + versionBytes)
+        file.write(zlib.compress(buffer.getvalue(), 1))
+
+
+def loadState(weConnect: WeConnect, path: str) -> None:
+    """Replaces the vehicles and charging stations of weConnect with the ones stored in path. Raises StateError if the file was not written
+    by saveState() of this version of the library."""
+    with open(path, 'rb') as file:
+        content: bytes = file.read()
+    headerSize: int = len(MAGIC) + struct.calcsize('<HH')
+    if len(content) < headerSize or not content.startswith(MAGIC):
+        raise StateError(f'{path} is not a state file')
+    formatVersion, versionLength = struct.unpack_from('<HH', content, len(MAGIC))
+    version: str = content[headerSize:headerSize + versionLength].decode('utf-8', errors='replace')
+    if formatVersion != FORMAT_VERSION or version != __version__:
+        raise StateError(f'{path} was written by version {version} (format {formatVersion}), this is version {__version__} (format {FORMAT_VERSION})')
+    try:
+        vehicles, stations = _StateUnpickler(io.BytesIO(zlib.decompress(content[headerSize + versionLength:])), weConnect).load()
+    except (zlib.error, pickle.UnpicklingError, EOFError, AttributeError, ImportError) as error:
+        raise StateError(f'{path} could not be loaded: {error}') from error
+
+    with weConnect.lock.write():
+        _replace(weConnect.vehicles, vehicles)
+        _replace(weConnect.chargingStations, stations)
+
+
+def _replace(collection: AddressableDict, elements: Dict[str, AddressableObject]) -> None:
+    for key in [key for key in collection if key not in elements]:
+        del collection[key]
+    # The loaded elements carry versions of the process that saved them, they get one new version so exports and the change journal see
+    # them as changed
+    version: int = nextVersion()
+    for key, element in elements.items():
+        _setVersion(element, version)
+        if key in collection:
+            del collection[key]
+        collection[key] = element
+        element.updateVersion(AddressableLeaf.ObserverEvent.ENABLED)
+        element.notify(AddressableLeaf.ObserverEvent.ENABLED)
+
+
+def _setVersion(element: AddressableLeaf, version: int) -> None:
+    element.version = version
+    if isinstance(element, AddressableObject):
+        for child in element.children:
+            _setVersion(child, version)
+
+
+class _StatePickler(pickle.Pickler):
+    """Replaces everything that cannot or must not be stored by references that _StateUnpickler resolves"""
+
+    def __init__(self, file: io.BytesIO, weConnect: WeConnect) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.weConnect: WeConnect = weConnect
+        self.vehicles: AddressableDict = weConnect.vehicles
+        self.chargingStations: AddressableDict = weConnect.chargingStations
+        # Converters and coercions are closures created once per value type
+        self.converterTypes: Dict[int, Any] = {id(converter): valueType for valueType, converter in _FROM_DICT_CONVERTERS.items()}
+        self.coercionTypes: Dict[int, Any] = {id(coercion): valueType for valueType, coercion in _VALUE_COERCIONS.items()}
+
+    def persistent_id(self, obj: Any) -> Optional[Tuple[Any, ...]]:  # noqa: C901 # pylint: disable=too-many-return-statements
+        objType: type = type(obj)
+        if objType in _PLAIN_TYPES:
+            return None
+        if obj is self.weConnect:
+            return ('weConnect',)
+        if obj is self.vehicles:
+            return ('vehicles',)
+        if obj is self.chargingStations:
+            return ('chargingStations',)
+        if isinstance(obj, (Enum, AddressableLeaf)):
+            return None
+        if objType is types.FunctionType:
+            if id(obj) in self.converterTypes:
+                return ('converter', self.converterTypes[id(obj)])
+            if id(obj) in self.coercionTypes:
+                return ('coercion', self.coercionTypes[id(obj)])
+            return None
+        if objType is types.MethodType and isinstance(obj.__self__, AddressableLeaf):
+            # Private methods are stored with their mangled name, pickle would look them up by their plain name
+            name: str = obj.__func__.__name__
+            if name.startswith('__') and not name.endswith('__'):
+                name = f'_{obj.__func__.__qualname__.split(".")[-2].lstrip("_")}{name}'
+            return ('method', obj.__self__, name)
+        if obj is NO_OBSERVERS:
+            # Shared by all elements without observers, addObserver() relies on its identity
+            return ('noObservers',)
+        if objType is set and obj and all(isinstance(entry, tuple) and len(entry) == 4 and callable(entry[0]) for entry in obj):
+            # Observers: the ones the elements register on each other are stored, the ones of the application are not
+            return ('observers', [entry for entry in obj if isinstance(entry[0], types.MethodType) and isinstance(entry[0].__self__, AddressableLeaf)])
+        if isinstance(obj, ReadWriteLock):
+            return ('lock',)
+        if isinstance(obj, threading.Event):
+            return ('event', obj.is_set())
+        if isinstance(obj, threading.Thread):
+            # Timers of request trackers, they are started again with the next tracked request
+            return ('none',)
+        return None
+
+
+class _StateUnpickler(pickle.Unpickler):
+    def __init__(self, file: io.BytesIO, weConnect: WeConnect) -> None:
+        super().__init__(file)
+        self.weConnect: WeConnect = weConnect
+
+    def persistent_load(self, pid: Tuple[Any, ...]) -> Any:  # noqa: C901 # pylint: disable=too-many-return-statements
+        kind: str = pid[0]
+        if kind == 'weConnect':
+            return self.weConnect
+        if kind == 'vehicles':
+            return self.weConnect.vehicles
+        if kind == 'chargingStations':
+            return self.weConnect.chargingStations
+        if kind == 'lock':
+            return ReadWriteLock()
+        if kind == 'event':
+            event: threading.Event = threading.Event()
+            if pid[1]:
+                event.set()
+            return event
+        if kind == 'none':
+            return None
+        if kind == 'converter':
+            return fromDictConverter(pid[1])
+        if kind == 'coercion':
+            return valueCoercion(pid[1])
+        if kind == 'method':
+            return getattr(pid[1], pid[2])
+        if kind == 'noObservers':
+            return NO_OBSERVERS
+        if kind == 'observers':
+            return set(pid[1])
+        raise pickle.UnpicklingError(f'Unknown reference {kind}')
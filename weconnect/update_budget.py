@@ -0,0 +1,100 @@
+from __future__ import annotations
+from typing import Callable, Iterator, List, Optional, Tuple
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from enum import IntEnum
+
+from weconnect.errors import DeadlineExceededError, RetrievalError
+
+LOG: logging.Logger = logging.getLogger("weconnect")
+
+
+class UpdateBudget:
+    """Time budget of one update with a deadline.
+
+    Requests get the remaining time as timeout, divided by the number of attempts if failed requests are retried. Parts of the update that
+    are less important than the statuses of the vehicles are deferred and run after all statuses were fetched, ordered by their priority.
+    Everything that does not fit into the budget is skipped and listed in skipped.
+    """
+
+    class Priority(IntEnum):
+        """Order in which deferred parts of an update are run"""
+        PARKING_POSITION = 1
+        TRIPS = 2
+        PICTURES = 3
+        CHARGING_STATIONS = 4
+
+    # Requests are not started anymore with less time left
+    MIN_REQUEST_TIME: float = 0.5
+
+    def __init__(self, deadline: float) -> None:
+        # Deadline as time.monotonic() value
+        self.deadline: float = deadline
+        self.skipped: List[str] = []
+        self.__deferred: List[Tuple[UpdateBudget.Priority, int, str, Callable[[], None]]] = []
+
+    def remaining(self) -> float:
+        return self.deadline - time.monotonic()
+
+    def requestTimeout(self, timeout: Optional[float] = None, attempts: int = 1) -> float:
+        """Timeout for each attempt of the next request, at most timeout. All attempts together fit into the remaining time.
+        Raises DeadlineExceededError if there is not enough time left for a request."""
+        remaining: float = self.remaining()
+        if remaining < UpdateBudget.MIN_REQUEST_TIME:
+            raise DeadlineExceededError(f'Deadline of the update reached, {remaining:.1f}s left')
+        remaining = remaining / max(attempts, 1)
+        if timeout is not None and timeout < remaining:
+            return timeout
+        return remaining
+
+    def skip(self, name: str) -> None:
+        LOG.debug('Skipping %s, the deadline of the update is reached', name)
+        self.skipped.append(name)
+
+    def defer(self, priority: UpdateBudget.Priority, name: str, function: Callable[[], None]) -> None:
+        self.__deferred.append((priority, len(self.__deferred), name, function))
+
+    def runDeferred(self) -> None:
+        """Runs the deferred parts in the order of their priority. A RetrievalError does not stop the other parts, it is raised at the end."""
+        deferred = sorted(self.__deferred, key=lambda entry: entry[:2])
+        self.__deferred.clear()
+        catchedRetrievalError: Optional[RetrievalError] = None
+        for _, _, name, function in deferred:
+            if self.remaining() < UpdateBudget.MIN_REQUEST_TIME:
+                self.skip(name)
+                continue
+            try:
+                function()
+            except DeadlineExceededError:
+                self.skip(name)
+            except RetrievalError as retrievalError:
+                catchedRetrievalError = retrievalError
+                LOG.error('Failed to retrieve %s: %s', name, retrievalError)
+        if catchedRetrievalError is not None:
+            raise catchedRetrievalError
+
+
+class _CurrentBudget(threading.local):
+    budget: Optional[UpdateBudget] = None
+
+
+_currentBudget: _CurrentBudget = _CurrentBudget()
+
+
+@contextmanager
+def budgeted(budget: Optional[UpdateBudget]) -> Iterator[Optional[UpdateBudget]]:
+    """Makes budget the budget of all requests of this thread within the context, including logins and token refreshes"""
+    previous: Optional[UpdateBudget] = _currentBudget.budget
+    _currentBudget.budget = budget
+    try:
+        yield budget
+    finally:
+        _currentBudget.budget = previous
+
+
+def currentBudget() -> Optional[UpdateBudget]:
+    """Budget of the update with a deadline running in this thread or None"""
+    return _currentBudget.budget
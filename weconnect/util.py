@@ -3,7 +3,11 @@ from enum import Enum
 from typing import Any
 
 import re
-from datetime import datetime
+import sys
+import importlib
+import importlib.util
+from datetime import datetime, timezone
+from functools import lru_cache
 
 import json
 
@@ -11,22 +15,45 @@ import logging
 
 import shutil
 
-SUPPORT_IMAGES = False
-try:
-    from PIL import Image  # type: ignore
-    SUPPORT_IMAGES = True
-except ImportError:
-    pass
+# The image libraries are optional and slow to import, they are only looked up here and imported when the first image is handled
+SUPPORT_IMAGES: bool = importlib.util.find_spec('PIL') is not None
+SUPPORT_ASCII_IMAGES: bool = SUPPORT_IMAGES and importlib.util.find_spec('ascii_magic') is not None
 
-SUPPORT_ASCII_IMAGES = False
-try:
-    import ascii_magic  # type: ignore
-    SUPPORT_ASCII_IMAGES = True
-except ImportError:
-    pass
 
+class LazyModule:
+    """Stands in for a module that is imported on the first access to one of its attributes"""
+    __slots__ = ('__name', '__module')
 
+    def __init__(self, name: str) -> None:
+        self.__name: str = name
+        self.__module: Any = None
+
+    def __getattr__(self, name: str) -> Any:
+        if self.__module is None:
+            self.__module = importlib.import_module(self.__name)
+        return getattr(self.__module, name)
+
+    def __repr__(self) -> str:
+        return f'LazyModule({self.__name!r})'
+
+
+Image: Any = LazyModule('PIL.Image')
+
+
+def isImage(value: Any) -> bool:
+    """True if value is a PIL image. Does not import PIL, if it was not imported yet there cannot be any image."""
+    module = sys.modules.get('PIL.Image')
+    return module is not None and isinstance(value, module.Image)
+
+
+@lru_cache(maxsize=1024)
 def robustTimeParse(timeString: str) -> datetime:
+    # Most timestamps of the API have the form 2024-11-03T10:20:44Z and repeat between updates, parsed results are memoized
+    if len(timeString) == 20 and timeString[19] == 'Z':
+        try:
+            return datetime.fromisoformat(timeString[:19]).replace(tzinfo=timezone.utc)
+        except ValueError:
+            pass
     timeString = timeString.replace('Z', '+00:00')
     match = re.search(
         r'^(?P<start>\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.)(?P<fractions>\d+)(?P<end>\+\d{2}:\d{2})$', timeString)
@@ -50,6 +77,12 @@ if SUPPORT_ASCII_IMAGES:
         HTML = 'HTML'
 
     def imgToASCIIArt(img: Image, columns: int = 0, mode=ASCIIModes.TERMINAL) -> str:
+        # Only looked up when this module was imported, the import can still fail, e.g. for a missing dependency of ascii_magic
+        try:
+            import ascii_magic  # type: ignore # pylint: disable=import-outside-toplevel
+        except ImportError:
+            return ''
+
         bbox = img.getbbox()
 
         # Crop the image to the contents of the bounding box
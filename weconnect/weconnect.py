@@ -1,12 +1,14 @@
 from __future__ import annotations
-from typing import Dict, List, Set, Tuple, Callable, Any, Optional, Union
+from typing import TYPE_CHECKING, Dict, Iterator, List, Set, Tuple, Callable, Any, Optional, Union
 
 import os
-from threading import Lock
 import string
 import locale
 import logging
 import json
+import threading
+from concurrent.futures import Future
+from functools import partial
 from datetime import datetime, timedelta
 
 import requests
@@ -14,12 +16,21 @@ import requests
 from weconnect.auth.session_manager import SessionManager, Service, SessionUser
 from weconnect.elements.vehicle import Vehicle
 from weconnect.domain import Domain
-from weconnect.elements.charging_station import ChargingStation
 from weconnect.elements.general_controls import GeneralControls
-from weconnect.addressable import AddressableLeaf, AddressableObject, AddressableDict
-from weconnect.errors import RetrievalError, TooManyRequestsError
+from weconnect.addressable import AddressableLeaf, AddressableObject, AddressableDict, updateCycle, updateCycleTimestamp
+from weconnect.change_journal import ChangeJournal
+from weconnect.schema_drift import SchemaDriftRegistry, schemaDrift
+from weconnect.snapshot import ObjectSnapshot, takeSnapshot
+from weconnect.read_write_lock import ReadWriteLock
+from weconnect.errors import DeadlineExceededError, RetrievalError, TooManyRequestsError
+from weconnect.cancellation import CancellationToken, cancellable, onCancel, raiseIfCancelled
+from weconnect.update_budget import UpdateBudget, budgeted, currentBudget
 from weconnect.weconnect_errors import ErrorEventType
-from weconnect.util import ExtendedEncoder
+from weconnect import json_codec
+from weconnect import state
+
+if TYPE_CHECKING:
+    from weconnect.elements.charging_station import ChargingStation
 
 LOG = logging.getLogger("weconnect")
 
@@ -46,6 +57,8 @@ class WeConnect(AddressableObject):  # pylint: disable=too-many-instance-attribu
         selective: Optional[list[Domain]] = None,
         forceReloginAfter: Optional[int] = None,
         acceptTermsOnLogin: Optional[bool] = False,
+        lazyDomains: bool = False,
+        backgroundLoad: bool = False,
     ) -> None:
         """Initialize WeConnect interface. If loginOnInit is true the user will be tried to login.
            If loginOnInit is true also an initial fetch of data is performed.
@@ -68,9 +81,14 @@ class WeConnect(AddressableObject):  # pylint: disable=too-many-instance-attribu
             timeout (bool, optional, optional): Timeout in seconds used for http connections to the VW servers
             selective (list[Domain], optional): Domains to request data for
             forceReloginAfter (int, optional): Force a full relogin after number of seconds. This might be necessary to get fresh data
+            lazyDomains (bool, optional): Create the status objects of the vehicles only when they are accessed. Defaults to False.
+            backgroundLoad (bool, optional): Return right away and login and update in a background thread. The ready future is done when
+            this is finished, vehicles are added as soon as they are known and report loaded once their statuses are fetched.
+            Defaults to False.
         """
         super().__init__(localAddress='', parent=None)
-        self.lock = Lock()
+        # Held for writing only while vehicles and charging stations are added or removed, never during requests
+        self.lock: ReadWriteLock = ReadWriteLock()
         self.username: str = username
         self.password: str = password
         self.spin: Union[str, bool] = spin
@@ -82,6 +100,7 @@ class WeConnect(AddressableObject):  # pylint: disable=too-many-instance-attribu
         self.__controls: GeneralControls = GeneralControls(localAddress='controls', parent=self)
         self.__cache: Dict[str, Any] = {}
         self.fixAPI: bool = fixAPI
+        self.lazyDomains: bool = lazyDomains
         self.proxy: Optional[str] = proxy
 
         if proxy:
@@ -99,6 +118,16 @@ class WeConnect(AddressableObject):  # pylint: disable=too-many-instance-attribu
         self.__elapsed: List[timedelta] = []
 
         self.__enableTracker: bool = False
+        self.__snapshot: Optional[ObjectSnapshot] = None
+        self.__lastUpdateSkipped: List[str] = []
+        # Done when the login and the first update of the constructor finished
+        self.ready: Future = Future()
+        self.__initialLoadToken: Optional[CancellationToken] = None
+        self.__initialLoadThread: Optional[threading.Thread] = None
+        # Set while restore() builds the tree from the cache in the thread
+        self.__offline: threading.local = threading.local()
+        # Set while the initial load in the background runs in the thread, vehicles are added to the tree before their statuses are fetched
+        self.__addVehiclesBeforeStatus: threading.local = threading.local()
 
         self.__errorObservers: Set[Tuple[Callable[[Optional[Any], ErrorEventType], None], ErrorEventType]] = set()
 
@@ -112,18 +141,53 @@ class WeConnect(AddressableObject):  # pylint: disable=too-many-instance-attribu
         self.__session.forceReloginAfter = forceReloginAfter
         self.__session.acceptTermsOnLogin = acceptTermsOnLogin
 
+        if backgroundLoad:
+            self.__initialLoadToken = CancellationToken()
+            self.__initialLoadThread = threading.Thread(target=self.__initialLoad, name='WeConnectInitialLoad', daemon=True,
+                                                        kwargs={'loginOnInit': loginOnInit, 'updateAfterLogin': updateAfterLogin,
+                                                                'updateCapabilities': updateCapabilities, 'updatePictures': updatePictures,
+                                                                'selective': selective})
+            self.__initialLoadThread.start()
+            return
+
         if loginOnInit:
             self.__session.login()
 
         if updateAfterLogin:
             self.update(updateCapabilities=updateCapabilities, updatePictures=updatePictures, selective=selective)
+        self.ready.set_result(None)
+
+    def __initialLoad(self, loginOnInit: bool, updateAfterLogin: bool, updateCapabilities: bool, updatePictures: bool,
+                      selective: Optional[list[Domain]]) -> None:
+        try:
+            if loginOnInit:
+                self.__session.login()
+            if updateAfterLogin:
+                self.__addVehiclesBeforeStatus.active = True
+                try:
+                    self.update(updateCapabilities=updateCapabilities, updatePictures=updatePictures, selective=selective,
+                                cancellationToken=self.__initialLoadToken)
+                finally:
+                    self.__addVehiclesBeforeStatus.active = False
+        except Exception as error:  # pylint: disable=broad-except
+            LOG.error('Initial load in the background failed: %s', error)
+            self.ready.set_exception(error)
+        else:
+            self.ready.set_result(None)
+
+    def waitUntilReady(self, timeout: Optional[float] = None) -> None:
+        """Waits for the login and the first update of the constructor. Raises the error of the initial load if it failed and
+        concurrent.futures.TimeoutError if it did not finish within timeout seconds."""
+        self.ready.result(timeout=timeout)
 
     def __del__(self) -> None:
         self.disconnect()
         return super().__del__()
 
     def disconnect(self) -> None:
-        pass
+        # Stop an initial load that is still running in the background
+        if self.__initialLoadToken is not None and not self.ready.done():
+            self.__initialLoadToken.cancel('Disconnected')
 
     @property
     def session(self) -> requests.Session:
@@ -139,7 +203,7 @@ class WeConnect(AddressableObject):  # pylint: disable=too-many-instance-attribu
 
     def persistCacheAsJson(self, filename: str) -> None:
         with open(filename, 'w', encoding='utf8') as file:
-            json.dump(self.__cache, file, cls=ExtendedEncoder)
+            file.write(json_codec.dumps(self.__cache))
         LOG.info('Writing cachefile %s', filename)
 
     def fillCacheFromJson(self, filename: str, maxAge: int, maxAgePictures: Optional[int] = None) -> None:
@@ -150,8 +214,8 @@ class WeConnect(AddressableObject):  # pylint: disable=too-many-instance-attribu
             self.maxAgePictures = maxAgePictures
 
         try:
-            with open(filename, 'r', encoding='utf8') as file:
-                self.__cache = json.load(file)
+            with open(filename, 'rb') as file:
+                self.__cache = json_codec.loads(file.read())
         except json.decoder.JSONDecodeError:
             LOG.error('Cachefile %s seems corrupted will delete it and try to create a new one. '
                       'If this problem persists please check if a problem with your disk exists.', filename)
@@ -165,7 +229,7 @@ class WeConnect(AddressableObject):  # pylint: disable=too-many-instance-attribu
         else:
             self.maxAgePictures = maxAgePictures
 
-        self.__cache = json.loads(jsonString)
+        self.__cache = json_codec.loads(jsonString)
         LOG.info('Reading cache from string')
 
     def clearCache(self) -> None:
@@ -182,6 +246,23 @@ class WeConnect(AddressableObject):  # pylint: disable=too-many-instance-attribu
         for vehicle in self.vehicles:
             vehicle.disableTracker()
 
+    def enableChangeJournal(self, maxEntries: int = 10000) -> ChangeJournal:
+        """Start recording all changes in a journal keeping the last maxEntries changes. Consumers get a cursor from the journal
+        and read batches of changes with it. If the journal is already enabled with the same size it is kept as is.
+
+        Args:
+            maxEntries (int, optional): Number of changes kept before the oldest ones are dropped. Defaults to 10000.
+
+        Returns:
+            ChangeJournal: The journal
+        """
+        if self.changeJournal is None or self.changeJournal.maxEntries != maxEntries:
+            self.changeJournal = ChangeJournal(maxEntries=maxEntries, startSequence=self.version)
+        return self.changeJournal
+
+    def disableChangeJournal(self) -> None:
+        self.changeJournal = None
+
     def login(self) -> None:
         self.__session.login()
 
@@ -189,49 +270,180 @@ class WeConnect(AddressableObject):  # pylint: disable=too-many-instance-attribu
     def vehicles(self) -> AddressableDict[str, Vehicle]:
         return self.__vehicles
 
+    @property
+    def chargingStations(self) -> AddressableDict[str, ChargingStation]:
+        return self.__stations
+
+    def saveState(self, path: str) -> None:
+        """Writes vehicles and charging stations with all values, timestamps, request trackers and pictures to path, see weconnect.state"""
+        state.saveState(self, path)
+
+    def loadState(self, path: str) -> None:
+        """Replaces vehicles and charging stations with the ones saved to path by saveState(), without any request. Raises
+        weconnect.state.StateError if the file cannot be loaded, e.g. when it was written by another version."""
+        state.loadState(self, path)
+        self.__snapshot = takeSnapshot(self, self.__snapshot)
+
+    @property
+    def schemaDrift(self) -> SchemaDriftRegistry:
+        """Keys in the responses of the API that are not known to the element classes"""
+        return schemaDrift
+
     def update(self, updateCapabilities: bool = True, updatePictures: bool = True, force: bool = False,
-               selective: Optional[list[Domain]] = None) -> None:
+               selective: Optional[list[Domain]] = None, deadline: Optional[float] = None,
+               cancellationToken: Optional[CancellationToken] = None) -> None:
+        """Update vehicles and charging stations.
+
+        With a deadline (a time.monotonic() value) every request gets the remaining time as timeout. The statuses of all vehicles are fetched
+        first, then parking positions, trips, pictures and charging stations. What does not fit into the time is skipped and listed in
+        lastUpdateSkipped.
+
+        When cancellationToken is cancelled running requests are aborted, no further request is made and UpdateCancelledError is raised.
+        Everything applied before stays in the tree, a response received after the cancellation is dropped.
+        """
         self.__elapsed.clear()
+        budget: Optional[UpdateBudget] = UpdateBudget(deadline) if deadline is not None else None
+        # All timestamps written during the update are the time the update started. Closing the adapters of the session on cancellation aborts
+        # the requests that are running.
+        with updateCycle(), cancellable(cancellationToken) as token, onCancel(token, self.__session.close), budgeted(budget):
+            try:
+                if budget is None:
+                    self.updateVehicles(updateCapabilities=updateCapabilities, updatePictures=updatePictures, force=force, selective=selective)
+                    self.updateChargingStations(force=force)
+                else:
+                    vehiclesRetrievalError: Optional[RetrievalError] = None
+                    try:
+                        self.updateVehicles(updateCapabilities=updateCapabilities, updatePictures=updatePictures, force=force, selective=selective)
+                    except DeadlineExceededError:
+                        budget.skip('vehicles')
+                    except RetrievalError as retrievalError:
+                        # The deferred parts of the vehicles that were retrieved are still run
+                        vehiclesRetrievalError = retrievalError
+                    budget.defer(UpdateBudget.Priority.CHARGING_STATIONS, 'chargingStations', partial(self.updateChargingStations, force=force))
+                    budget.runDeferred()
+                    if vehiclesRetrievalError is not None:
+                        raise vehiclesRetrievalError
+            finally:
+                if budget is not None:
+                    self.__lastUpdateSkipped = budget.skipped
+                    if budget.skipped:
+                        LOG.warning('Deadline of the update reached, skipped %s', ', '.join(budget.skipped))
+                self.updateComplete()
+                self.__session.cookies.clear()  # Clear cookies to have a fresh session afterwards
+            # Published with one assignment, readers either get the previous or the new snapshot. A failed or cancelled update leaves a
+            # partly updated tree, readers keep the snapshot of the last completed update then.
+            self.__snapshot = takeSnapshot(self, self.__snapshot, timestamp=updateCycleTimestamp())
+
+    def restore(self, updateCapabilities: bool = True, updatePictures: bool = True, selective: Optional[list[Domain]] = None) -> bool:
+        """Builds vehicles, their statuses, parking positions, trips, pictures and charging stations from the cache (e.g. filled with
+        fillCacheFromJson()) without any request and without login. Entries are used regardless of their age. Returns False if the cache
+        does not contain the list of vehicles.
+
+        Statuses are looked up with the url an update with the same selective would request, if there is none the newest cached response of
+        the same endpoint is used.
+        """
+        if self.__findCached('https://emea.bff.cariad.digital/vehicle/v1/vehicles') is None:
+            return False
+        self.__offline.active = True
         try:
-            self.updateVehicles(updateCapabilities=updateCapabilities, updatePictures=updatePictures, force=force, selective=selective)
-            self.updateChargingStations(force=force)
+            with updateCycle():
+                self.updateVehicles(updateCapabilities=updateCapabilities, updatePictures=updatePictures, selective=selective)
+                if self.latitude is not None and self.longitude is not None:
+                    self.updateChargingStations()
+                else:
+                    # The search parameters are not set yet, the last search is restored
+                    data: Optional[Dict[str, Any]] = self.__findCached('https://emea.bff.cariad.digital/poi/charging-stations/v2')
+                    if data is not None:
+                        self.__applyChargingStations(data)
+                self.__snapshot = takeSnapshot(self, self.__snapshot, timestamp=updateCycleTimestamp())
         finally:
-            self.updateComplete()
-            self.__session.cookies.clear()  # Clear cookies to have a fresh session afterwards
+            self.__offline.active = False
+        return True
+
+    @property
+    def offline(self) -> bool:
+        """True while restore() runs in the calling thread, requests are answered from the cache only"""
+        return getattr(self.__offline, 'active', False)
+
+    def __findCached(self, url: str) -> Optional[Dict[str, Any]]:
+        """Cached response of url, or the newest cached response of the same endpoint with other parameters"""
+        if url in self.__cache:
+            return self.__cache[url][0]
+        path: str = url.split('?', 1)[0]
+        newest: Optional[Tuple[str, Dict[str, Any]]] = None
+        for cachedUrl, (data, cacheDateString) in self.__cache.items():
+            if cachedUrl.split('?', 1)[0] == path and isinstance(data, dict) and (newest is None or cacheDateString > newest[0]):
+                newest = (cacheDateString, data)
+        return newest[1] if newest is not None else None
+
+    @property
+    def budget(self) -> Optional[UpdateBudget]:
+        """Budget of the update with a deadline running in the calling thread"""
+        return currentBudget()
+
+    @property
+    def lastUpdateSkipped(self) -> List[str]:
+        """Parts of the last update with a deadline that were skipped because the deadline was reached"""
+        return list(self.__lastUpdateSkipped)
+
+    def requestTimeout(self) -> Optional[float]:
+        """Timeout for the next request. Raises DeadlineExceededError if the deadline of the running update does not leave enough time and
+        UpdateCancelledError if the running update was cancelled."""
+        raiseIfCancelled()
+        return self.__session.requestTimeout()
+
+    def snapshot(self) -> Optional[ObjectSnapshot]:
+        """Read-only view of the whole tree as of the last completed update(), None before the first update.
+        Taking it never blocks and it is not changed by later updates, it can be read while the next update is running."""
+        return self.__snapshot
 
     def updateVehicles(self, updateCapabilities: bool = True, updatePictures: bool = True, force: bool = False,  # noqa: C901
                        selective: Optional[list[Domain]] = None) -> None:
-        with self.lock:
-            catchedRetrievalError = None
-            url = 'https://emea.bff.cariad.digital/vehicle/v1/vehicles'
-            data = self.fetchData(url, force)
-            if data is not None:
-                if 'data' in data and data['data']:
-                    vins: List[str] = []
-                    for vehicleDict in data['data']:
-                        if 'vin' not in vehicleDict:
-                            break
-                        vin: str = vehicleDict['vin']
-                        vins.append(vin)
-                        try:
-                            if vin not in self.__vehicles:
-                                vehicle = Vehicle(weConnect=self, vin=vin, parent=self.__vehicles, fromDict=vehicleDict, fixAPI=self.fixAPI,
-                                                  updateCapabilities=updateCapabilities, updatePictures=updatePictures, selective=selective,
-                                                  enableTracker=self.__enableTracker)
-                                self.__vehicles[vin] = vehicle
-                            else:
-                                self.__vehicles[vin].update(fromDict=vehicleDict, updateCapabilities=updateCapabilities, updatePictures=updatePictures,
-                                                            selective=selective)
-                        except RetrievalError as retrievalError:
-                            catchedRetrievalError = retrievalError
-                            LOG.error('Failed to retrieve data for VIN %s: %s', vin, retrievalError)
-                    # delete those vins that are not anymore available
+        catchedRetrievalError = None
+        url = 'https://emea.bff.cariad.digital/vehicle/v1/vehicles'
+        data = self.fetchData(url, force)
+        if data is not None:
+            if 'data' in data and data['data']:
+                vins: Set[str] = set()
+                for vehicleDict in data['data']:
+                    if 'vin' not in vehicleDict:
+                        break
+                    vin: str = vehicleDict['vin']
+                    vins.add(vin)
+                    try:
+                        self.__updateVehicle(vin, vehicleDict, updateCapabilities=updateCapabilities, updatePictures=updatePictures,
+                                             selective=selective)
+                    except DeadlineExceededError:
+                        self.budget.skip(f'vehicles/{vin}')
+                    except RetrievalError as retrievalError:
+                        catchedRetrievalError = retrievalError
+                        LOG.error('Failed to retrieve data for VIN %s: %s', vin, retrievalError)
+                # delete those vins that are not anymore available
+                with self.lock.write():
                     for vin in [vin for vin in self.__vehicles if vin not in vins]:
                         del self.__vehicles[vin]
 
+                if not self.offline:
                     self.__cache[url] = (data, str(datetime.utcnow()))
-            if catchedRetrievalError:
-                raise catchedRetrievalError
+        if catchedRetrievalError:
+            raise catchedRetrievalError
+
+    def __updateVehicle(self, vin: str, vehicleDict: Dict[str, Any], updateCapabilities: bool, updatePictures: bool,
+                        selective: Optional[list[Domain]]) -> None:
+        if vin not in self.__vehicles:
+            # The vehicle fetches its status while it is created, it is only added to the tree afterwards. During the initial load
+            # in the background it is added first, so that it is visible right away.
+            vehicle = Vehicle(weConnect=self, vin=vin, parent=self.__vehicles, fromDict=vehicleDict, fixAPI=self.fixAPI,
+                              updateCapabilities=updateCapabilities, updatePictures=updatePictures, selective=selective,
+                              enableTracker=self.__enableTracker, lazyDomains=self.lazyDomains,
+                              fetchStatus=not getattr(self.__addVehiclesBeforeStatus, 'active', False))
+            with self.lock.write():
+                self.__vehicles[vin] = vehicle
+            if not vehicle.loaded:
+                vehicle.update(updateCapabilities=updateCapabilities, updatePictures=updatePictures, selective=selective)
+        else:
+            self.__vehicles[vin].update(fromDict=vehicleDict, updateCapabilities=updateCapabilities, updatePictures=updatePictures,
+                                        selective=selective)
 
     def setChargingStationSearchParameters(self, latitude: float, longitude: float, searchRadius: Optional[int] = None, market: Optional[str] = None,
                                            useLocale: Optional[str] = locale.getlocale()[0]) -> None:
@@ -243,6 +455,7 @@ class WeConnect(AddressableObject):  # pylint: disable=too-many-instance-attribu
 
     def getChargingStations(self, latitude, longitude, searchRadius=None, market=None, useLocale=None,  # noqa: C901
                             force=False) -> AddressableDict[str, ChargingStation]:
+        from weconnect.elements.charging_station import ChargingStation  # pylint: disable=import-outside-toplevel
         chargingStationMap: AddressableDict[str, ChargingStation] = AddressableDict(localAddress='', parent=None)
         url: str = f'https://emea.bff.cariad.digital/poi/charging-stations/v2?latitude={latitude}&longitude={longitude}'
         if market is not None:
@@ -280,31 +493,31 @@ class WeConnect(AddressableObject):  # pylint: disable=too-many-instance-attribu
                 url += f'&userId={self.session.userId}'
             data = self.fetchData(url, force)
             if data is not None:
-                if 'chargingStations' in data and data['chargingStations']:
-                    ids: List[str] = []
-                    for stationDict in data['chargingStations']:
-                        if 'id' not in stationDict:
-                            break
-                        stationId: str = stationDict['id']
-                        ids.append(stationId)
-                        if stationId not in self.__stations:
-                            station: ChargingStation = ChargingStation(weConnect=self, stationId=stationId, parent=self.__stations, fromDict=stationDict,
-                                                                       fixAPI=self.fixAPI)
-                            self.__stations[stationId] = station
-                        else:
-                            self.__stations[stationId].update(fromDict=stationDict)
-                    # delete those vins that are not anymore available
-                    for stationId in [stationId for stationId in ids if stationId not in self.__stations]:
-                        del self.__stations[stationId]
-
+                if self.__applyChargingStations(data) and not self.offline:
                     self.__cache[url] = (data, str(datetime.utcnow()))
 
+    def __applyChargingStations(self, data: Dict[str, Any]) -> bool:
+        if 'chargingStations' in data and data['chargingStations']:
+            # Only needed when charging stations are searched
+            from weconnect.elements.charging_station import ChargingStation  # pylint: disable=import-outside-toplevel
+            with self.lock.write():
+                self.__stations.reconcile(data['chargingStations'], key=lambda station: station.get('id'),
+                                          create=lambda stationId, station: ChargingStation(weConnect=self, stationId=stationId,
+                                                                                            parent=self.__stations, fromDict=station,
+                                                                                            fixAPI=self.fixAPI))
+            return True
+        return False
+
     def getLeafChildren(self) -> List[AddressableLeaf]:
-        leafChildren = [children for vehicle in self.__vehicles.values() for children in vehicle.getLeafChildren()] \
-            + [children for station in self.__stations.values() for children in station.getLeafChildren()]
+        return list(self.iterLeafChildren())
+
+    def iterLeafChildren(self) -> Iterator[AddressableLeaf]:
+        for vehicle in list(self.__vehicles.values()):
+            yield from vehicle.iterLeafChildren()
+        for station in list(self.__stations.values()):
+            yield from station.iterLeafChildren()
         if self.__controls.spinControl is not None and self.__controls.spinControl.enabled:
-            leafChildren += [self.__controls.spinControl]
-        return leafChildren
+            yield self.__controls.spinControl
 
     def __str__(self) -> str:
         returnString: str = ''
@@ -363,7 +576,15 @@ class WeConnect(AddressableObject):  # pylint: disable=too-many-instance-attribu
             return None
         return sum(self.__elapsed, timedelta())
 
+    def __raiseIfDeadlineReached(self, url: str, error: Exception) -> None:
+        """Raises DeadlineExceededError if error is a request that was cut off by the deadline of the running update"""
+        budget: Optional[UpdateBudget] = self.budget
+        if budget is not None and budget.remaining() < UpdateBudget.MIN_REQUEST_TIME:
+            raise DeadlineExceededError(f'Deadline of the update reached while fetching {url}') from error
+
     def fetchData(self, url, force=False, allowEmpty=False, allowHttpError=False, allowedErrors=None) -> Optional[Dict[str, Any]]:  # noqa: C901
+        if self.offline:
+            return self.__findCached(url)
         data: Optional[Dict[str, Any]] = None
         cacheDate: Optional[datetime] = None
         if not force and (self.maxAge is not None and self.cache is not None and url in self.cache):
@@ -372,10 +593,10 @@ class WeConnect(AddressableObject):  # pylint: disable=too-many-instance-attribu
         if data is None or self.maxAge is None \
                 or (cacheDate is not None and cacheDate < (datetime.utcnow() - timedelta(seconds=self.maxAge))):
             try:
-                statusResponse: requests.Response = self.session.get(url, allow_redirects=False)
+                statusResponse: requests.Response = self.session.get(url, allow_redirects=False, timeout=self.requestTimeout())
                 self.recordElapsed(statusResponse.elapsed)
                 if statusResponse.status_code in (requests.codes['ok'], requests.codes['multiple_status']):
-                    data = statusResponse.json()
+                    data = json_codec.loads(statusResponse.content)
                     if self.cache is not None:
                         self.cache[url] = (data, str(datetime.utcnow()))
                 elif statusResponse.status_code == requests.codes['too_many_requests']:
@@ -386,11 +607,11 @@ class WeConnect(AddressableObject):  # pylint: disable=too-many-instance-attribu
                 elif statusResponse.status_code == requests.codes['unauthorized']:
                     LOG.info('Server asks for new authorization')
                     self.login()
-                    statusResponse = self.session.get(url, allow_redirects=False)
+                    statusResponse = self.session.get(url, allow_redirects=False, timeout=self.requestTimeout())
                     self.recordElapsed(statusResponse.elapsed)
 
                     if statusResponse.status_code in (requests.codes['ok'], requests.codes['multiple_status']):
-                        data = statusResponse.json()
+                        data = json_codec.loads(statusResponse.content)
                         if self.cache is not None:
                             self.cache[url] = (data, str(datetime.utcnow()))
                     elif not allowHttpError or (allowedErrors is not None and statusResponse.status_code not in allowedErrors):
@@ -400,21 +621,29 @@ class WeConnect(AddressableObject):  # pylint: disable=too-many-instance-attribu
                     self.notifyError(self, ErrorEventType.HTTP, str(statusResponse.status_code), 'Could not fetch data due to server error')
                     raise RetrievalError(f'Could not fetch data. Status Code was: {statusResponse.status_code}')
             except requests.exceptions.ConnectionError as connectionError:
+                # The request was aborted by the cancellation of the update
+                raiseIfCancelled()
+                # Read timeouts are retried, once the retries are exhausted they are raised as ConnectionError
+                self.__raiseIfDeadlineReached(url, connectionError)
                 self.notifyError(self, ErrorEventType.CONNECTION, 'connection', 'Could not fetch data due to connection problem')
                 raise RetrievalError from connectionError
             except requests.exceptions.ChunkedEncodingError as chunkedEncodingError:
+                raiseIfCancelled()
                 self.notifyError(self, ErrorEventType.CONNECTION, 'chunked encoding error',
                                  'Could not fetch data due to connection problem with chunked encoding')
                 raise RetrievalError from chunkedEncodingError
             except requests.exceptions.ReadTimeout as timeoutError:
+                self.__raiseIfDeadlineReached(url, timeoutError)
                 self.notifyError(self, ErrorEventType.TIMEOUT, 'timeout', 'Could not fetch data due to timeout')
                 raise RetrievalError from timeoutError
             except requests.exceptions.RetryError as retryError:
                 raise RetrievalError from retryError
-            except requests.exceptions.JSONDecodeError as jsonError:
+            except json.JSONDecodeError as jsonError:
                 if allowEmpty:
                     data = None
                 else:
                     self.notifyError(self, ErrorEventType.JSON, 'json', 'Could not fetch data due to error in returned data')
                     raise RetrievalError from jsonError
+            # A response that arrived after the update was cancelled is not applied
+            raiseIfCancelled()
         return data